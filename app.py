@@ -46,7 +46,7 @@ datalake = DatalakeBuilder(
 #  datalake attribues can be accessed via datalake.<attribute>
 #
 #  examples:
-#   - datalake.bucket_set.get(domains=["example"], layers=["raw"])[0].name.value
+#   - datalake.bucket_set.get_bucket("example", "raw").name.value
 #   - datalake.vpc
 #   - datalake.sns_topic
 # =============================================================================
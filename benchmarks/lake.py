@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from json import dump
+from os import (
+    makedirs,
+    path,
+)
+from shutil import copytree
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from zipfile import ZipFile
+
+from yaml import safe_dump
+
+HANDLER = "def handler(event, context):\n    return event\n"
+DOCKER_PATH = path.join(
+    path.dirname(path.dirname(path.abspath(__file__))), "docker"
+)
+
+
+@dataclass
+class SyntheticLake:
+    domains: int
+    pipelines: int
+    steps: int
+    triggers: int
+
+    def __post_init__(self) -> None:
+        for field_name in ["domains", "pipelines", "steps", "triggers"]:
+            if getattr(self, field_name) < 1:
+                raise ValueError(f"{field_name} must be at least 1")
+
+    @property
+    def domain_names(self) -> List[str]:
+        return [f"domain{d}" for d in range(self.domains)]
+
+    @property
+    def pipeline_names(self) -> List[str]:
+        return [
+            f"{domain}_pipeline{p}"
+            for domain in self.domain_names
+            for p in range(self.pipelines)
+        ]
+
+    @staticmethod
+    def __write(file_path: str, content: str) -> None:
+        makedirs(path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+
+    def __write_module(self, root: str, module_path: str, glue: bool) -> None:
+        self.__write(path.join(module_path, "src", "index.py"), HANDLER)
+        with open(path.join(module_path, "requirements.json"), "w") as f:
+            dump({"packages": [], "extra_jars": [], "shared_modules": []}, f)
+
+        # glue jobs without built dependencies still need a zip to upload
+        if glue:
+            assets_path = path.join(
+                root, ".builder_cache", path.relpath(module_path, root)
+            )
+            makedirs(assets_path, exist_ok=True)
+            ZipFile(path.join(assets_path, "requirements.zip"), "w").close()
+
+    def __get_steps(self) -> Dict[str, Any]:
+        kinds = ["lambda", "choice", "glue"]
+        steps: Dict[str, Any] = {}
+        for i in range(self.steps):
+            kind = kinds[i % len(kinds)]
+            last = i == self.steps - 1
+            if kind == "choice" and last:
+                kind = "lambda"
+
+            step_name = f"Step{i}"
+            next_step = None if last else f"Step{i + 1}"
+
+            properties: Dict[str, Any]
+            if kind == "choice":
+                properties = {
+                    "choices": [
+                        {
+                            "variable": "route",
+                            "equals": value,
+                            "next_step": next_step,
+                        }
+                        for value in ["type1", "type2"]
+                    ]
+                }
+            elif kind == "glue":
+                properties = {
+                    "module": f"step{i}",
+                    "glue_version": "pythonshell",
+                    "timeout_minutes": 30,
+                    "max_concurrent_runs": 1,
+                }
+            else:
+                properties = {
+                    "module": f"step{i}",
+                    "timeout_seconds": 60,
+                    "memory_size": 128,
+                }
+
+            if next_step and kind != "choice":
+                properties["next_step"] = next_step
+
+            steps[step_name] = {"type": kind, "properties": properties}
+
+        return steps
+
+    def __get_triggers(self, name: str) -> List[Dict[str, Any]]:
+        triggers: List[Dict[str, Any]] = []
+        for t in range(self.triggers):
+            if t % 2 == 0:
+                triggers.append(
+                    {"s3": {"prefix": f"{name}/{t}/", "suffix": ".json"}}
+                )
+            else:
+                triggers.append(
+                    {
+                        "event_rule": {
+                            "source": [f"{name}.{t}"],
+                            "detail_type": ["benchmark"],
+                        }
+                    }
+                )
+
+        return triggers
+
+    def generate(self, root: str) -> str:
+        copytree(DOCKER_PATH, path.join(root, "docker"), dirs_exist_ok=True)
+        self.__write(path.join(root, "shared", "__init__.py"), "")
+        self.__write(path.join(root, "shared", "manifest.json"), "{}")
+
+        pipelines_path = path.join(root, "pipelines")
+        steps = self.__get_steps()
+        for name in self.pipeline_names:
+            pipeline_path = path.join(pipelines_path, name)
+            config = {
+                "name": name,
+                "domain": name.split("_")[0],
+                "layers": {"origin": "raw", "target": "trusted"},
+                "triggers": self.__get_triggers(name),
+                "tags": {"benchmark": "true"},
+                "contract": {
+                    "origin_bucket": "str",
+                    "origin_key": "str",
+                    "route": "str",
+                },
+                "steps": steps,
+            }
+            self.__write(
+                path.join(pipeline_path, "config.yml"), safe_dump(config)
+            )
+
+            for function in ["trigger", "catch"]:
+                self.__write_module(
+                    root, path.join(pipeline_path, function), False
+                )
+
+            for step in steps.values():
+                module = step["properties"].get("module")
+                if module:
+                    self.__write_module(
+                        root,
+                        path.join(pipeline_path, "steps", module),
+                        step["type"] == "glue",
+                    )
+
+        return pipelines_path
@@ -0,0 +1,242 @@
+from argparse import (
+    SUPPRESS,
+    ArgumentParser,
+)
+from glob import glob
+from hashlib import sha256
+from itertools import product
+from json import (
+    dump,
+    dumps,
+    loads,
+)
+from os import (
+    getpid,
+    listdir,
+    path,
+)
+from platform import (
+    platform,
+    python_version,
+)
+from resource import (
+    RUSAGE_SELF,
+    getrusage,
+)
+from subprocess import (  # nosec
+    CalledProcessError,
+    check_output,
+)
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from aws_cdk import App
+
+from benchmarks.lake import SyntheticLake
+from builder.api.default_datalake import DatalakeBuilder
+
+ROOT_PATH = path.dirname(path.dirname(path.abspath(__file__)))
+
+
+def get_child_peak_rss_kb(name: str) -> Optional[int]:
+    # the jsii kernel runs in a node child process, only visible on linux
+    if not path.isdir("/proc"):
+        return None
+
+    peak = None
+    for pid in listdir("/proc"):
+        if not pid.isdigit():
+            continue
+
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                status = dict(
+                    line.split(":", 1)
+                    for line in f.read().splitlines()
+                    if ":" in line
+                )
+        except OSError:
+            continue
+
+        if int(status.get("PPid", "0")) != getpid():
+            continue
+
+        if status.get("Name", "").strip() != name or "VmHWM" not in status:
+            continue
+
+        peak = max(peak or 0, int(status["VmHWM"].split()[0]))
+
+    return peak
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return check_output(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_PATH, text=True
+        ).strip()  # nosec
+    except (CalledProcessError, OSError):
+        return None
+
+
+def run(lake: SyntheticLake) -> Dict[str, Any]:
+    with TemporaryDirectory() as root:
+        pipelines_path = lake.generate(root)
+        outdir = path.join(root, "cdk.out")
+        app = App(outdir=outdir)
+
+        start = perf_counter()
+        DatalakeBuilder(
+            scope=app,
+            lake_name="Benchmark Lake",
+            region="us-east-1",
+            account_id="123456789012",
+            env="dev",
+            lake_domains=lake.domain_names,
+            enable_vpc=False,
+            sns_subscriptions=[],
+            pipelines_path=pipelines_path,
+            tags={"benchmark": "true"},
+            incremental=False,
+            pipeline_filter="",
+            build_deps=False,
+        ).build()
+        build_seconds = perf_counter() - start
+
+        start = perf_counter()
+        app.synth()
+        synth_seconds = perf_counter() - start
+
+        templates: Dict[str, Dict[str, Any]] = {}
+        for template_path in sorted(glob(path.join(outdir, "*.template.json"))):
+            with open(template_path, "rb") as f:
+                content = f.read()
+
+            templates[
+                path.basename(template_path)[: -len(".template.json")]
+            ] = {
+                "bytes": len(content),
+                "resources": len(loads(content).get("Resources", {})),
+                "sha256": sha256(content).hexdigest(),
+            }
+
+        return {
+            "domains": lake.domains,
+            "pipelines": lake.pipelines,
+            "steps": lake.steps,
+            "triggers": lake.triggers,
+            "build_seconds": round(build_seconds, 3),
+            "synth_seconds": round(synth_seconds, 3),
+            "python_peak_rss_kb": getrusage(RUSAGE_SELF).ru_maxrss,
+            "node_peak_rss_kb": get_child_peak_rss_kb("node"),
+            "stacks": len(templates),
+            "resources": sum(t["resources"] for t in templates.values()),
+            "template_bytes": sum(t["bytes"] for t in templates.values()),
+            "templates": templates,
+        }
+
+
+def get_changed_templates(
+    first: Dict[str, Any], second: Dict[str, Any]
+) -> List[str]:
+    return sorted(
+        name
+        for name in set(first["templates"]) | set(second["templates"])
+        if first["templates"].get(name, {}).get("sha256")
+        != second["templates"].get(name, {}).get("sha256")
+    )
+
+
+def run_single(domains: int, pipelines: int, steps: int, triggers: int) -> Any:
+    output = check_output(
+        [
+            executable,
+            "-m",
+            "benchmarks.synth",
+            "--single",
+            "--domains",
+            str(domains),
+            "--pipelines",
+            str(pipelines),
+            "--steps",
+            str(steps),
+            "--triggers",
+            str(triggers),
+        ],
+        cwd=ROOT_PATH,
+        text=True,
+    )  # nosec
+    return loads(output.splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(
+        description="Synthesize synthetic lakes and record how the build scales."
+    )
+    parser.add_argument("--domains", type=int, nargs="+", default=[1])
+    parser.add_argument("--pipelines", type=int, nargs="+", default=[5])
+    parser.add_argument("--steps", type=int, nargs="+", default=[5])
+    parser.add_argument("--triggers", type=int, nargs="+", default=[2])
+    parser.add_argument("--output", help="json file the results are written to")
+    parser.add_argument(
+        "--check-determinism",
+        action="store_true",
+        help="synthesize every scenario twice and fail if any template differs",
+    )
+    parser.add_argument("--single", action="store_true", help=SUPPRESS)
+    args = parser.parse_args(argv)
+
+    scenarios = list(
+        product(args.domains, args.pipelines, args.steps, args.triggers)
+    )
+
+    if args.single:
+        print(dumps(run(SyntheticLake(*scenarios[0]))))
+        return
+
+    # every scenario runs in its own process, so peak memory is its own
+    results = []
+    changed: List[str] = []
+    for scenario in scenarios:
+        result = run_single(*scenario)
+        results.append(result)
+        print(
+            f"{'x'.join(str(n) for n in scenario)}: "
+            f"build {result['build_seconds']}s, synth {result['synth_seconds']}s, "
+            f"{result['resources']} resources"
+        )
+
+        # a second process also catches ordering that depends on hash seeds
+        if args.check_determinism:
+            changed.extend(
+                f"{'x'.join(str(n) for n in scenario)}/{name}"
+                for name in get_changed_templates(result, run_single(*scenario))
+            )
+
+    report = {
+        "commit": get_commit(),
+        "python": python_version(),
+        "platform": platform(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            dump(report, f, indent=4)
+    else:
+        print(dumps(report, indent=4))
+
+    if changed:
+        raise SystemExit(
+            f"Templates differ between two synths of the same lake: {', '.join(changed)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
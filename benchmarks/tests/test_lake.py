@@ -0,0 +1,65 @@
+import unittest
+from glob import glob
+from os import path
+from tempfile import TemporaryDirectory
+
+from yaml import safe_load
+
+from benchmarks.lake import SyntheticLake
+from benchmarks.synth import (
+    get_changed_templates,
+    run,
+)
+from builder.model.config.pipeline import (
+    ChoicePipelineConfig,
+    GluePipelineConfig,
+    LambdaPipelineConfig,
+    PipelineConfig,
+)
+from builder.model.property.environment import Environment
+
+
+class TestSyntheticLake(unittest.TestCase):
+    def test_generate(self) -> None:
+        lake = SyntheticLake(domains=2, pipelines=3, steps=3, triggers=2)
+
+        with TemporaryDirectory() as root:
+            pipelines_path = lake.generate(root)
+            config_paths = glob(path.join(pipelines_path, "*", "config.yml"))
+
+            self.assertEqual(len(config_paths), 6)
+
+            with open(config_paths[0], "r") as f:
+                config = PipelineConfig.from_pydict(
+                    Environment.DEV, safe_load(f)
+                )
+
+            self.assertEqual(
+                [type(step) for step in config.steps],
+                [
+                    LambdaPipelineConfig,
+                    ChoicePipelineConfig,
+                    GluePipelineConfig,
+                ],
+            )
+            self.assertEqual(len(config.triggers), 2)
+
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            SyntheticLake(domains=0, pipelines=1, steps=1, triggers=1)
+
+    def test_run(self) -> None:
+        result = run(SyntheticLake(domains=1, pipelines=1, steps=3, triggers=1))
+
+        self.assertEqual(result["stacks"], 3)
+        self.assertGreater(result["resources"], 0)
+        self.assertGreater(result["template_bytes"], 0)
+
+    def test_run_deterministic(self) -> None:
+        lake = SyntheticLake(domains=1, pipelines=2, steps=3, triggers=1)
+
+        first = run(lake)
+        second = run(lake)
+
+        self.assertEqual(get_changed_templates(first, second), [])
+        self.assertEqual(first["templates"], second["templates"])
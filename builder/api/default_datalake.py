@@ -1,18 +1,28 @@
 from dataclasses import dataclass
 from glob import glob
-from os import path
+from os import (
+    environ,
+    path,
+)
+from sys import stderr
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
     Tuple,
+    Union,
 )
 
-from aws_cdk import Stack
+from aws_cdk import (
+    Fn,
+    Stack,
+    Stage,
+)
 from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_lambda as lambda_
 from aws_cdk import aws_sns as sns
 from constructs import Construct
-from yaml import safe_load
 
 from builder.model.config.pipeline import PipelineConfig
 from builder.model.package.datalake import DatalakePackage
@@ -21,8 +31,25 @@ from builder.model.property.bucket import DatalakeBucketSet
 from builder.model.property.environment import Environment
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
+from builder.model.resource.glue_job import GlueJobResource
+from builder.model.resource.lambda_ import LambdaResource
 from builder.model.resource.s3_bucket import S3BucketResource
+from builder.model.resource.s3_notification import S3NotificationResource
+from builder.utils.build_scheduler import (
+    BuildKey,
+    BuildScheduler,
+)
+from builder.utils.config_loader import PipelineConfigLoader
+from builder.utils.dockerbuild import DockerBuilderMethod
+from builder.utils.pipeline_filter import PipelineFilter
+from builder.utils.profiling import SYNTH_PROFILER
 from builder.utils.stack_cache import StackCache
+from builder.utils.stack_sharding import StackSharding
+from builder.utils.synth_cache import (
+    FINGERPRINT_METADATA,
+    SynthCache,
+)
+from builder.utils.telemetry import BUILD_TELEMETRY
 
 
 @dataclass
@@ -37,12 +64,68 @@ class DatalakeBuilder:
     sns_subscriptions: List[Dict[str, str]]
     pipelines_path: str
     tags: Dict[str, str]
+    build_parallelism: Optional[int] = None
+    root_path: Optional[str] = None
+    incremental: Optional[bool] = None
+    pipeline_filter: Optional[str] = None
+    build_deps: bool = True
+    stack_sharding: Optional[str] = None
 
     def __post_init__(self) -> None:
+        if not self.root_path:
+            self.root_path = path.dirname(path.abspath(self.pipelines_path))
+
+        if self.incremental is None:
+            self.incremental = environ.get(
+                "BUILDER_INCREMENTAL", ""
+            ).lower() in ["1", "true", "yes"]
+
+        # a subset of pipelines can be selected with "-c pipelines=..."
+        if self.pipeline_filter is None:
+            self.pipeline_filter = self.scope.node.try_get_context(
+                "pipelines"
+            ) or environ.get("BUILDER_PIPELINES", "")
+        self.pipeline_selection = PipelineFilter.from_string(
+            self.pipeline_filter  # type: ignore
+        )
+
+        # storage and shared stacks can be split with "-c sharding=..."
+        if self.stack_sharding is None:
+            self.stack_sharding = self.scope.node.try_get_context(
+                "sharding"
+            ) or environ.get("BUILDER_SHARDING", "")
+        self.sharding = StackSharding.from_string(
+            self.stack_sharding  # type: ignore
+        )
+
+        self.build_report_path = path.join(
+            self.root_path, ".builder_cache", "build_report.json"
+        )
+        self.profile_report_path = path.join(
+            self.root_path, ".builder_cache", "synth_profile.json"
+        )
+        self.config_cache_path = path.join(
+            self.root_path, ".builder_cache", "configs"
+        )
+        self.synth_cache: Optional[SynthCache] = None
+        if self.incremental:
+            self.synth_cache = SynthCache(
+                root_path=self.root_path,
+                cache_path=path.join(self.root_path, ".builder_cache", "synth"),
+                outdir=self.__get_stage().outdir,
+            )
+
         self.bucket_set: Optional[DatalakeBucketSet] = None
         self.vpc: Optional[ec2.Vpc] = None
         self.sns_topic: Optional[sns.Topic] = None
 
+    def __get_stage(self) -> Stage:
+        # Stage.of only looks at the parents of a construct
+        if isinstance(self.scope, Stage):
+            return self.scope
+
+        return Stage.of(self.scope)  # type: ignore
+
     def __set_properties(self) -> Tuple[Name, Environment, Tags]:
         env = Environment(self.env)
         name = Name(self.lake_name, env)
@@ -50,27 +133,202 @@ class DatalakeBuilder:
         return name, env, tags
 
     def __get_pipeline_configs(self) -> List[Tuple[PipelineConfig, str]]:
-        config_paths = glob(
-            path.join(self.pipelines_path, "*", "config.yml"), recursive=True
+        config_paths = sorted(
+            glob(
+                path.join(self.pipelines_path, "*", "config.yml"),
+                recursive=True,
+            )
+        )
+        loader = PipelineConfigLoader(
+            env=Environment(self.env),
+            cache_path=self.config_cache_path,
+            max_workers=self.build_parallelism,
         )
 
         configs: List[Tuple[PipelineConfig, str]] = []
-        for config_path in config_paths:
-            with open(config_path) as f:
-                config = safe_load(f)
-
-            configs.append(
-                (
-                    PipelineConfig.from_pydict(Environment(self.env), config),
-                    path.dirname(config_path),
+        for config_path, pipeline_config in zip(
+            config_paths, loader.load(config_paths)
+        ):
+            if not self.pipeline_selection.matches(pipeline_config):
+                continue
+
+            configs.append((pipeline_config, path.dirname(config_path)))
+
+        return configs
+
+    def __get_synth_parameters(self) -> Dict[str, Any]:
+        return {
+            "lake_name": self.lake_name,
+            "region": self.region,
+            "account_id": self.account_id,
+            "env": self.env,
+            "lake_domains": self.lake_domains,
+            "enable_vpc": self.enable_vpc,
+            "sns_subscriptions": self.sns_subscriptions,
+            "tags": self.tags,
+        }
+
+    @staticmethod
+    def __get_stack_name(pipeline_config: PipelineConfig) -> Name:
+        # the raw pipeline name is normalized together with the prefix and
+        # suffix, as in earlier releases, so deployed stacks keep their names
+        return Name(
+            f"lake-{pipeline_config.name.name}-stack", pipeline_config.name.env
+        )
+
+    def __build_pipeline(
+        self,
+        datalake: DatalakePackage,
+        pipeline_config: PipelineConfig,
+        pipeline_path: str,
+    ) -> PipelinePackage:
+        return PipelinePackage(
+            region=self.region,
+            account_id=self.account_id,
+            bucket_set=datalake.bucket_set,
+            sns_topic=datalake.sns_topic,
+            root_path=pipeline_path,
+            config=pipeline_config,
+            vpc=datalake.vpc,
+            build_deps=self.build_deps,
+            build_root=self.root_path,
+        ).build()
+
+    def __build_dependencies(
+        self, pipeline_packages: List[PipelinePackage]
+    ) -> None:
+        scheduler = BuildScheduler(max_workers=self.build_parallelism)
+        methods = {
+            LambdaResource: DockerBuilderMethod.LAMBDA,
+            GlueJobResource: DockerBuilderMethod.GLUE,
+        }
+
+        builds: List[Tuple[Union[LambdaResource, GlueJobResource], BuildKey]]
+        builds = []
+        for pipeline_package in pipeline_packages:
+            for resource in pipeline_package.resources:
+                if not isinstance(resource, (LambdaResource, GlueJobResource)):
+                    continue
+
+                if resource.build_deps:
+                    key = scheduler.add(
+                        resource.get_docker_builder(), methods[type(resource)]
+                    )
+                    builds.append((resource, key))
+
+        scheduler.run()
+
+        for resource, key in builds:
+            resource.docker_props = scheduler.get(key)  # type: ignore
+
+    def __add_datalake(
+        self, datalake: DatalakePackage, env: Environment, cache: StackCache
+    ) -> List[Stack]:
+        shards = self.sharding.shards(
+            list(datalake.domain_resources.keys()),
+            datalake.count_domain_resources,
+        )
+
+        if not self.sharding.enabled:
+            storage_stack: Stack = Stack(
+                self.scope, Name("lake-storage-stack", env).value
+            )
+        shared_stack: Stack = Stack(
+            self.scope, Name("lake-shared-stack", env).value
+        )
+        stacks = [shared_stack]
+
+        # each domain resource goes to the storage or catalog stack of its
+        # shard, unsharded lakes keep their catalog in the shared stack
+        shard_stacks: Dict[int, Tuple[Stack, Stack]] = {}
+        for shard, domains in shards:
+            catalog_stack = shared_stack
+            if shard:
+                storage_stack = Stack(
+                    self.scope, Name(f"lake-storage-{shard}-stack", env).value
+                )
+                catalog_stack = Stack(
+                    self.scope, Name(f"lake-shared-{shard}-stack", env).value
                 )
+                catalog_stack.add_dependency(shared_stack)
+                stacks.append(catalog_stack)
+
+            catalog_stack.add_dependency(storage_stack)
+            stacks.append(storage_stack)
+
+            for domain in domains:
+                for resource in datalake.domain_resources[domain]:
+                    shard_stacks[id(resource)] = (storage_stack, catalog_stack)
+
+        for resource in datalake.resources:
+            if id(resource) not in shard_stacks:
+                resource.add_to_cdk(shared_stack, cache)
+            elif isinstance(resource, S3BucketResource):
+                resource.add_to_cdk(shard_stacks[id(resource)][0], cache)
+            else:
+                resource.add_to_cdk(shard_stacks[id(resource)][1], cache)
+
+        return stacks
+
+    def __include_pipeline(
+        self,
+        pipeline_stack: Stack,
+        pipeline_package: PipelinePackage,
+        snapshot: str,
+        producers: Dict[str, Stack],
+        cache: StackCache,
+    ) -> bool:
+        if not self.synth_cache:
+            return False
+
+        # bucket notifications live in the storage stacks, so they are
+        # added again against the functions the snapshot exports
+        notifications = [
+            resource
+            for resource in pipeline_package.resources
+            if isinstance(resource, S3NotificationResource)
+        ]
+        exports: Dict[str, str] = {}
+        for notification in notifications:
+            function_name = notification.lambda_.value
+            export = self.synth_cache.get_function_export(
+                snapshot, function_name
             )
+            if not export:
+                return False
+            exports[function_name] = export
 
-        return configs
+        # snapshots importing values the app no longer exports are built
+        # again
+        if not self.synth_cache.include(pipeline_stack, snapshot, producers):
+            return False
+
+        # the imported functions take the construct path of the functions
+        # they replace, so the permissions keep their logical ids
+        for function_name, export in exports.items():
+            cache.add(
+                function_name,
+                lambda_.Function.from_function_attributes(
+                    pipeline_stack,
+                    function_name,
+                    function_arn=Fn.import_value(export),
+                    same_environment=True,
+                ),
+            )
+
+        for notification in notifications:
+            Stack.of(cache.get(notification.bucket.value)).add_dependency(
+                pipeline_stack
+            )
+            notification.add_to_cdk(pipeline_stack, cache)
+
+        return True
 
     def build(self) -> None:
         cache = StackCache()
         name, env, tags = self.__set_properties()
+        BUILD_TELEMETRY.reset()
+        SYNTH_PROFILER.reset()
 
         datalake = DatalakePackage(
             name=name,
@@ -84,37 +342,58 @@ class DatalakeBuilder:
             subscriptions=self.sns_subscriptions,
         ).build()
 
-        storage_stack: Stack = Stack(
-            self.scope, Name("lake-storage-stack", env).value
-        )
-        shared_stack: Stack = Stack(
-            self.scope, Name("lake-shared-stack", env).value
-        )
+        # unchanged pipelines reuse the template and assets of their last
+        # synth instead of being built again
+        parameters = self.__get_synth_parameters()
+        fingerprints: Dict[str, str] = {}
+        reused: List[Tuple[PipelineConfig, str, str]] = []
+        pipeline_packages: List[PipelinePackage] = []
+        for pipeline_config, pipeline_path in self.__get_pipeline_configs():
+            if self.synth_cache:
+                stack_name = self.__get_stack_name(pipeline_config).value
+                fingerprint = self.synth_cache.fingerprint(
+                    pipeline_path, parameters
+                )
+                fingerprints[stack_name] = fingerprint
 
-        shared_stack.add_dependency(storage_stack)
+                snapshot = self.synth_cache.get(stack_name, fingerprint)
+                if snapshot:
+                    reused.append((pipeline_config, pipeline_path, snapshot))
+                    continue
 
-        for resource in datalake.resources:
-            if isinstance(resource, S3BucketResource):
-                resource.add_to_cdk(storage_stack, cache)
-            else:
-                resource.add_to_cdk(shared_stack, cache)
+            pipeline_packages.append(
+                self.__build_pipeline(datalake, pipeline_config, pipeline_path)
+            )
 
-        pipeline_configs = self.__get_pipeline_configs()
-        for pipeline_config, pipeline_path in pipeline_configs:
-            stack_name: Name = pipeline_config.name.add_prefix(
-                "lake"
-            ).add_suffix("stack")
-            pipeline_stack: Stack = Stack(self.scope, stack_name.value)
-
-            pipeline_package = PipelinePackage(
-                region=self.region,
-                account_id=self.account_id,
-                bucket_set=datalake.bucket_set,
-                sns_topic=datalake.sns_topic,
-                root_path=pipeline_path,
-                config=pipeline_config,
-                vpc=datalake.vpc,
-            ).build()
+        self.__build_dependencies(pipeline_packages)
+
+        datalake_stacks = self.__add_datalake(datalake, env, cache)
+
+        producers = {stack.artifact_id: stack for stack in datalake_stacks}
+        pipeline_stacks: Dict[str, Stack] = {}
+        for pipeline_config, pipeline_path, snapshot in reused:
+            stack_name = self.__get_stack_name(pipeline_config).value
+            pipeline_stack = Stack(self.scope, stack_name)
+            pipeline_package = self.__build_pipeline(
+                datalake, pipeline_config, pipeline_path
+            )
+
+            if not self.__include_pipeline(
+                pipeline_stack, pipeline_package, snapshot, producers, cache
+            ):
+                pipeline_stacks[stack_name] = pipeline_stack
+                pipeline_packages.append(pipeline_package)
+
+        for pipeline_package in pipeline_packages:
+            stack_name = self.__get_stack_name(pipeline_package.config).value
+            pipeline_stack = pipeline_stacks.get(stack_name) or Stack(
+                self.scope, stack_name
+            )
+
+            if stack_name in fingerprints:
+                pipeline_stack.template_options.metadata = {
+                    FINGERPRINT_METADATA: fingerprints[stack_name]
+                }
 
             for resource in pipeline_package.resources:
                 resource.add_to_cdk(pipeline_stack, cache)
@@ -123,3 +402,11 @@ class DatalakeBuilder:
         self.sns_topic = cache.get(datalake.sns_topic.name.value)
         if datalake.vpc:
             self.vpc = cache.get(datalake.vpc.name.value)
+
+        if BUILD_TELEMETRY.modules:
+            BUILD_TELEMETRY.write(self.build_report_path)
+            print(BUILD_TELEMETRY.summary(), file=stderr)
+
+        if SYNTH_PROFILER.enabled:
+            SYNTH_PROFILER.write(self.profile_report_path)
+            print(SYNTH_PROFILER.summary(), file=stderr)
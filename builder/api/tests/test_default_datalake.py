@@ -0,0 +1,130 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Dict,
+)
+from unittest.mock import patch
+
+from aws_cdk import App
+from yaml import (
+    safe_dump,
+    safe_load,
+)
+
+from benchmarks.lake import SyntheticLake
+from builder.api.default_datalake import DatalakeBuilder
+from builder.utils.profiling import SYNTH_PROFILER
+
+
+class TestDatalakeBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+        self.lake = SyntheticLake(domains=1, pipelines=2, steps=1, triggers=1)
+        self.pipelines_path = self.lake.generate(self.root)
+        self.outdir = path.join(self.root, "cdk.out")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __build(self, **kwargs: Any) -> App:
+        app = App(outdir=self.outdir)
+        props: Dict[str, Any] = {
+            "scope": app,
+            "lake_name": "Test Lake",
+            "region": "us-east-1",
+            "account_id": "123456789012",
+            "env": "dev",
+            "lake_domains": self.lake.domain_names,
+            "enable_vpc": False,
+            "sns_subscriptions": [],
+            "pipelines_path": self.pipelines_path,
+            "tags": {},
+            "pipeline_filter": "",
+            "build_deps": False,
+            **kwargs,
+        }
+        DatalakeBuilder(**props).build()
+        app.synth()
+        return app
+
+    def __read(self, stack_name: str) -> str:
+        with open(path.join(self.outdir, f"{stack_name}.template.json")) as f:
+            return f.read()
+
+    def test_synth_cache_disabled(self) -> None:
+        app = App(outdir=self.outdir)
+        builder = DatalakeBuilder(
+            scope=app,
+            lake_name="Test Lake",
+            region="us-east-1",
+            account_id="123456789012",
+            env="dev",
+            lake_domains=self.lake.domain_names,
+            enable_vpc=False,
+            sns_subscriptions=[],
+            pipelines_path=self.pipelines_path,
+            tags={},
+            incremental=False,
+        )
+
+        self.assertIsNone(builder.synth_cache)
+
+    def test_summaries_go_to_stderr(self) -> None:
+        with patch.object(SYNTH_PROFILER, "modes", ["time"]), patch(
+            "builder.api.default_datalake.stderr", StringIO()
+        ) as stderr, redirect_stdout(StringIO()) as stdout:
+            self.__build()
+        SYNTH_PROFILER.reset()
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertIn("self time", stderr.getvalue())
+
+    def test_stack_names(self) -> None:
+        config_path = path.join(
+            self.pipelines_path, self.lake.pipeline_names[0], "config.yml"
+        )
+        with open(config_path, "r") as f:
+            config = safe_load(f)
+        with open(config_path, "w") as f:
+            safe_dump({**config, "name": "Domain0Pipeline0"}, f)
+
+        app = self.__build(incremental=False)
+
+        self.assertIsNotNone(
+            app.node.try_find_child("lake--domain0-pipeline0-stack-dev")
+        )
+
+    def test_incremental_keeps_notifications(self) -> None:
+        self.__build(incremental=True)
+        storage = self.__read("lake-storage-stack-dev")
+        pipelines = [
+            self.__read(f"lake-{name.replace('_', '-')}-stack-dev")
+            for name in self.lake.pipeline_names
+        ]
+
+        app = self.__build(incremental=True)
+
+        # both pipelines come from their snapshot and the storage stack
+        # still holds their bucket notifications
+        for name in self.lake.pipeline_names:
+            stack = app.node.find_child(
+                f"lake-{name.replace('_', '-')}-stack-dev"
+            )
+            self.assertIsNotNone(stack.node.try_find_child("Template"))
+
+        self.assertIn("Custom::S3BucketNotifications", storage)
+        self.assertEqual(self.__read("lake-storage-stack-dev"), storage)
+        # included templates only change the order of their sections
+        self.assertEqual(
+            [
+                loads(self.__read(f"lake-{name.replace('_', '-')}-stack-dev"))
+                for name in self.lake.pipeline_names
+            ],
+            [loads(pipeline) for pipeline in pipelines],
+        )
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -10,7 +14,14 @@ from builder.model.property.environment import Environment
 from builder.model.property.layer import DatalakeLayer
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
-from builder.utils.validation import type_validation
+from builder.model.resource.glue_job import GLUE_JOB_SCHEMA
+from builder.model.resource.lambda_ import LAMBDA_SCHEMA
+from builder.utils.validation import (
+    ListOf,
+    MapOf,
+    Schema,
+    Switch,
+)
 
 
 @dataclass
@@ -71,6 +82,132 @@ class GluePipelineConfig(PipelineStepConfig):
     properties: Optional[Dict[str, str]] = None
 
 
+# properties the pipeline package sets itself on its functions and jobs
+LAMBDA_PROPERTIES_SCHEMA = LAMBDA_SCHEMA.without(
+    "region", "account_id", "role", "root", "source_folder", "vpc"
+)
+GLUE_PROPERTIES_SCHEMA = GLUE_JOB_SCHEMA.without(
+    "root", "source_folder", "role", "temp_uri"
+)
+STEP_PROPERTIES = {"module": str, "next?": str, "next_step?": str}
+TRIGGER_TYPES = {"s3", "event_rule"}
+
+
+def check_step_references(pydict: dict) -> List[str]:
+    errors = []
+    for step_name, step in pydict["steps"].items():
+        properties = step["properties"]
+        next_steps = [
+            (f"steps.{step_name}.properties.{key}", properties[key])
+            for key in ["next", "next_step"]
+            if properties.get(key)
+        ]
+        for i, choice in enumerate(properties.get("choices") or []):
+            next_steps.append(
+                (
+                    f"steps.{step_name}.properties.choices[{i}].next_step",
+                    choice["next_step"],
+                )
+            )
+
+        for key, next_step in next_steps:
+            if next_step not in pydict["steps"]:
+                errors.append(
+                    f"Invalid value for {key}: {next_step!r}, expected one of {list(pydict['steps'])}"
+                )
+
+    return errors
+
+
+PIPELINE_CONFIG_SCHEMA = Schema(
+    {
+        "name": str,
+        "domain": str,
+        "layers": Schema(
+            {
+                "origin": [layer.value for layer in DatalakeLayer],
+                "target": [layer.value for layer in DatalakeLayer],
+            },
+            additional=False,
+        ),
+        "triggers": ListOf(
+            Schema(
+                {
+                    "s3?": Schema(
+                        {"prefix": str, "suffix": str}, additional=False
+                    ),
+                    "event_rule?": Schema(
+                        {"source": (str, list), "detail_type": (str, list)},
+                        additional=False,
+                    ),
+                },
+                checks=[
+                    lambda trigger: (
+                        []
+                        if len(TRIGGER_TYPES.intersection(trigger)) == 1
+                        else [
+                            f"Invalid trigger: {sorted(trigger)}, expected a single s3 or event_rule key"
+                        ]
+                    )
+                ],
+            )
+        ),
+        "contract": MapOf(str),
+        "steps": MapOf(
+            Switch(
+                key="type",
+                cases={
+                    "lambda": Schema(
+                        {
+                            "type": ["lambda"],
+                            "properties": LAMBDA_PROPERTIES_SCHEMA.extend(
+                                STEP_PROPERTIES
+                            ),
+                        },
+                    ),
+                    "glue": Schema(
+                        {
+                            "type": ["glue"],
+                            "properties": GLUE_PROPERTIES_SCHEMA.extend(
+                                STEP_PROPERTIES
+                            ),
+                        },
+                    ),
+                    "choice": Schema(
+                        {
+                            "type": ["choice"],
+                            "properties": Schema(
+                                {
+                                    "choices": ListOf(
+                                        Schema(
+                                            {
+                                                "variable": str,
+                                                "equals": str,
+                                                "next_step": str,
+                                            },
+                                            additional=False,
+                                        )
+                                    )
+                                }
+                            ),
+                        },
+                    ),
+                },
+            )
+        ),
+        "tags?": MapOf(str),
+        "functions?": Schema(
+            {
+                "trigger?": LAMBDA_PROPERTIES_SCHEMA,
+                "catch?": LAMBDA_PROPERTIES_SCHEMA,
+            },
+            additional=False,
+        ),
+    },
+    checks=[check_step_references],
+)
+
+
 @dataclass
 class PipelineConfig:
     name: Name
@@ -82,31 +219,21 @@ class PipelineConfig:
     tags: Tags
     contract: Dict[str, str]
     steps: List[PipelineStepConfig]
+    functions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "name": str,
-            "domain": str,
-            "layers": dict,
-            "triggers": list,
-            "contract": dict,
-            "steps": dict,
-            "tags?": dict,
-        }
-
-        type_validation(pydict_map, pydict)
+        PIPELINE_CONFIG_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(env: Environment, pydict: dict) -> "PipelineConfig":
         PipelineConfig.__pydict_validation(pydict)
 
-        tags = Tags()
-        tags.add("pipeline", pydict["name"])
-        tags.add("domain", pydict["domain"])
+        tags = Tags().add("pipeline", pydict["name"])
+        tags = tags.add("domain", pydict["domain"])
         if pydict.get("tags"):
             for key, value in pydict["tags"].items():
-                tags.add(key, value)
+                tags = tags.add(key, value)
 
         props = {
             "name": Name(pydict["name"], env),
@@ -116,6 +243,7 @@ class PipelineConfig:
             "tags": tags,
             "contract": pydict["contract"],
             "steps": PipelineConfig.__get_steps(pydict["steps"]),
+            "functions": pydict.get("functions") or {},
         }
 
         return PipelineConfig(**props)
@@ -135,7 +263,7 @@ class PipelineConfig:
             Union[S3PipelineTriggerConfig, EventRulePipelineTriggerConfig]
         ] = []
         for trigger_dict in trigger_list:
-            trigger_key = list(trigger_dict.keys())[0]
+            trigger_key = next(k for k in trigger_dict if k in TRIGGER_TYPES)
             trigger_props = trigger_dict[trigger_key]
 
             if trigger_key == "s3":
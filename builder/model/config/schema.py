@@ -0,0 +1,57 @@
+from argparse import ArgumentParser
+from json import (
+    dumps,
+    load,
+)
+from os import path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+from builder.model.config.pipeline import PIPELINE_CONFIG_SCHEMA
+
+SCHEMA_PATH = path.join(
+    path.dirname(path.dirname(path.dirname(path.dirname(__file__)))),
+    "pipelines",
+    "config.schema.json",
+)
+
+
+def get_json_schema() -> Dict[str, Any]:
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "Datalake pipeline config.yml",
+        **PIPELINE_CONFIG_SCHEMA.to_json_schema(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(
+        description="Write the JSON Schema of the pipeline config.yml files."
+    )
+    parser.add_argument("--output", default=SCHEMA_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if the schema file is not up to date",
+    )
+    args = parser.parse_args(argv)
+
+    json_schema = get_json_schema()
+    if args.check:
+        with open(args.output, "r") as f:
+            if load(f) != json_schema:
+                raise SystemExit(
+                    f"{args.output} is outdated, run python -m builder.model.config.schema"
+                )
+        return
+
+    with open(args.output, "w") as f:
+        f.write(dumps(json_schema, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from builder.model.config.pipeline import (
     S3PipelineTriggerConfig,
 )
 from builder.model.property.environment import Environment
+from builder.utils.validation import ValidationError
 
 
 class TestPipelineConfig(unittest.TestCase):
@@ -104,3 +105,111 @@ class TestPipelineConfig(unittest.TestCase):
         )
         self.assertIsInstance(pipeline.steps, list)
         self.assertIsInstance(pipeline.steps[0], PipelineStepConfig)
+
+    def test_functions(self) -> None:
+        pydict = {
+            "layers": {"origin": "raw", "target": "trusted"},
+            "domain": "example",
+            "steps": {},
+            "name": "pipeline_example",
+            "triggers": [],
+            "contract": {},
+            "functions": {"trigger": {"package_type": "zip"}},
+        }
+
+        pipeline = PipelineConfig.from_pydict(Environment.TEST, pydict)
+        self.assertEqual(
+            pipeline.functions, {"trigger": {"package_type": "zip"}}
+        )
+
+        pydict["functions"] = {"other": {"package_type": "zip"}}
+        with self.assertRaises(ValueError):
+            PipelineConfig.from_pydict(Environment.TEST, pydict)
+
+    def test_extra_step_and_trigger_keys(self) -> None:
+        pydict = {
+            "layers": {"origin": "raw", "target": "trusted"},
+            "domain": "example",
+            "steps": {
+                "Process": {
+                    "type": "glue",
+                    "description": "process the files",
+                    "properties": {
+                        "module": "process",
+                        "glue_version": "pythonshell",
+                    },
+                },
+            },
+            "name": "pipeline_example",
+            "triggers": [
+                {"comment": "csv only", "s3": {"prefix": "", "suffix": ".csv"}}
+            ],
+            "contract": {},
+        }
+
+        pipeline = PipelineConfig.from_pydict(Environment.TEST, pydict)
+        self.assertIsInstance(pipeline.triggers[0], S3PipelineTriggerConfig)
+        self.assertEqual(pipeline.steps[0].step_name, "Process")
+
+    def test_all_errors(self) -> None:
+        pydict = {
+            "layers": {"origin": "bronze", "target": "trusted"},
+            "domain": "example",
+            "steps": {
+                "Process": {
+                    "type": "glue",
+                    "properties": {
+                        "module": "process",
+                        "glue_version": "spark",
+                        "timeout_minutes": "30",
+                    },
+                },
+            },
+            "name": "pipeline_example",
+            "triggers": [{"sqs": {}}],
+            "contract": {},
+        }
+
+        with self.assertRaises(ValidationError) as context:
+            PipelineConfig.from_pydict(Environment.TEST, pydict)
+
+        self.assertEqual(
+            context.exception.errors,
+            [
+                "Invalid value for layers.origin: 'bronze', expected one of ['raw', 'trusted', 'service']",
+                "Invalid trigger: ['sqs'], expected a single s3 or event_rule key",
+                "Invalid value for steps.Process.properties.glue_version: 'spark', expected one of ['pythonshell', 'glueetl']",
+                "Invalid type for steps.Process.properties.timeout_minutes: <class 'str'>, expected <class 'int'>",
+            ],
+        )
+
+    def test_step_references(self) -> None:
+        pydict = {
+            "layers": {"origin": "raw", "target": "trusted"},
+            "domain": "example",
+            "steps": {
+                "Route": {
+                    "type": "choice",
+                    "properties": {
+                        "choices": [
+                            {
+                                "variable": "route",
+                                "equals": "type1",
+                                "next_step": "Missing",
+                            }
+                        ]
+                    },
+                },
+            },
+            "name": "pipeline_example",
+            "triggers": [],
+            "contract": {},
+        }
+
+        with self.assertRaises(ValueError) as context:
+            PipelineConfig.from_pydict(Environment.TEST, pydict)
+
+        self.assertIn(
+            "steps.Route.properties.choices[0].next_step",
+            str(context.exception),
+        )
@@ -0,0 +1,39 @@
+import unittest
+from json import load
+from os import path
+
+from yaml import safe_load
+
+from builder.model.config.pipeline import PIPELINE_CONFIG_SCHEMA
+from builder.model.config.schema import (
+    SCHEMA_PATH,
+    get_json_schema,
+)
+
+
+class TestConfigSchema(unittest.TestCase):
+    def test_schema_file_is_up_to_date(self) -> None:
+        with open(SCHEMA_PATH, "r") as f:
+            self.assertEqual(load(f), get_json_schema())
+
+    def test_example_config(self) -> None:
+        config_path = path.join(
+            path.dirname(SCHEMA_PATH), "example_pipeline", "config.yml"
+        )
+        with open(config_path, "r") as f:
+            self.assertEqual(PIPELINE_CONFIG_SCHEMA.errors(safe_load(f)), [])
+
+    def test_step_properties(self) -> None:
+        steps = get_json_schema()["properties"]["steps"]
+        cases = {
+            case["if"]["properties"]["type"]["const"]: case["then"]
+            for case in steps["additionalProperties"]["allOf"]
+        }
+
+        glue = cases["glue"]["properties"]["properties"]
+        self.assertIn("glue_version", glue["required"])
+        self.assertNotIn("role", glue["properties"])
+        self.assertEqual(
+            glue["properties"]["job_bookmark"]["enum"],
+            ["enable", "disable", "pause", None],
+        )
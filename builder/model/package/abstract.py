@@ -3,10 +3,24 @@ from abc import (
     abstractmethod,
 )
 from dataclasses import dataclass
+from typing import Any
+
+from builder.utils.profiling import SYNTH_PROFILER
 
 
 @dataclass
 class Package(ABC):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "build" in cls.__dict__:
+            cls.build = SYNTH_PROFILER.wrap(  # type: ignore
+                cls.build, lambda package: package.profile_group
+            )
+
     @abstractmethod
     def build(self) -> "Package":
         pass
+
+    @property
+    def profile_group(self) -> str:
+        return type(self).__name__
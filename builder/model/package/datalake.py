@@ -43,6 +43,7 @@ class DatalakePackage(Package):
     crawler_schedule: str = "cron(0 0 * * ? *)"
     bucket_removal_policy: str = "retain"
     resources: List[Resource] = field(default_factory=list)
+    domain_resources: Dict[str, List[Resource]] = field(default_factory=dict)
 
     def build(self) -> "DatalakePackage":
         self.vpc: Optional[VpcResource] = None
@@ -110,7 +111,7 @@ class DatalakePackage(Package):
             env=self.env,
         )
 
-        for bucket in self.bucket_set.buckets:
+        for bucket in self.bucket_set:
             s3_bucket = S3BucketResource.from_pydict(
                 name=bucket.name,
                 tags=self.tags,
@@ -128,6 +129,9 @@ class DatalakePackage(Package):
 
             self.resources.append(s3_bucket)
             self.resources.append(database)
+            self.domain_resources.setdefault(bucket.domain, []).extend(
+                [s3_bucket, database]
+            )
 
             if bucket.layer == DatalakeLayer.RAW:
                 crawler = GlueCrawlerResource.from_pydict(
@@ -142,5 +146,17 @@ class DatalakePackage(Package):
                 )
 
                 self.resources.append(crawler)
+                self.domain_resources[bucket.domain].append(crawler)
 
         return self
+
+    def count_domain_resources(self, domain: str) -> int:
+        # buckets, databases and crawlers synthesize to one cloudformation
+        # resource each, buckets and catalog resources go to different stacks
+        resources = self.domain_resources[domain]
+        buckets = len([r for r in resources if isinstance(r, S3BucketResource)])
+        return max(buckets, len(resources) - buckets)
+
+    @property
+    def profile_group(self) -> str:
+        return self.name.name
@@ -43,10 +43,12 @@ class PipelinePackage(Package):
     config: PipelineConfig
     vpc: Optional[VpcResource] = None
     build_deps: bool = True
+    build_root: Optional[str] = None
 
     resources: List[Resource] = field(default_factory=list)
 
     def build(self) -> "PipelinePackage":
+        self.build_root = self.build_root or self.root_path
         state_machine_arn = f"arn:aws:states:{self.region}:{self.account_id}:stateMachine:{self.config.name.value}"
         roles = self.__create_roles(state_machine_arn)
         catch = self.__create_lambda_catch(roles)
@@ -64,6 +66,10 @@ class PipelinePackage(Package):
 
         return self
 
+    @property
+    def profile_group(self) -> str:
+        return self.config.name.name
+
     def __create_roles(self, state_machine_arn: str) -> Dict[str, RoleResource]:
         roles: Dict[str, RoleResource] = {}
 
@@ -72,7 +78,7 @@ class PipelinePackage(Package):
             f"arn:aws:glue:{self.region}:{self.account_id}:catalog"
         )
 
-        buckets = self.bucket_set.get(domains=[self.config.domain])
+        buckets = self.bucket_set.get_domain(self.config.domain)
 
         for bucket in buckets:
             domain_resources.append(bucket.arn)
@@ -211,62 +217,77 @@ class PipelinePackage(Package):
 
         return roles
 
+    def __apply_function_config(
+        self, pydict: Dict[str, Any], function: str
+    ) -> None:
+        # configured variables are added to the ones the function reads,
+        # which are kept over the configured ones
+        config = self.config.functions.get(function, {})
+        environment = {**config.get("environment", {}), **pydict["environment"]}
+        pydict.update(config)
+        pydict["environment"] = environment
+
     def __create_lambda_catch(
         self, roles: Dict[str, RoleResource]
     ) -> LambdaResource:
+        pydict: Dict[str, Any] = {
+            "region": self.region,
+            "account_id": self.account_id,
+            "role": roles["catch"],
+            "timeout": 60,
+            "memory_size": 128,
+            "root": self.build_root,
+            "source_folder": path.join(self.root_path, "catch"),
+            "environment": {
+                "PIPELINE_NAME": self.config.name.value,
+                "SNS_TOPIC_ARN": self.sns_topic.arn,
+            },
+            "vpc": self.vpc,
+            "vpc_subnet": "private",
+            "build_deps": self.build_deps,
+        }
+        self.__apply_function_config(pydict, "catch")
+
         return LambdaResource.from_pydict(
             name=self.config.name.add_suffix("catch"),
             tags=self.config.tags,
-            pydict={
-                "region": self.region,
-                "account_id": self.account_id,
-                "role": roles["catch"],
-                "timeout": 60,
-                "memory_size": 128,
-                "root": self.root_path,
-                "source_folder": path.join(self.root_path, "catch"),
-                "environment": {
-                    "PIPELINE_NAME": self.config.name.value,
-                    "SNS_TOPIC_ARN": self.sns_topic.arn,
-                },
-                "vpc": self.vpc,
-                "vpc_subnet": "private",
-                "build_deps": self.build_deps,
-            },
+            pydict=pydict,
         )
 
     def __create_lambda_trigger(
         self, state_machine_arn: str, roles: Dict[str, RoleResource]
     ) -> LambdaResource:
+        pydict: Dict[str, Any] = {
+            "region": self.region,
+            "account_id": self.account_id,
+            "role": roles["trigger"],
+            "timeout": 60,
+            "memory_size": 128,
+            "root": self.build_root,
+            "source_folder": path.join(self.root_path, "trigger"),
+            "environment": {
+                "STATE_MACHINE_ARN": state_machine_arn,
+                "TRIGGER_LAYER": self.config.layers.origin.value,
+                "TARGET_LAYER": self.config.layers.target.value,
+            },
+            "vpc": self.vpc,
+            "vpc_subnet": "private",
+            "build_deps": self.build_deps,
+        }
+        self.__apply_function_config(pydict, "trigger")
+
         return LambdaResource.from_pydict(
             name=self.config.name.add_suffix("trigger"),
             tags=self.config.tags,
-            pydict={
-                "region": self.region,
-                "account_id": self.account_id,
-                "role": roles["trigger"],
-                "timeout": 60,
-                "memory_size": 128,
-                "root": self.root_path,
-                "source_folder": path.join(self.root_path, "trigger"),
-                "environment": {
-                    "STATE_MACHINE_ARN": state_machine_arn,
-                    "TRIGGER_LAYER": self.config.layers.origin.value,
-                    "TARGET_LAYER": self.config.layers.target.value,
-                },
-                "vpc": self.vpc,
-                "vpc_subnet": "private",
-                "build_deps": self.build_deps,
-            },
+            pydict=pydict,
         )
 
     def __create_trigger_notifications(
         self, lambda_: LambdaResource
     ) -> List[Union[S3NotificationResource, EventRuleResource]]:
-        trigger_bucket = self.bucket_set.get(
-            domains=[self.config.domain],
-            layers=[self.config.layers.origin],
-        )[0].name
+        trigger_bucket = self.bucket_set.get_bucket(
+            self.config.domain, self.config.layers.origin
+        ).name
 
         notification: Union[S3NotificationResource, EventRuleResource]
         notifications: List[
@@ -309,10 +330,9 @@ class PipelinePackage(Package):
         pipeline_args = [arg for arg, _ in self.config.contract.items()]
 
         temp_uri = (
-            self.bucket_set.get(
-                domains=[self.config.domain],
-                layers=[self.config.layers.target],
-            )[0].uri
+            self.bucket_set.get_bucket(
+                self.config.domain, self.config.layers.target
+            ).uri
             + "/temp"
         )
 
@@ -326,7 +346,7 @@ class PipelinePackage(Package):
                     "region": self.region,
                     "account_id": self.account_id,
                     "role": roles["lambda"],
-                    "root": self.root_path,
+                    "root": self.build_root,
                     "source_folder": path.join(
                         self.root_path, "steps", step.module
                     ),
@@ -354,7 +374,7 @@ class PipelinePackage(Package):
                 pydict = {
                     "role": roles["glue"],
                     "temp_uri": temp_uri,
-                    "root": self.root_path,
+                    "root": self.build_root,
                     "source_folder": path.join(
                         self.root_path, "steps", step.module
                     ),
@@ -10,6 +10,7 @@ from builder.model.package.datalake import DatalakePackage
 from builder.model.property.environment import Environment
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
+from builder.model.resource.s3_bucket import S3BucketResource
 from builder.utils.stack_cache import StackCache
 
 
@@ -33,6 +34,32 @@ class TestDatalakePackage(unittest.TestCase):
 
         self.assertEqual(len(resources), 21)
 
+    def test_domain_resources(self) -> None:
+        self.datalake.build()
+        domain_resources = self.datalake.domain_resources
+
+        self.assertEqual(list(domain_resources.keys()), ["domain1", "domain2"])
+        for resources in domain_resources.values():
+            self.assertEqual(len(resources), 7)
+
+    def test_count_domain_resources(self) -> None:
+        self.datalake.build()
+
+        for domain, resources in self.datalake.domain_resources.items():
+            counts = []
+            for storage in [True, False]:
+                stack = Stack(App(), "test-stack")
+                for resource in resources:
+                    if isinstance(resource, S3BucketResource) == storage:
+                        resource.add_to_cdk(stack, StackCache())
+                counts.append(
+                    len(Template.from_stack(stack).to_json()["Resources"])
+                )
+
+            self.assertEqual(
+                self.datalake.count_domain_resources(domain), max(counts)
+            )
+
     def test_add_to_cdk(self) -> None:
         app = App()
         stack = Stack(app, "test-stack")
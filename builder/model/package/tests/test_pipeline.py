@@ -15,6 +15,7 @@ from builder.model.property.bucket import DatalakeBucketSet
 from builder.model.property.environment import Environment
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
+from builder.model.resource.lambda_ import LambdaResource
 from builder.model.resource.s3_bucket import S3BucketResource
 from builder.model.resource.sns_topic import SnsTopicResource
 from builder.model.resource.vpc import VpcResource
@@ -97,6 +98,37 @@ class TestPipelinePackage(unittest.TestCase):
 
         self.assertEqual(len(resources), 14)
 
+    def test_functions_environment(self) -> None:
+        self.config.functions = {
+            "trigger": {
+                "memory_size": 256,
+                "environment": {"LOG_LEVEL": "DEBUG", "TARGET_LAYER": "raw"},
+            },
+            "catch": {"environment": {"LOG_LEVEL": "DEBUG"}},
+        }
+        self.pipeline2.build()
+
+        functions = {
+            resource.name.name: resource
+            for resource in self.pipeline2.resources
+            if isinstance(resource, LambdaResource)
+        }
+        trigger = functions[self.config.name.add_suffix("trigger").name]
+        catch = functions[self.config.name.add_suffix("catch").name]
+
+        self.assertEqual(trigger.memory_size, 256)
+        self.assertEqual(trigger.environment["LOG_LEVEL"], "DEBUG")
+        self.assertEqual(
+            trigger.environment["TARGET_LAYER"],
+            self.config.layers.target.value,
+        )
+        self.assertIn("STATE_MACHINE_ARN", trigger.environment)
+        self.assertEqual(catch.environment["LOG_LEVEL"], "DEBUG")
+        self.assertEqual(
+            sorted(catch.environment),
+            ["LOG_LEVEL", "PIPELINE_NAME", "SNS_TOPIC_ARN"],
+        )
+
     def test_add_to_cdk_1(self) -> None:
         app = App()
         stack = Stack(app, "test-stack")
@@ -1,12 +1,12 @@
-from dataclasses import (
-    dataclass,
-    field,
-)
-from itertools import product
+from dataclasses import dataclass
 from typing import (
+    Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
+    Union,
 )
 
 from builder.model.property.environment import Environment
@@ -14,8 +14,19 @@ from builder.model.property.layer import DatalakeLayer
 from builder.model.property.name import Name
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatalakeBucket:
+    __slots__ = (
+        "domain",
+        "layer",
+        "name",
+        "uri",
+        "arn",
+        "database",
+        "database_arn",
+        "crawler",
+    )
+
     domain: str
     layer: DatalakeLayer
     name: Name
@@ -25,6 +36,9 @@ class DatalakeBucket:
     database_arn: str
     crawler: Name
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return DatalakeBucket, tuple(getattr(self, f) for f in self.__slots__)
+
 
 @dataclass
 class DatalakeBucketSet:
@@ -32,47 +46,83 @@ class DatalakeBucketSet:
     account_id: str
     domains: List[str]
     env: Environment
-    buckets: List[DatalakeBucket] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        layers = [l for l in DatalakeLayer]
-        combinations = list(product(self.domains, layers))
+        # buckets are only described when they are first looked up
+        self.__index = {domain: i for i, domain in enumerate(self.domains)}
+        self.__buckets: Dict[Tuple[str, DatalakeLayer], DatalakeBucket] = {}
 
-        for domain, layer in combinations:
-            name = Name(
-                f"{domain}-{layer.value}-{self.region}-{self.account_id}",
-                self.env,
-            )
-            database_name = Name(f"{domain}-{layer.value}", self.env)
-            crawler_name = Name(f"{domain}-{layer.value}- crawler", self.env)
-            database_arn = f"arn:aws:glue:{self.region}:{self.account_id}:database/{database_name.value}"
-
-            self.buckets.append(
-                DatalakeBucket(
-                    domain=domain,
-                    layer=layer,
-                    name=name,
-                    uri=f"s3://{name.value}",
-                    arn=f"arn:aws:s3:::{name.value}",
-                    database=database_name,
-                    database_arn=database_arn,
-                    crawler=crawler_name,
-                )
+    def __create_bucket(
+        self, domain: str, layer: DatalakeLayer
+    ) -> DatalakeBucket:
+        name = Name(
+            f"{domain}-{layer.value}-{self.region}-{self.account_id}",
+            self.env,
+        )
+        database_name = Name(f"{domain}-{layer.value}", self.env)
+        crawler_name = Name(f"{domain}-{layer.value}- crawler", self.env)
+        database_arn = f"arn:aws:glue:{self.region}:{self.account_id}:database/{database_name.value}"
+
+        return DatalakeBucket(
+            domain=domain,
+            layer=layer,
+            name=name,
+            uri=f"s3://{name.value}",
+            arn=f"arn:aws:s3:::{name.value}",
+            database=database_name,
+            database_arn=database_arn,
+            crawler=crawler_name,
+        )
+
+    def get_bucket(
+        self, domain: str, layer: Union[DatalakeLayer, str]
+    ) -> DatalakeBucket:
+        if domain not in self.__index:
+            raise ValueError(
+                f"Invalid domain: {domain}, expected one of {self.domains}"
             )
 
+        layer = DatalakeLayer(layer)
+        bucket = self.__buckets.get((domain, layer))
+        if not bucket:
+            bucket = self.__create_bucket(domain, layer)
+            self.__buckets[(domain, layer)] = bucket
+
+        return bucket
+
+    def get_domain(self, domain: str) -> List[DatalakeBucket]:
+        return [self.get_bucket(domain, layer) for layer in DatalakeLayer]
+
+    def __iter__(self) -> Iterator[DatalakeBucket]:
+        for domain in self.__index:
+            yield from self.get_domain(domain)
+
+    def __len__(self) -> int:
+        return len(self.__index) * len(DatalakeLayer)
+
+    @property
+    def buckets(self) -> List[DatalakeBucket]:
+        return list(self)
+
     def get(
         self,
         domains: Optional[List[str]] = None,
-        layers: Optional[List[DatalakeLayer]] = None,
+        layers: Optional[List[Union[DatalakeLayer, str]]] = None,
     ) -> List[DatalakeBucket]:
-        if not domains and not layers:
-            return self.buckets
+        selected_domains = list(self.__index)
+        if domains:
+            selected_domains = sorted(
+                {d for d in domains if d in self.__index},
+                key=self.__index.__getitem__,
+            )
 
-        filtered_buckets = []
-        for bucket in self.buckets:
-            if (not domains or bucket.domain in domains) and (
-                not layers or bucket.layer in layers
-            ):
-                filtered_buckets.append(bucket)
+        selected_layers = list(DatalakeLayer)
+        if layers:
+            layer_set = {DatalakeLayer(layer) for layer in layers}
+            selected_layers = [l for l in DatalakeLayer if l in layer_set]
 
-        return filtered_buckets
+        return [
+            self.get_bucket(domain, layer)
+            for domain in selected_domains
+            for layer in selected_layers
+        ]
@@ -0,0 +1,16 @@
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+
+class Frozen:
+    __slots__ = ()
+
+    def _freeze(self, **attributes: Any) -> None:
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
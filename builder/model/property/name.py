@@ -1,32 +1,62 @@
-from dataclasses import dataclass
+from functools import lru_cache
 from re import sub
+from sys import intern
+from typing import (
+    Any,
+    Tuple,
+)
 
 from builder.model.property.environment import Environment
+from builder.model.property.frozen import Frozen
 
 
-@dataclass
-class Name:
+@lru_cache(maxsize=None)
+def kebab(name: str) -> str:
+    name = sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    name = sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = name.replace("_", "-")
+    name = name.replace(" ", "-")
+    return intern(name.lower())
+
+
+class Name(Frozen):
+    __slots__ = ("name", "env", "kebab", "value")
+
     name: str
     env: Environment
+    kebab: str
+    value: str
 
-    def __post_init__(self) -> None:
-        if not isinstance(self.env, Environment):
+    def __init__(self, name: str, env: Environment) -> None:
+        if not isinstance(env, Environment):
             raise ValueError("Invalid environment")
 
-    def _kebab(self) -> None:
-        self.name = sub("(.)([A-Z][a-z]+)", r"\1_\2", self.name)
-        self.name = sub("([a-z0-9])([A-Z])", r"\1_\2", self.name)
-        self.name = self.name.replace("_", "-")
-        self.name = self.name.replace(" ", "-")
-        self.name = self.name.lower()
+        # names are normalized once, identical names share their strings
+        kebab_name = kebab(name)
+        self._freeze(
+            name=name,
+            env=env,
+            kebab=kebab_name,
+            value=intern(f"{kebab_name}-{env.value}"),
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Name, (self.name, self.env)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Name):
+            return NotImplemented
+
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return f"Name(name={self.name!r}, env={self.env!r})"
 
     def add_prefix(self, prefix: str) -> "Name":
-        return Name(f"{prefix}-{self.name}", self.env)
+        return Name(f"{prefix}-{self.kebab}", self.env)
 
     def add_suffix(self, suffix: str) -> "Name":
-        return Name(f"{self.name}-{suffix}", self.env)
-
-    @property
-    def value(self) -> str:
-        self._kebab()
-        return f"{self.name}-{self.env.value}"
+        return Name(f"{self.kebab}-{suffix}", self.env)
@@ -1,16 +1,34 @@
-from dataclasses import (
-    dataclass,
-    field,
-)
 from typing import (
-    List,
+    Any,
+    Iterable,
     Tuple,
 )
 
+from builder.model.property.frozen import Frozen
+
+
+class Tags(Frozen):
+    __slots__ = ("items",)
+
+    items: Tuple[Tuple[str, str], ...]
+
+    def __init__(self, items: Iterable[Tuple[str, str]] = ()) -> None:
+        self._freeze(items=tuple(items))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Tags, (self.items,)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Tags):
+            return NotImplemented
+
+        return self.items == other.items
+
+    def __hash__(self) -> int:
+        return hash(self.items)
 
-@dataclass
-class Tags:
-    items: List[Tuple[str, str]] = field(default_factory=list)
+    def __repr__(self) -> str:
+        return f"Tags(items={self.items!r})"
 
     @staticmethod
     def __kebab(value: str) -> str:
@@ -19,6 +37,6 @@ class Tags:
         value = value.lower()
         return value
 
-    def add(self, key: str, value: str) -> None:
+    def add(self, key: str, value: str) -> "Tags":
         key = self.__kebab(key)
-        self.items.append((key, value))
+        return Tags(self.items + ((key, value),))
@@ -0,0 +1,68 @@
+import unittest
+
+from builder.model.property.bucket import DatalakeBucketSet
+from builder.model.property.environment import Environment
+from builder.model.property.layer import DatalakeLayer
+
+
+class TestDatalakeBucketSet(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bucket_set = DatalakeBucketSet(
+            region="us-east-1",
+            account_id="1234567890",
+            domains=["sales", "finance"],
+            env=Environment.TEST,
+        )
+
+    def test_get_bucket(self) -> None:
+        bucket = self.bucket_set.get_bucket("sales", DatalakeLayer.RAW)
+
+        self.assertEqual(bucket.domain, "sales")
+        self.assertEqual(bucket.layer, DatalakeLayer.RAW)
+        self.assertEqual(
+            bucket.name.value, "sales-raw-us-east-1-1234567890-test"
+        )
+        self.assertEqual(bucket.uri, f"s3://{bucket.name.value}")
+        self.assertEqual(bucket.database.value, "sales-raw-test")
+        self.assertIs(bucket, self.bucket_set.get_bucket("sales", "raw"))
+
+        with self.assertRaises(ValueError):
+            self.bucket_set.get_bucket("marketing", DatalakeLayer.RAW)
+
+    def test_iteration(self) -> None:
+        buckets = list(self.bucket_set)
+
+        self.assertEqual(len(buckets), len(self.bucket_set))
+        self.assertEqual(
+            [(b.domain, b.layer.value) for b in buckets],
+            [
+                ("sales", "raw"),
+                ("sales", "trusted"),
+                ("sales", "service"),
+                ("finance", "raw"),
+                ("finance", "trusted"),
+                ("finance", "service"),
+            ],
+        )
+        self.assertEqual(self.bucket_set.buckets, buckets)
+
+    def test_get(self) -> None:
+        self.assertEqual(len(self.bucket_set.get()), 6)
+        self.assertEqual(
+            self.bucket_set.get(domains=["finance"]),
+            self.bucket_set.get_domain("finance"),
+        )
+
+        buckets = self.bucket_set.get(
+            domains=["finance", "sales", "marketing"],
+            layers=[DatalakeLayer.SERVICE, "raw"],
+        )
+        self.assertEqual(
+            [(b.domain, b.layer.value) for b in buckets],
+            [
+                ("sales", "raw"),
+                ("sales", "service"),
+                ("finance", "raw"),
+                ("finance", "service"),
+            ],
+        )
@@ -1,4 +1,9 @@
 import unittest
+from dataclasses import FrozenInstanceError
+from pickle import (  # nosec
+    dumps,
+    loads,
+)
 
 from builder.model.property.environment import Environment
 from builder.model.property.name import Name
@@ -18,3 +23,20 @@ class TestName(unittest.TestCase):
         name = Name("test_name", Environment.TEST)
         suffixed_name = name.add_suffix("suffix")
         self.assertEqual(suffixed_name.value, "test-name-suffix-test")
+
+    def test_value(self) -> None:
+        name = Name("TestName with_spaces", Environment.TEST)
+        self.assertEqual(name.name, "TestName with_spaces")
+        self.assertEqual(name.value, "test-name-with-spaces-test")
+
+    def test_immutable(self) -> None:
+        name = Name("test_name", Environment.TEST)
+
+        self.assertEqual(name, Name("test-name", Environment.TEST))
+        self.assertNotEqual(name, Name("test_name", Environment.DEV))
+        self.assertEqual(len({name, Name("test-name", Environment.TEST)}), 1)
+        self.assertEqual(loads(dumps(name)), name)  # nosec
+        self.assertIs(name.value, Name("test-name", Environment.TEST).value)
+
+        with self.assertRaises(FrozenInstanceError):
+            name.name = "other"  # type: ignore
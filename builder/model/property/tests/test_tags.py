@@ -1,4 +1,9 @@
 import unittest
+from dataclasses import FrozenInstanceError
+from pickle import (  # nosec
+    dumps,
+    loads,
+)
 
 from builder.model.property.tags import Tags
 
@@ -8,14 +13,14 @@ class TestTags(unittest.TestCase):
         self.tags = Tags()
 
     def test_add(self) -> None:
-        self.tags.add("Key 1", "Value 1")
-        self.assertEqual(self.tags.items, [("key-1", "Value 1")])
+        self.tags = self.tags.add("Key 1", "Value 1")
+        self.assertEqual(self.tags.items, (("key-1", "Value 1"),))
 
     def test_multiple_adds(self) -> None:
-        self.tags.add("Key 1", "Value 1")
-        self.tags.add("Key_2", "Value 2")
+        self.tags = self.tags.add("Key 1", "Value 1")
+        self.tags = self.tags.add("Key_2", "Value 2")
         self.assertEqual(
-            self.tags.items, [("key-1", "Value 1"), ("key-2", "Value 2")]
+            self.tags.items, (("key-1", "Value 1"), ("key-2", "Value 2"))
         )
 
     def test_iteration(self) -> None:
@@ -25,8 +30,19 @@ class TestTags(unittest.TestCase):
         ]
 
         for key, value in examples:
-            self.tags.add(key, value)
+            self.tags = self.tags.add(key, value)
 
         for index, (key, value) in enumerate(self.tags.items):
             self.assertEqual(key, examples[index][0])
             self.assertEqual(value, examples[index][1])
+
+    def test_immutable(self) -> None:
+        tags = self.tags.add("key", "value")
+
+        self.assertEqual(self.tags.items, ())
+        self.assertEqual(tags, Tags([("key", "value")]))
+        self.assertEqual(hash(tags), hash(Tags([("key", "value")])))
+        self.assertEqual(loads(dumps(tags)), tags)  # nosec
+
+        with self.assertRaises(FrozenInstanceError):
+            tags.items = ()  # type: ignore
@@ -3,11 +3,14 @@ from abc import (
     abstractmethod,
 )
 from dataclasses import dataclass
+from typing import Any
 
+from aws_cdk import Stack
 from constructs import Construct
 
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
+from builder.utils.profiling import SYNTH_PROFILER
 from builder.utils.stack_cache import StackCache
 
 
@@ -16,6 +19,14 @@ class Resource(ABC):
     name: Name
     tags: Tags
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "add_to_cdk" in cls.__dict__:
+            cls.add_to_cdk = SYNTH_PROFILER.wrap(  # type: ignore
+                cls.add_to_cdk,
+                lambda resource, scope, cache: Stack.of(scope).node.id,
+            )
+
     @staticmethod
     @abstractmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "Resource":
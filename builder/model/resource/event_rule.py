@@ -11,7 +11,14 @@ from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.model.resource.lambda_ import LambdaResource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+EVENT_RULE_SCHEMA = Schema(
+    {
+        "targets": list,
+        "event_pattern": dict,
+    }
+)
 
 
 @dataclass
@@ -23,12 +30,7 @@ class EventRuleResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "targets": list,
-            "event_pattern": dict,
-        }
-
-        type_validation(pydict_map, pydict)
+        EVENT_RULE_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
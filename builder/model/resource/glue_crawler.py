@@ -15,7 +15,24 @@ from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.model.resource.iam_role import RoleResource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+GLUE_CRAWLER_SCHEMA = Schema(
+    {
+        "role": RoleResource,
+        "s3_targets": list,
+        "database_name": str,
+        "schedule?": str,
+    },
+    checks=[
+        lambda pydict: (
+            ["Invalid schedule, expected cron() format"]
+            if pydict.get("schedule")
+            and not pydict["schedule"].startswith("cron(")
+            else []
+        )
+    ],
+)
 
 
 @dataclass
@@ -29,19 +46,7 @@ class GlueCrawlerResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "role": RoleResource,
-            "s3_targets": list,
-            "database_name": str,
-            "schedule?": str,
-        }
-
-        type_validation(pydict_map, pydict)
-
-        if pydict.get("schedule") and not pydict["schedule"].startswith(
-            "cron("
-        ):
-            raise ValueError("Invalid schedule, expected cron() format")
+        GLUE_CRAWLER_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
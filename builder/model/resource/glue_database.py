@@ -9,7 +9,14 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+GLUE_DATABASE_SCHEMA = Schema(
+    {
+        "catalog_id": str,
+        "location_uri": str,
+    }
+)
 
 
 @dataclass
@@ -21,12 +28,7 @@ class GlueDatabaseResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "catalog_id": str,
-            "location_uri": str,
-        }
-
-        type_validation(pydict_map, pydict)
+        GLUE_DATABASE_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
@@ -6,7 +6,6 @@ from typing import (
     Optional,
     Tuple,
 )
-from uuid import uuid4
 
 from aws_cdk import Duration
 from aws_cdk import Tags as AwsTags
@@ -24,7 +23,26 @@ from builder.utils.dockerbuild import (
     GlueDockerProperties,
 )
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+GLUE_JOB_SCHEMA = Schema(
+    {
+        "glue_version": ["pythonshell", "glueetl"],
+        "root": str,
+        "source_folder": str,
+        "role": RoleResource,
+        "temp_uri": str,
+        "default_args?": dict,
+        "max_retries?": int,
+        "max_concurrent_runs?": int,
+        "timeout_minutes?": int,
+        "job_bookmark?": ["enable", "disable", "pause"],
+        "worker_type?": ["STANDARD", "G_025_X", "G_1_X", "G_2_X", "Z_2_X"],
+        "worker_count?": int,
+        "max_capacity?": (int, float),
+        "build_deps?": bool,
+    }
+)
 
 
 @dataclass
@@ -45,53 +63,17 @@ class GlueJobResource(Resource):
     max_capacity: float
     default_args: Optional[Dict[str, str]] = None
     build_deps: bool = True
+    docker_props: Optional[GlueDockerProperties] = None
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "glue_version": str,
-            "root": str,
-            "source_folder": str,
-            "role": RoleResource,
-            "temp_uri": str,
-            "default_args?": dict,
-            "max_retries?": int,
-            "max_concurrent_runs?": int,
-            "timeout_minutes?": int,
-            "job_bookmark?": str,
-            "worker_type?": str,
-            "worker_count?": int,
-            "max_capacity?": float,
-            "build_deps?": bool,
-        }
-
-        type_validation(pydict_map, pydict)
+        GLUE_JOB_SCHEMA.validate(pydict)
 
         if not path.isdir(pydict["source_folder"]):
             raise NotADirectoryError(
                 f"Folder not found: {pydict['source_folder']}"
             )
 
-        allowed_glue_versions = [
-            "pythonshell",
-            "glueetl",
-        ]
-
-        if pydict["glue_version"] not in allowed_glue_versions:
-            raise ValueError(
-                f"Invalid glue version, expected one of {allowed_glue_versions}"
-            )
-
-        allowed_job_bookmarks = ["enable", "disable", "pause"]
-
-        if (
-            pydict.get("job_bookmark")
-            and pydict["job_bookmark"] not in allowed_job_bookmarks
-        ):
-            raise ValueError(
-                f"Invalid job bookmark, expected one of {allowed_job_bookmarks}"
-            )
-
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "GlueJobResource":
         GlueJobResource.__pydict_validation(pydict)
@@ -124,13 +106,12 @@ class GlueJobResource(Resource):
             "glueetl": self.__glueetl_executable,
         }
 
-        docker_builder = DockerBuilder(
-            root_path=self.root,
-            module_path=path.join(self.source_folder),
-        )
+        docker_builder = self.get_docker_builder()
 
         docker_props: GlueDockerProperties
-        if self.build_deps:
+        if self.docker_props:
+            docker_props = self.docker_props
+        elif self.build_deps:
             docker_props = docker_builder.build(DockerBuilderMethod.GLUE)  # type: ignore
         else:
             docker_props = docker_builder.get_properties(
@@ -148,8 +129,9 @@ class GlueJobResource(Resource):
             for key, value in self.default_args.items():
                 default_args[f"--{key}"] = value
 
-        random_id = "a" + str(uuid4())[0:8]
-        role = iam_.Role.from_role_arn(scope, random_id, self.role.arn)
+        role = iam_.Role.from_role_arn(
+            scope, f"{self.name.value}-imported-role", self.role.arn
+        )
 
         job = glue_.Job(
             scope,
@@ -167,12 +149,21 @@ class GlueJobResource(Resource):
         for tag_key, tag_value in self.tags.items:
             AwsTags.of(job).add(tag_key, tag_value)
 
+    def get_docker_builder(self) -> DockerBuilder:
+        return DockerBuilder(
+            root_path=self.root,
+            module_path=path.join(self.source_folder),
+            shared_layers=True,
+        )
+
     def __pythonshell_executable(
         self, build_props: GlueDockerProperties
     ) -> Tuple[glue_.JobExecutable, Dict[str, Any]]:
         executable_kwargs: Dict[str, Any] = {}
         executable_kwargs["extra_python_files"] = [
-            glue_.Code.from_asset(build_props.dependencies_zip)
+            glue_.Code.from_asset(zip_path)
+            for zip_path in [build_props.dependencies_zip]
+            + build_props.shared_zips
         ]
 
         executable = glue_.JobExecutable.python_shell(
@@ -190,7 +181,9 @@ class GlueJobResource(Resource):
     ) -> Tuple[glue_.JobExecutable, Dict[str, Any]]:
         executable_kwargs: Dict[str, Any] = {}
         executable_kwargs["extra_python_files"] = [
-            glue_.Code.from_asset(build_props.dependencies_zip)
+            glue_.Code.from_asset(zip_path)
+            for zip_path in [build_props.dependencies_zip]
+            + build_props.shared_zips
         ]
         executable_kwargs["extra_jars"] = [
             glue_.Code.from_asset(j) for j in build_props.extra_jars_built
@@ -12,7 +12,19 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+ROLE_SCHEMA = Schema(
+    {
+        "region": str,
+        "account_id": str,
+        "assumed_by": str,
+        "effect": ["allow", "deny"],
+        "actions": list,
+        "resources?": list,
+        "managed_policies?": list,
+    }
+)
 
 
 @dataclass
@@ -29,20 +41,7 @@ class RoleResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "region": str,
-            "account_id": str,
-            "assumed_by": str,
-            "effect": str,
-            "actions": list,
-            "resources?": list,
-            "managed_policies?": list,
-        }
-
-        type_validation(pydict_map, pydict)
-
-        if pydict["effect"] not in ["allow", "deny"]:
-            raise ValueError("Invalid effect, expected allow or deny")
+        ROLE_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "RoleResource":
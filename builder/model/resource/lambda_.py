@@ -1,11 +1,11 @@
 from dataclasses import dataclass
+from enum import Enum
 from os import path
 from typing import (
     Any,
     Dict,
     Optional,
 )
-from uuid import uuid4
 
 from aws_cdk import Duration
 from aws_cdk import Tags as AwsTags
@@ -18,14 +18,47 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.model.resource.iam_role import RoleResource
+from builder.model.resource.lambda_layer import LambdaLayerResource
 from builder.model.resource.vpc import VpcResource
+from builder.utils.archive import source_date_epoch
 from builder.utils.dockerbuild import (
     DockerBuilder,
     DockerBuilderMethod,
     LambdaDockerProperties,
 )
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+
+class LambdaPackageType(Enum):
+    IMAGE = "image"
+    ZIP = "zip"
+
+
+LAMBDA_SCHEMA = Schema(
+    {
+        "region": str,
+        "account_id": str,
+        "role": RoleResource,
+        "root": str,
+        "source_folder": str,
+        "timeout?": int,
+        "memory_size?": int,
+        "environment?": dict,
+        "vpc?": VpcResource,
+        "vpc_subnet?": ["public", "private"],
+        "build_deps?": bool,
+        "package_type?": [t.value for t in LambdaPackageType],
+        "optimize?": [0, 1, 2],
+    },
+    checks=[
+        lambda pydict: (
+            ["vpc_subnet must be specified if vpc is specified"]
+            if pydict.get("vpc") and not pydict.get("vpc_subnet")
+            else []
+        )
+    ],
+)
 
 
 @dataclass
@@ -43,24 +76,13 @@ class LambdaResource(Resource):
     vpc: Optional[VpcResource] = None
     vpc_subnets: Optional[str] = None
     build_deps: bool = True
+    package_type: LambdaPackageType = LambdaPackageType.IMAGE
+    optimize: int = 0
+    docker_props: Optional[LambdaDockerProperties] = None
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "region": str,
-            "account_id": str,
-            "role": RoleResource,
-            "root": str,
-            "source_folder": str,
-            "timeout?": int,
-            "memory_size?": int,
-            "environment?": dict,
-            "vpc?": VpcResource,
-            "vpc_subnet?": str,
-            "build_deps?": bool,
-        }
-
-        type_validation(pydict_map, pydict)
+        LAMBDA_SCHEMA.validate(pydict)
 
         if not path.isdir(pydict["source_folder"]):
             raise NotADirectoryError(
@@ -74,20 +96,6 @@ class LambdaResource(Resource):
                 f"File not found: {path.join(pydict['source_folder'], 'src', 'index.py')}"
             )
 
-        if pydict.get("vpc"):
-            if not pydict.get("vpc_subnet"):
-                raise ValueError(
-                    "vpc_subnet must be specified if vpc is specified"
-                )
-
-            if pydict["vpc_subnet"] not in [
-                "public",
-                "private",
-            ]:
-                raise ValueError(
-                    "vpc_subnet must be either 'public' or 'private'"
-                )
-
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "LambdaResource":
         LambdaResource.__pydict_validation(pydict)
@@ -102,6 +110,10 @@ class LambdaResource(Resource):
             "memory_size": pydict.get("memory_size", 512),
             "environment": pydict.get("environment", {}),
             "build_deps": pydict.get("build_deps", True),
+            "package_type": LambdaPackageType(
+                pydict.get("package_type") or "image"
+            ),
+            "optimize": pydict.get("optimize", 0),
         }
 
         if pydict.get("vpc"):
@@ -119,52 +131,117 @@ class LambdaResource(Resource):
         return LambdaResource(name=name, tags=tags, **props)
 
     def add_to_cdk(self, scope: Construct, cache: StackCache) -> None:
-        random_id = "a" + str(uuid4())[0:8]
-        role = iam_.Role.from_role_arn(scope, random_id, self.role.arn)
-
-        docker_builder = DockerBuilder(
-            root_path=self.root,
-            module_path=path.join(self.source_folder),
+        role = iam_.Role.from_role_arn(
+            scope, f"{self.name.value}-imported-role", self.role.arn
         )
 
+        docker_builder = self.get_docker_builder()
+
         docker_props: LambdaDockerProperties
-        if self.build_deps:
+        if self.docker_props:
+            docker_props = self.docker_props
+        elif self.build_deps:
             docker_props = docker_builder.build(DockerBuilderMethod.LAMBDA)  # type: ignore
         else:
             docker_props = docker_builder.get_properties(
                 DockerBuilderMethod.LAMBDA
             )  # type: ignore
 
-        code = lambda_.DockerImageCode.from_image_asset(
-            directory=docker_props.root,
-            file=docker_props.dockerfile,
-            build_args={
-                "REQUIREMENTS": docker_props.requirements,
-                "SHARED_MODULES": docker_props.shared,
-                "SOURCE_FOLDER": docker_props.source,
-            },
-        )
-
         props: Dict[str, Any] = {
             "function_name": self.name.value,
             "role": role,
-            "code": code,
             "timeout": self.timeout,
             "memory_size": self.memory_size,
             "environment": self.environment,
         }
 
+        # precompiled bytecode is only used at the matching optimization level
+        if self.optimize:
+            props["environment"] = {
+                **self.environment,
+                "PYTHONOPTIMIZE": str(self.optimize),
+            }
+
         if self.vpc:
             props["vpc"] = cache.get(self.vpc.name.value)
             props["vpc_subnets"] = self.vpc_subnets
 
-        func = lambda_.DockerImageFunction(scope, self.name.value, **props)
+        func: lambda_.Function
+        if self.package_type == LambdaPackageType.ZIP:
+            func = lambda_.Function(
+                scope,
+                self.name.value,
+                code=lambda_.Code.from_asset(
+                    docker_builder.get_lambda_package(
+                        docker_props, self.optimize
+                    )
+                ),
+                handler="index.handler",
+                runtime=lambda_.Runtime.PYTHON_3_9,
+                layers=[
+                    self.__get_layer(scope, cache, module, layer_zip)
+                    for module, layer_zip in docker_props.layers.items()
+                ],
+                **props,
+            )
+        else:
+            func = lambda_.DockerImageFunction(
+                scope,
+                self.name.value,
+                code=lambda_.DockerImageCode.from_image_asset(
+                    directory=docker_props.root,
+                    file=docker_props.dockerfile,
+                    build_args={
+                        "BUNDLE": docker_props.bundle,
+                        "SOURCE_FOLDER": docker_props.source,
+                        "OPTIMIZE": str(self.optimize),
+                        "SOURCE_DATE_EPOCH": str(source_date_epoch()),
+                    },
+                    exclude=docker_props.get_excludes(),
+                ),
+                **props,
+            )
 
         for tag_key, tag_value in self.tags.items:
             AwsTags.of(func).add(tag_key, tag_value)
 
         cache.add(self.name.value, func)
 
+    def get_docker_builder(self) -> DockerBuilder:
+        # container images cannot use layers, so only zip functions
+        # attach shared modules by reference
+        if self.package_type == LambdaPackageType.ZIP:
+            return DockerBuilder(
+                root_path=self.root,
+                module_path=path.join(self.source_folder),
+                shared_layers=True,
+            )
+
+        return DockerBuilder(
+            root_path=self.root,
+            module_path=path.join(self.source_folder),
+            lambda_base=self.optimize,
+        )
+
+    def __get_layer(
+        self, scope: Construct, cache: StackCache, module: str, layer_zip: str
+    ) -> lambda_.ILayerVersion:
+        layer_name = Name(f"shared-{module}", self.name.env)
+
+        # each stack publishes its own version of the layer, a layer shared
+        # through exports could not be replaced while other stacks import it
+        layer = scope.node.try_find_child(layer_name.value)
+        if layer:
+            return layer  # type: ignore
+
+        LambdaLayerResource.from_pydict(
+            name=layer_name,
+            tags=self.tags,
+            pydict={"code_path": layer_zip},
+        ).add_to_cdk(scope, cache)
+
+        return cache.get(layer_name.value)
+
     @property
     def arn(self) -> str:
         return f"arn:aws:lambda:{self.region}:{self.account_id}:function:{self.name.value}"
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from os import path
+
+from aws_cdk import Tags as AwsTags
+from aws_cdk import aws_lambda as lambda_
+from constructs import Construct
+
+from builder.model.property.name import Name
+from builder.model.property.tags import Tags
+from builder.model.resource.abstract import Resource
+from builder.utils.stack_cache import StackCache
+from builder.utils.validation import Schema
+
+LAMBDA_LAYER_SCHEMA = Schema(
+    {
+        "code_path": str,
+    }
+)
+
+
+@dataclass
+class LambdaLayerResource(Resource):
+    name: Name
+    tags: Tags
+    code_path: str
+
+    @staticmethod
+    def __pydict_validation(pydict: dict) -> None:
+        LAMBDA_LAYER_SCHEMA.validate(pydict)
+
+        if not path.exists(pydict["code_path"]):
+            raise FileNotFoundError(f"File not found: {pydict['code_path']}")
+
+    @staticmethod
+    def from_pydict(
+        name: Name, tags: Tags, pydict: dict
+    ) -> "LambdaLayerResource":
+        LambdaLayerResource.__pydict_validation(pydict)
+
+        return LambdaLayerResource(
+            name=name,
+            tags=tags,
+            code_path=pydict["code_path"],
+        )
+
+    def add_to_cdk(self, scope: Construct, cache: StackCache) -> None:
+        layer = lambda_.LayerVersion(
+            scope,
+            self.name.value,
+            layer_version_name=self.name.value,
+            code=lambda_.Code.from_asset(self.code_path),
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_9],
+        )
+
+        for tag_key, tag_value in self.tags.items:
+            AwsTags.of(layer).add(tag_key, tag_value)
+
+        cache.add(self.name.value, layer)
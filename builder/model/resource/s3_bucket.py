@@ -9,7 +9,13 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+S3_BUCKET_SCHEMA = Schema(
+    {
+        "removal_policy?": ["retain", "destroy", "snapshot"],
+    }
+)
 
 
 @dataclass
@@ -20,20 +26,7 @@ class S3BucketResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "removal_policy?": str,
-        }
-
-        type_validation(pydict_map, pydict)
-
-        if pydict.get("removal_policy", "destroy") not in [
-            "retain",
-            "destroy",
-            "snapshot",
-        ]:
-            raise ValueError(
-                "Invalid removal_policy, expected retain, destroy or snapshot"
-            )
+        S3_BUCKET_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "S3BucketResource":
@@ -10,7 +10,17 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+S3_NOTIFICATION_SCHEMA = Schema(
+    {
+        "bucket": Name,
+        "lambda": Name,
+        "event_type": str,
+        "prefix?": str,
+        "suffix?": str,
+    }
+)
 
 
 @dataclass
@@ -25,15 +35,7 @@ class S3NotificationResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "bucket": Name,
-            "lambda": Name,
-            "event_type": str,
-            "prefix?": str,
-            "suffix?": str,
-        }
-
-        type_validation(pydict_map, pydict)
+        S3_NOTIFICATION_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
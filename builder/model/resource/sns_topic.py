@@ -13,7 +13,16 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+SNS_TOPIC_SCHEMA = Schema(
+    {
+        "region": str,
+        "account_id": str,
+        "display_name": str,
+        "subscriptions": list,
+    }
+)
 
 
 @dataclass
@@ -35,14 +44,7 @@ class SnsTopicResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "region": str,
-            "account_id": str,
-            "display_name": str,
-            "subscriptions": list,
-        }
-
-        type_validation(pydict_map, pydict)
+        SNS_TOPIC_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "SnsTopicResource":
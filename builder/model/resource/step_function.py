@@ -21,7 +21,7 @@ from builder.model.resource.glue_job import GlueJobResource
 from builder.model.resource.iam_role import RoleResource
 from builder.model.resource.lambda_ import LambdaResource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
 
 
 @dataclass
@@ -143,6 +143,15 @@ class ChoiceStepProps(StepProps):
         }
 
 
+STEP_FUNCTION_SCHEMA = Schema(
+    {
+        "role": RoleResource,
+        "steps": list,
+        "catch_lambda": LambdaResource,
+    }
+)
+
+
 @dataclass
 class StepFunctionResource(Resource):
     name: Name
@@ -152,13 +161,7 @@ class StepFunctionResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "role": RoleResource,
-            "steps": list,
-            "catch_lambda": LambdaResource,
-        }
-
-        type_validation(pydict_map, pydict)
+        STEP_FUNCTION_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
@@ -26,7 +26,7 @@ class TestEventRuleResouce(unittest.TestCase):
         self.name = Name("test-event-rule", Environment.TEST)
 
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.region = "us-east-1"
         self.account_id = "1234567890"
@@ -21,7 +21,7 @@ class TestGlueCrawlerResource(unittest.TestCase):
 
         self.name = Name("test-glue-crawler", Environment.TEST)
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.role_name = Name("test-role", Environment.TEST)
         self.role = RoleResource.from_pydict(
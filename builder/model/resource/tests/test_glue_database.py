@@ -19,7 +19,7 @@ class TestGlueDatabaseResource(unittest.TestCase):
 
         self.name = Name("test-glue-database", Environment.TEST)
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.catalog_id = "1234567890"
         self.location_uri = "s3://test-bucket/test-prefix"
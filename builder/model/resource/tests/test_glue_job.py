@@ -28,7 +28,7 @@ class TestGlueJobResource(unittest.TestCase):
         self.region = "us-east-1"
         self.account_id = "1234567890"
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.role = RoleResource.from_pydict(
             name=self.name,
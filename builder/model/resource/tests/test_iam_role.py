@@ -21,7 +21,7 @@ class TestRoleResource(unittest.TestCase):
         self.region = "us-east-1"
         self.account_id = "1234567890"
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.effect = "allow"
         self.actions = ["s3:*"]
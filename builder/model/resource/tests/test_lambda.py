@@ -12,8 +12,12 @@ from builder.model.property.environment import Environment
 from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.iam_role import RoleResource
-from builder.model.resource.lambda_ import LambdaResource
+from builder.model.resource.lambda_ import (
+    LambdaPackageType,
+    LambdaResource,
+)
 from builder.model.resource.vpc import VpcResource
+from builder.utils.dockerbuild import DockerBuilderMethod
 from builder.utils.stack_cache import StackCache
 
 
@@ -28,7 +32,7 @@ class TestLambdaResource(unittest.TestCase):
         self.region = "us-east-1"
         self.account_id = "1234567890"
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.timeout = Duration.seconds(30)
         self.memory_size = 256
@@ -105,6 +109,29 @@ class TestLambdaResource(unittest.TestCase):
         self.assertEqual(func.memory_size, 512)
         self.assertEqual(func.environment, self.environment)
         self.assertEqual(func.vpc, self.vpc)
+        self.assertEqual(func.package_type, LambdaPackageType.IMAGE)
+
+    def test_from_pydict_package_type(self) -> None:
+        pydict = {
+            "region": self.region,
+            "account_id": self.account_id,
+            "role": self.role,
+            "root": self.root,
+            "source_folder": self.source_folder,
+            "package_type": "zip",
+            "optimize": 2,
+        }
+        func = LambdaResource.from_pydict(
+            name=self.name, tags=self.tags, pydict=pydict
+        )
+        self.assertEqual(func.package_type, LambdaPackageType.ZIP)
+        self.assertEqual(func.optimize, 2)
+
+        pydict["package_type"] = "jar"
+        with self.assertRaises(ValueError):
+            LambdaResource.from_pydict(
+                name=self.name, tags=self.tags, pydict=pydict
+            )
 
     def test_add_to_cdk(self) -> None:
         app = App()
@@ -136,3 +163,92 @@ class TestLambdaResource(unittest.TestCase):
                 "PackageType": "Image",
             },
         )
+
+    def test_add_to_cdk_zip(self) -> None:
+        app = App()
+        stack = Stack(app, "test-stack")
+
+        func = LambdaResource(
+            name=self.name,
+            tags=self.tags,
+            region=self.region,
+            account_id=self.account_id,
+            role=self.role,
+            root=self.root,
+            source_folder=self.source_folder,
+            timeout=self.timeout,
+            memory_size=self.memory_size,
+            environment=self.environment,
+            build_deps=False,
+            package_type=LambdaPackageType.ZIP,
+        )
+
+        func.add_to_cdk(scope=stack, cache=self.cache)
+
+        template = Template.from_stack(stack)
+
+        template.resource_count_is("AWS::Lambda::Function", 1)
+        template.has_resource_properties(
+            "AWS::Lambda::Function",
+            {
+                "FunctionName": self.name.value,
+                "Handler": "index.handler",
+                "Runtime": "python3.9",
+            },
+        )
+
+    def test_add_to_cdk_layers(self) -> None:
+        app = App()
+        stacks = [Stack(app, "test-stack-1"), Stack(app, "test-stack-2")]
+
+        for stack in stacks:
+            for function in ["a", "b"]:
+                func = LambdaResource(
+                    name=self.name.add_suffix(f"{stack.node.id}-{function}"),
+                    tags=self.tags,
+                    region=self.region,
+                    account_id=self.account_id,
+                    role=self.role,
+                    root=self.root,
+                    source_folder=self.source_folder,
+                    timeout=self.timeout,
+                    memory_size=self.memory_size,
+                    environment=self.environment,
+                    build_deps=False,
+                    package_type=LambdaPackageType.ZIP,
+                )
+                docker_props = func.get_docker_builder().get_properties(
+                    DockerBuilderMethod.LAMBDA
+                )
+                docker_props.layers = {"module": self.source_folder}  # type: ignore
+                func.docker_props = docker_props  # type: ignore
+                func.add_to_cdk(scope=stack, cache=self.cache)
+
+        # every stack publishes the layer its functions use, nothing is
+        # exported between stacks
+        for stack in stacks:
+            template = Template.from_stack(stack)
+            template.resource_count_is("AWS::Lambda::LayerVersion", 1)
+            self.assertNotIn("Outputs", template.to_json())
+
+    def test_add_to_cdk_deterministic(self) -> None:
+        templates = []
+        for _ in range(2):
+            stack = Stack(App(), "test-stack")
+            LambdaResource(
+                name=self.name,
+                tags=self.tags,
+                region=self.region,
+                account_id=self.account_id,
+                role=self.role,
+                root=self.root,
+                source_folder=self.source_folder,
+                timeout=self.timeout,
+                memory_size=self.memory_size,
+                environment=self.environment,
+                build_deps=False,
+                package_type=LambdaPackageType.ZIP,
+            ).add_to_cdk(scope=stack, cache=self.cache)
+            templates.append(Template.from_stack(stack).to_json())
+
+        self.assertEqual(templates[0], templates[1])
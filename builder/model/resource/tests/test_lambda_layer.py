@@ -0,0 +1,69 @@
+import unittest
+from os import path
+
+from aws_cdk import (
+    App,
+    Stack,
+)
+from aws_cdk.assertions import Template
+
+from builder.model.property.environment import Environment
+from builder.model.property.name import Name
+from builder.model.property.tags import Tags
+from builder.model.resource.lambda_layer import LambdaLayerResource
+from builder.utils.stack_cache import StackCache
+
+
+class TestLambdaLayerResource(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = StackCache()
+
+        self.name = Name("test-layer", Environment.TEST)
+        self.tags = Tags()
+        self.tags = self.tags.add("tag1", "value1")
+
+        self.code_path = path.join(
+            path.dirname(path.abspath(__file__)), "mock", "code", "src"
+        )
+
+    def test_from_pydict(self) -> None:
+        layer = LambdaLayerResource.from_pydict(
+            name=self.name,
+            tags=self.tags,
+            pydict={"code_path": self.code_path},
+        )
+
+        self.assertEqual(layer.name, self.name)
+        self.assertEqual(layer.tags, self.tags)
+        self.assertEqual(layer.code_path, self.code_path)
+
+    def test_from_pydict_missing_code(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            LambdaLayerResource.from_pydict(
+                name=self.name,
+                tags=self.tags,
+                pydict={"code_path": path.join(self.code_path, "missing")},
+            )
+
+    def test_add_to_cdk(self) -> None:
+        app = App()
+        stack = Stack(app, "test-stack")
+
+        layer = LambdaLayerResource.from_pydict(
+            name=self.name,
+            tags=self.tags,
+            pydict={"code_path": self.code_path},
+        )
+        layer.add_to_cdk(scope=stack, cache=self.cache)
+
+        template = Template.from_stack(stack)
+
+        template.resource_count_is("AWS::Lambda::LayerVersion", 1)
+        template.has_resource_properties(
+            "AWS::Lambda::LayerVersion",
+            {
+                "LayerName": self.name.value,
+                "CompatibleRuntimes": ["python3.9"],
+            },
+        )
+        self.assertIsNotNone(self.cache.get(self.name.value))
@@ -19,7 +19,7 @@ class TestS3BucketResource(unittest.TestCase):
         self.cache = StackCache()
         self.name = Name("test-s3-bucket", Environment.TEST)
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
         self.removal_policy = RemovalPolicy.DESTROY
 
     def test_init(self) -> None:
@@ -24,7 +24,7 @@ class TestSnsTopicResource(unittest.TestCase):
 
         self.name = Name("test-sns-topic", Environment.TEST)
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.region = "us-east-1"
         self.account_id = "1234567890"
@@ -19,7 +19,7 @@ class TestVpcResource(unittest.TestCase):
         self.cache = StackCache()
         self.name = Name("test-vpc", Environment.TEST)
         self.tags = Tags()
-        self.tags.add("tag1", "value1")
+        self.tags = self.tags.add("tag1", "value1")
 
         self.cidr = ec2_.IpAddresses.cidr("192.168.228.0/22")
         self.default_instance_tenancy = ec2_.DefaultInstanceTenancy.DEFAULT
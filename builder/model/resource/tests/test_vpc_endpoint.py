@@ -21,7 +21,7 @@ class TestVpcEndpointResource(unittest.TestCase):
         self.name = Name("test-vpc", Environment.TEST)
         self.vpc_name = Name("test-vpc", Environment.TEST)
         self.vpc_tags = Tags()
-        self.vpc_tags.add("tag1", "value1")
+        self.vpc_tags = self.vpc_tags.add("tag1", "value1")
 
         self.vpc = VpcResource.from_pydict(
             name=self.vpc_name,
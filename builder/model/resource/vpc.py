@@ -9,7 +9,16 @@ from builder.model.property.name import Name
 from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+VPC_SCHEMA = Schema(
+    {
+        "cidr": str,
+        "max_azs?": int,
+        "enable_dns_hostnames?": bool,
+        "enable_dns_support?": bool,
+    }
+)
 
 
 @dataclass
@@ -25,14 +34,7 @@ class VpcResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "cidr": str,
-            "max_azs?": int,
-            "enable_dns_hostnames?": bool,
-            "enable_dns_support?": bool,
-        }
-
-        type_validation(pydict_map, pydict)
+        VPC_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(name: Name, tags: Tags, pydict: dict) -> "VpcResource":
@@ -8,7 +8,14 @@ from builder.model.property.tags import Tags
 from builder.model.resource.abstract import Resource
 from builder.model.resource.vpc import VpcResource
 from builder.utils.stack_cache import StackCache
-from builder.utils.validation import type_validation
+from builder.utils.validation import Schema
+
+VPC_ENDPOINT_SCHEMA = Schema(
+    {
+        "service": str,
+        "vpc": VpcResource,
+    }
+)
 
 
 @dataclass
@@ -20,12 +27,7 @@ class VpcEndpointResource(Resource):
 
     @staticmethod
     def __pydict_validation(pydict: dict) -> None:
-        pydict_map = {
-            "service": str,
-            "vpc": VpcResource,
-        }
-
-        type_validation(pydict_map, pydict)
+        VPC_ENDPOINT_SCHEMA.validate(pydict)
 
     @staticmethod
     def from_pydict(
@@ -0,0 +1,65 @@
+from os import (
+    X_OK,
+    access,
+    environ,
+    path,
+    replace,
+    walk,
+)
+from time import gmtime
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+from zipfile import (
+    ZIP_DEFLATED,
+    ZipFile,
+    ZipInfo,
+)
+
+# earliest timestamp a zip entry can hold, 1980-01-01 00:00:00 UTC
+ZIP_EPOCH = 315532800
+
+
+def source_date_epoch() -> int:
+    return max(int(environ.get("SOURCE_DATE_EPOCH", ZIP_EPOCH)), ZIP_EPOCH)
+
+
+def zip_folders(folders: List[str], zip_path: str, prefix: str = "") -> None:
+    temp_zip = f"{zip_path}.tmp"
+    date_time: Tuple[int, int, int, int, int, int] = gmtime(
+        source_date_epoch()
+    )[0:6]
+
+    # files from the first folders take precedence over later ones
+    entries: Dict[str, str] = {}
+    for folder in folders:
+        for current, _, filenames in walk(folder):
+            for filename in filenames:
+                file_path = path.join(current, filename)
+                arcname = path.join(
+                    prefix, path.relpath(file_path, folder)
+                ).replace("\\", "/")
+                entries.setdefault(arcname, file_path)
+
+    # sorted entries, fixed timestamps and permissions keep the zip
+    # byte-identical for identical inputs
+    with ZipFile(temp_zip, "w", ZIP_DEFLATED) as zip_file:
+        for arcname in sorted(entries):
+            file_path = entries[arcname]
+            mode = 0o755 if access(file_path, X_OK) else 0o644
+
+            info = ZipInfo(arcname, date_time=date_time)
+            info.compress_type = ZIP_DEFLATED
+            info.external_attr = (0o100000 | mode) << 16
+            info.create_system = 3
+
+            with open(file_path, "rb") as f:
+                zip_file.writestr(info, f.read(), compresslevel=9)
+
+    replace(temp_zip, zip_path)
+
+
+def zip_folder(folder: str, zip_path: str) -> None:
+    zip_folders([folder], zip_path)
@@ -0,0 +1,77 @@
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from os import cpu_count
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from builder.utils.dockerbuild import (
+    DockerBuilder,
+    DockerBuilderMethod,
+    GlueDockerProperties,
+    LambdaDockerProperties,
+)
+
+BuildKey = Tuple[str, DockerBuilderMethod]
+BuildResult = Union[LambdaDockerProperties, GlueDockerProperties]
+
+
+@dataclass
+class BuildScheduler:
+    max_workers: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.max_workers is None:
+            self.max_workers = cpu_count() or 1
+
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be greater than zero")
+
+        self._builders: Dict[BuildKey, DockerBuilder] = {}
+        self._results: Dict[BuildKey, BuildResult] = {}
+
+    def add(
+        self, builder: DockerBuilder, method: DockerBuilderMethod
+    ) -> BuildKey:
+        key = (builder.assets_path, method)
+        self._builders.setdefault(key, builder)
+        return key
+
+    def run(self) -> Dict[BuildKey, BuildResult]:
+        pending = {
+            key: builder
+            for key, builder in self._builders.items()
+            if key not in self._results
+        }
+
+        if not pending:
+            return self._results
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: Dict[Future, BuildKey] = {
+                executor.submit(builder.build, key[1]): key
+                for key, builder in pending.items()
+            }
+
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+            for future in done:
+                self._results[futures[future]] = future.result()
+
+        return self._results
+
+    def get(self, key: BuildKey) -> BuildResult:
+        if key not in self._results:
+            raise KeyError(f'Module "{key[0]}" has not been built.')
+
+        return self._results[key]
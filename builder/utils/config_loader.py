@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from hashlib import sha256
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from pickle import (  # nosec
+    HIGHEST_PROTOCOL,
+    UnpicklingError,
+    dump,
+    load,
+)
+from tempfile import mkstemp
+from typing import (
+    List,
+    Optional,
+)
+
+from yaml import load as load_yaml
+
+from builder.model.config.pipeline import PipelineConfig
+from builder.model.property.environment import Environment
+from builder.utils.fingerprint import Fingerprint
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
+MODEL_PATH = path.join(
+    path.dirname(path.dirname(path.abspath(__file__))), "model"
+)
+VALIDATION_PATH = path.join(
+    path.dirname(path.abspath(__file__)), "validation.py"
+)
+
+
+@dataclass
+class PipelineConfigLoader:
+    env: Environment
+    cache_path: str
+    max_workers: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # cached configs are dropped whenever the config model changes
+        self.model_fingerprint = (
+            Fingerprint(MODEL_PATH)
+            .add_folder(MODEL_PATH)
+            .add_file(VALIDATION_PATH)
+            .value
+        )
+
+    def __get_cache_path(self, content: bytes) -> str:
+        key = sha256()
+        key.update(self.model_fingerprint.encode())
+        key.update(self.env.value.encode())
+        key.update(content)
+
+        return path.join(self.cache_path, f"{key.hexdigest()}.pickle")
+
+    def __read_cache(self, cache_path: str) -> Optional[PipelineConfig]:
+        if not path.isfile(cache_path):
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                config = load(f)  # nosec
+        except (EOFError, UnpicklingError, AttributeError, ImportError):
+            return None
+
+        return config if isinstance(config, PipelineConfig) else None
+
+    def __write_cache(self, cache_path: str, config: PipelineConfig) -> None:
+        makedirs(self.cache_path, exist_ok=True)
+        handle, temp_cache = mkstemp(dir=self.cache_path)
+        with open(handle, "wb") as f:
+            dump(config, f, protocol=HIGHEST_PROTOCOL)
+        replace(temp_cache, cache_path)
+
+    def __load(self, config_path: str) -> PipelineConfig:
+        with open(config_path, "rb") as f:
+            content = f.read()
+
+        cache_path = self.__get_cache_path(content)
+        config = self.__read_cache(cache_path)
+        if config:
+            return config
+
+        config = PipelineConfig.from_pydict(
+            self.env, load_yaml(content, Loader=SafeLoader)
+        )
+        self.__write_cache(cache_path, config)
+
+        return config
+
+    def load(self, config_paths: List[str]) -> List[PipelineConfig]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.__load, config_paths))
@@ -0,0 +1,222 @@
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from hashlib import sha256
+from json import (
+    dump,
+    load,
+)
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+STATE_PATH = path.join(".builder_cache", "deployed_stacks.json")
+
+STACK_ARTIFACT = "aws:cloudformation:stack"
+ASSET_ARTIFACT = "cdk:asset-manifest"
+
+
+@dataclass
+class StackGraph:
+    dependencies: Dict[str, List[str]]
+    digests: Dict[str, str]
+
+    @staticmethod
+    def from_assembly(outdir: str) -> "StackGraph":
+        with open(path.join(outdir, "manifest.json"), "r") as f:
+            artifacts: Dict[str, Any] = load(f).get("artifacts", {})
+
+        dependencies: Dict[str, List[str]] = {}
+        digests: Dict[str, str] = {}
+        for stack_id, artifact in artifacts.items():
+            if artifact["type"] != STACK_ARTIFACT:
+                continue
+
+            # asset manifests are dependencies as well, only stacks are kept
+            # and their asset manifests are part of the stack digest
+            files = [artifact["properties"]["templateFile"]]
+            dependencies[stack_id] = []
+            for dependency in artifact.get("dependencies", []):
+                dependency_type = artifacts.get(dependency, {}).get("type")
+                if dependency_type == STACK_ARTIFACT:
+                    dependencies[stack_id].append(dependency)
+                elif dependency_type == ASSET_ARTIFACT:
+                    files.append(artifacts[dependency]["properties"]["file"])
+
+            digest = sha256()
+            for file_name in files:
+                digest.update(file_name.encode())
+                with open(path.join(outdir, file_name), "rb") as f:
+                    digest.update(f.read())
+            digests[stack_id] = digest.hexdigest()
+
+        for stack_id, stack_dependencies in dependencies.items():
+            missing = [d for d in stack_dependencies if d not in dependencies]
+            if missing:
+                raise ValueError(
+                    f'Stack "{stack_id}" depends on unknown stacks: {", ".join(missing)}.'
+                )
+
+        return StackGraph(dependencies=dependencies, digests=digests)
+
+    def changed(self, previous: Dict[str, str]) -> List[str]:
+        return [
+            stack_id
+            for stack_id in self.dependencies
+            if previous.get(stack_id) != self.digests[stack_id]
+        ]
+
+    def waves(self, stack_ids: List[str]) -> List[List[str]]:
+        selected = set(stack_ids)
+        depths: Dict[str, int] = {}
+        visiting: Set[str] = set()
+
+        # the depth of a stack is the longest chain of selected stacks it
+        # depends on, following unselected stacks in between, so stacks
+        # deployed with --exclusively still go after what they depend on
+        def depth(stack_id: str) -> int:
+            if stack_id in depths:
+                return depths[stack_id]
+
+            if stack_id in visiting:
+                raise ValueError(f'Stack "{stack_id}" depends on itself.')
+
+            visiting.add(stack_id)
+            depths[stack_id] = max(
+                [
+                    depth(dependency) + int(dependency in selected)
+                    for dependency in self.dependencies[stack_id]
+                ],
+                default=0,
+            )
+            visiting.remove(stack_id)
+
+            return depths[stack_id]
+
+        waves: List[List[str]] = []
+        for stack_id in self.dependencies:
+            if stack_id not in selected:
+                continue
+
+            stack_depth = depth(stack_id)
+            while len(waves) <= stack_depth:
+                waves.append([])
+            waves[stack_depth].append(stack_id)
+
+        return [wave for wave in waves if wave]
+
+    def plan(self, previous: Dict[str, str]) -> Dict[str, Any]:
+        changed = self.changed(previous)
+        return {
+            "dependencies": self.dependencies,
+            "changed": changed,
+            "unchanged": [s for s in self.dependencies if s not in changed],
+            "removed": sorted(set(previous) - set(self.dependencies)),
+            "waves": self.waves(changed),
+        }
+
+
+def read_digests(previous_path: str) -> Dict[str, str]:
+    # the last deploy is either its cloud assembly or a saved state file
+    if path.isdir(previous_path):
+        return StackGraph.from_assembly(previous_path).digests
+
+    if not path.isfile(previous_path):
+        return {}
+
+    with open(previous_path, "r") as f:
+        return load(f)["stacks"]
+
+
+def write_digests(state_path: str, digests: Dict[str, str]) -> None:
+    makedirs(path.dirname(path.abspath(state_path)), exist_ok=True)
+    temp_state = f"{state_path}.tmp"
+    with open(temp_state, "w") as f:
+        dump({"stacks": digests}, f, indent=4)
+    replace(temp_state, state_path)
+
+
+def get_deploy_commands(
+    outdir: str, waves: List[List[str]], concurrency: Optional[int] = None
+) -> List[str]:
+    return [
+        " ".join(
+            [
+                "cdk",
+                "deploy",
+                "--app",
+                outdir,
+                "--exclusively",
+                "--require-approval",
+                "never",
+                "--concurrency",
+                str(min(len(wave), concurrency or len(wave))),
+            ]
+            + wave
+        )
+        for wave in waves
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(
+        description="Plan the deploy of the stacks that changed since the last deploy."
+    )
+    parser.add_argument("--outdir", default="cdk.out")
+    parser.add_argument(
+        "--previous",
+        default=STATE_PATH,
+        help="cloud assembly or state file of the last deploy",
+    )
+    parser.add_argument("--output", help="json file the plan is written to")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="stacks deployed at once, defaults to the size of each wave",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="record the cloud assembly as deployed in the --previous file",
+    )
+    args = parser.parse_args(argv)
+
+    graph = StackGraph.from_assembly(args.outdir)
+
+    if args.save:
+        if path.isdir(args.previous):
+            raise SystemExit(
+                f"{args.previous} is a cloud assembly, --save needs a state file"
+            )
+        write_digests(args.previous, graph.digests)
+        return
+
+    plan = graph.plan(read_digests(args.previous))
+    if args.output:
+        with open(args.output, "w") as f:
+            dump(plan, f, indent=4)
+
+    if plan["removed"]:
+        print(
+            f"Stacks no longer in the app, they are not destroyed: {', '.join(plan['removed'])}"
+        )
+
+    if not plan["waves"]:
+        print("No stack changed since the last deploy.")
+
+    for command in get_deploy_commands(
+        args.outdir, plan["waves"], args.concurrency
+    ):
+        print(command)
+
+
+if __name__ == "__main__":
+    main()
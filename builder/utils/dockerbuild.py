@@ -1,18 +1,89 @@
-from dataclasses import dataclass
+from compileall import compile_dir
+from dataclasses import (
+    dataclass,
+    field,
+)
 from enum import Enum
-from json import load
+from json import (
+    dump,
+    load,
+)
 from os import (
+    environ,
+    listdir,
     makedirs,
     path,
+    pathsep,
+    remove,
+    replace,
 )
 from platform import system
-from subprocess import check_call  # nosec
+from py_compile import PycInvalidationMode
+from re import split
+from shutil import (
+    copyfile,
+    copytree,
+    rmtree,
+)
+from subprocess import (  # nosec
+    check_call,
+    run,
+)
+from sys import (
+    executable,
+    version_info,
+)
+from tempfile import TemporaryDirectory
+from threading import Lock
+from time import perf_counter
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
-from uuid import uuid4
+from zipfile import ZipFile
+
+from builder.utils.archive import (
+    source_date_epoch,
+    zip_folder,
+    zip_folders,
+)
+from builder.utils.fingerprint import Fingerprint
+from builder.utils.importtime import (
+    importtime_report,
+    parse_importtime,
+)
+from builder.utils.jar_store import (
+    JarReference,
+    JarStore,
+)
+from builder.utils.lock import (
+    LockResolver,
+    is_locked,
+    merge_requirements,
+)
+from builder.utils.native_build import NativeBuilder
+from builder.utils.prune import (
+    DEFAULT_EXCLUDES,
+    LAMBDA_RUNTIME_PACKAGES,
+    LAMBDA_UNZIPPED_LIMIT,
+    Pruner,
+    folder_size,
+)
+from builder.utils.telemetry import (
+    BUILD_TELEMETRY,
+    ModuleTelemetry,
+)
+
+MEGABYTE = 1024 * 1024
+LAMBDA_RUNTIME_IMAGE = "public.ecr.aws/lambda/python:3.9"
+LAMBDA_PYTHON_VERSION = (3, 9)
+
+_BUILD_LOCKS: Dict[str, Lock] = {}
+_BUILD_LOCKS_GUARD = Lock()
 
 
 class DockerBuilderMethod(Enum):
@@ -20,16 +91,67 @@ class DockerBuilderMethod(Enum):
     GLUE = "glue"
 
 
+@dataclass
+class DockerBuilderOptions:
+    offline: bool = False
+    jar_store: str = path.join(
+        path.expanduser("~"), ".cache", "datalake-builder", "jars"
+    )
+    native: List[DockerBuilderMethod] = field(default_factory=list)
+    import_time: bool = False
+    lock: bool = False
+
+    @staticmethod
+    def from_environ() -> "DockerBuilderOptions":
+        defaults = DockerBuilderOptions()
+        return DockerBuilderOptions(
+            offline=environ.get("BUILDER_OFFLINE", "").lower()
+            in ["1", "true", "yes"],
+            jar_store=environ.get("BUILDER_JAR_STORE", defaults.jar_store),
+            native=[
+                DockerBuilderMethod(method.strip().lower())
+                for method in environ.get("BUILDER_NATIVE", "").split(",")
+                if method.strip()
+            ],
+            import_time=environ.get("BUILDER_IMPORTTIME", "").lower()
+            in ["1", "true", "yes"],
+            lock=environ.get("BUILDER_LOCK", "").lower()
+            in ["1", "true", "yes"],
+        )
+
+
 @dataclass
 class LambdaDockerProperties:
     root: str
     dockerfile: str
     source: str
-    requirements: str
-    shared: str
+    bundle: str
+    layers: Dict[str, str] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         self.dockerfile = path.relpath(self.dockerfile, self.root)
+        self.source = path.relpath(self.source, self.root).replace("\\", "/")
+        self.bundle = path.relpath(self.bundle, self.root).replace("\\", "/")
+
+    def get_excludes(self) -> List[str]:
+        # the image context only keeps the dockerfile, the bundle and src,
+        # so unrelated changes in the project do not change the asset hash
+        excludes = ["*"]
+        included = set()
+        for context_path in [
+            self.dockerfile.replace("\\", "/"),
+            self.bundle,
+            f"{self.source}/src",
+        ]:
+            parts = context_path.split("/")
+            for i in range(1, len(parts)):
+                parent = "/".join(parts[0:i])
+                if parent not in included:
+                    excludes.extend([f"!{parent}", f"{parent}/*"])
+                    included.add(parent)
+            excludes.append(f"!{context_path}")
+
+        return excludes
 
 
 @dataclass
@@ -37,6 +159,7 @@ class GlueDockerProperties:
     script: str
     dependencies_zip: str
     extra_jars_built: List[str]
+    shared_zips: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -47,6 +170,10 @@ class DockerAssetsPaths:
     shared_modules: str
     script: str
     dependencies_zip: str
+    bundle: str
+    size: str
+    build_manifest: str
+    resolved_jars: str
     extra_jars_built: List[str]
 
     def to_unix(self) -> None:
@@ -84,6 +211,10 @@ class DockerAssetsPaths:
             shared_modules=path.relpath(self.shared_modules, root),
             script=path.relpath(self.script, root),
             dependencies_zip=path.relpath(self.dependencies_zip, root),
+            bundle=path.relpath(self.bundle, root),
+            size=path.relpath(self.size, root),
+            build_manifest=path.relpath(self.build_manifest, root),
+            resolved_jars=path.relpath(self.resolved_jars, root),
             extra_jars_built=[
                 path.relpath(jar, root) for jar in self.extra_jars_built
             ],
@@ -94,11 +225,19 @@ class DockerAssetsPaths:
 class DockerBuilder:
     root_path: str
     module_path: str
+    options: DockerBuilderOptions = field(
+        default_factory=DockerBuilderOptions.from_environ
+    )
+    shared_layers: bool = False
+    lambda_base: Optional[int] = None
 
     def __post_init__(self) -> None:
         self.module_path = path.relpath(self.module_path, self.root_path)
-        self.assets_path = path.join(
-            self.root_path, ".builder_cache", self.module_path
+        self.cache_path = path.join(self.root_path, ".builder_cache")
+        self.assets_path = path.join(self.cache_path, self.module_path)
+        self.wheelhouse_path = path.join(self.cache_path, "wheelhouse")
+        self.wheelhouse_dockerfile = path.join(
+            self.root_path, "docker", "Dockerfile.wheelhouse"
         )
         self.shared_path = path.join(self.root_path, "shared")
         self.shared_manifest = path.join(self.shared_path, "manifest.json")
@@ -137,15 +276,17 @@ class DockerBuilder:
         if not assets_paths:
             assets_paths = self.__get_assets_paths()
 
+        shared_artifacts = self.__get_shared_artifacts()
+
         if method == DockerBuilderMethod.LAMBDA:
             dockerfile = self.__get_dockerfile(method)
             assets_paths.to_unix()
             return LambdaDockerProperties(
                 root=self.root_path,
                 dockerfile=dockerfile,
-                source=self.source_path,
-                requirements=assets_paths.requirements,
-                shared=assets_paths.shared_modules,
+                source=path.join(self.root_path, self.module_path),
+                bundle=assets_paths.bundle,
+                layers=shared_artifacts,
             )
         elif method == DockerBuilderMethod.GLUE:
             assets_paths.to_system()
@@ -153,6 +294,7 @@ class DockerBuilder:
                 script=assets_paths.script,
                 dependencies_zip=assets_paths.dependencies_zip,
                 extra_jars_built=assets_paths.extra_jars_built,
+                shared_zips=sorted(set(shared_artifacts.values())),
             )
         else:
             raise ValueError(f'Invalid DockerBuilderMethod "{method}".')
@@ -160,19 +302,528 @@ class DockerBuilder:
     def build(
         self, method: DockerBuilderMethod
     ) -> Union[LambdaDockerProperties, GlueDockerProperties]:
-        assets_paths = self.__get_assets_paths()
+        if method not in [DockerBuilderMethod.LAMBDA, DockerBuilderMethod.GLUE]:
+            raise ValueError(f'Invalid DockerBuilderMethod "{method}".')
 
-        if method == DockerBuilderMethod.LAMBDA:
-            self.__parse_dependencies(assets_paths)
-            return self.get_properties(method, assets_paths)
+        record = BUILD_TELEMETRY.module(self.module_path, method.value)
+        start = perf_counter()
+        try:
+            props = self.__build(method, record)
 
-        elif method == DockerBuilderMethod.GLUE:
-            self.__parse_dependencies(assets_paths)
-            self.__dockerbuild_glue(assets_paths)
+            if (
+                isinstance(props, LambdaDockerProperties)
+                and self.lambda_base is not None
+                and method not in self.options.native
+            ):
+                with record.phase("base"):
+                    self.__build_lambda_base(props, self.lambda_base)
+
+            return props
+        finally:
+            record.seconds = perf_counter() - start
+
+    def __build(
+        self, method: DockerBuilderMethod, record: ModuleTelemetry
+    ) -> Union[LambdaDockerProperties, GlueDockerProperties]:
+        with record.phase("fingerprint"):
+            fingerprint = self.get_fingerprint(method)
+            assets_paths = self.__get_assets_paths()
+
+        if self.__is_cached(method, assets_paths, fingerprint):
+            record.cache_hit = True
+            record.sizes = self.__read_build_manifest().get("size", {})
             return self.get_properties(method, assets_paths)
 
+        with record.phase("parse"):
+            dependencies = self.__parse_dependencies()
+            prune_config = self.__get_prune_config()
+        shared_artifacts: Dict[str, str] = {}
+        shared_sizes: List[Dict[str, int]] = []
+
+        # shared modules are built once as their own dependency set and
+        # attached by reference instead of being copied into each build
+        if self.shared_layers:
+            shared_bundles: Dict[str, str] = {}
+            for module in dependencies[2]:
+                bundle, size = self.__build_shared_module(
+                    method, module, record
+                )
+                shared_bundles[path.basename(module)] = bundle
+                shared_sizes.append(size)
+
+            with record.phase("zip"):
+                shared_artifacts = {
+                    module: path.relpath(artifact, self.root_path).replace(
+                        "\\", "/"
+                    )
+                    for module, artifact in self.__package_shared_modules(
+                        method, shared_bundles
+                    ).items()
+                }
+
+            with record.phase("parse"):
+                dependencies = self.__parse_dependencies(include_shared=False)
+
+        excludes = prune_config.get("exclude", [])
+        with record.phase("fingerprint"):
+            dependencies_key = self.get_dependencies_key(
+                method, dependencies, excludes
+            )
+        assets_paths = self.__build_dependency_set(
+            method, dependencies_key, dependencies, excludes, record
+        )
+
+        sizes = [self.__read_size(assets_paths)] + shared_sizes
+        size = {
+            "before": sum(s["before"] for s in sizes),
+            "after": sum(s["after"] for s in sizes),
+        }
+        record.sizes = size
+        self.__check_budget(size["after"], prune_config.get("size_budget_mb"))
+
+        makedirs(self.assets_path, exist_ok=True)
+        if method == DockerBuilderMethod.LAMBDA and self.options.import_time:
+            with record.phase("importtime"):
+                self.__profile_imports(assets_paths, shared_artifacts)
+
+        with open(assets_paths.build_manifest, "w") as f:
+            dump(
+                {
+                    "fingerprint": fingerprint,
+                    "dependencies": dependencies_key,
+                    "shared": shared_artifacts,
+                    "size": size,
+                },
+                f,
+                indent=4,
+            )
+
+        return self.get_properties(method, assets_paths)
+
+    def get_lambda_package(
+        self, props: LambdaDockerProperties, optimize: int = 0
+    ) -> str:
+        bundle = path.join(self.root_path, props.bundle)
+        package = Fingerprint(self.root_path)
+        package.add_text("optimize", str(optimize))
+        package.add_path(self.source_path)
+        package.add_path(bundle)
+        fingerprint = package.value
+        package_zip = path.join(self.assets_path, "package.zip")
+        package_manifest = path.join(self.assets_path, "package.json")
+
+        if path.isfile(package_manifest) and path.isfile(package_zip):
+            with open(package_manifest, "r") as f:
+                if load(f).get("fingerprint") == fingerprint:
+                    return package_zip
+
+        layers = list(props.layers.values())
+        unzipped_size = folder_size(self.source_path) + folder_size(bundle)
+        for layer in layers:
+            with ZipFile(layer) as zip_file:
+                unzipped_size += sum(i.file_size for i in zip_file.infolist())
+
+        if unzipped_size > LAMBDA_UNZIPPED_LIMIT:
+            raise Exception(
+                f'Lambda package of "{self.module_path}" is {unzipped_size / MEGABYTE:.1f} MB unzipped, over the 250 MB limit.'
+            )
+
+        makedirs(self.assets_path, exist_ok=True)
+
+        # bytecode only loads on the interpreter that wrote it, so zip
+        # packages are precompiled when the host runs the lambda python
+        if version_info[0:2] == LAMBDA_PYTHON_VERSION:
+            with TemporaryDirectory(dir=self.assets_path) as stage:
+                copytree(bundle, stage, dirs_exist_ok=True)
+                copytree(self.source_path, stage, dirs_exist_ok=True)
+                compile_dir(
+                    stage,
+                    quiet=1,
+                    optimize=optimize,
+                    invalidation_mode=PycInvalidationMode.UNCHECKED_HASH,
+                )
+                zip_folders([stage], package_zip)
         else:
-            raise ValueError(f'Invalid DockerBuilderMethod "{method}".')
+            zip_folders([self.source_path, bundle], package_zip)
+
+        with open(package_manifest, "w") as f:
+            dump({"fingerprint": fingerprint}, f, indent=4)
+
+        return package_zip
+
+    def __build_lambda_base(
+        self, props: LambdaDockerProperties, optimize: int
+    ) -> None:
+        bundle = path.join(self.root_path, props.bundle)
+        marker = path.join(path.dirname(bundle), f"base-o{optimize}.json")
+        fingerprint = Fingerprint(self.root_path)
+        fingerprint.add_text("optimize", str(optimize))
+        fingerprint.add_path(path.join(self.root_path, props.dockerfile))
+        fingerprint.add_path(bundle)
+
+        # the base stage of every function image with this dependency set is
+        # built once here, function images then find its layers in the
+        # buildkit cache since the bundle sits at the same context path
+        with self.__get_lock(marker):
+            if path.isfile(marker):
+                with open(marker, "r") as f:
+                    if load(f).get("fingerprint") == fingerprint.value:
+                        return
+
+            with TemporaryDirectory(dir=self.cache_path) as context:
+                copytree(bundle, path.join(context, props.bundle))
+                makedirs(
+                    path.dirname(path.join(context, props.dockerfile)),
+                    exist_ok=True,
+                )
+                copyfile(
+                    path.join(self.root_path, props.dockerfile),
+                    path.join(context, props.dockerfile),
+                )
+                check_call(
+                    [
+                        "docker",
+                        "build",
+                        "-f",
+                        path.join(context, props.dockerfile),
+                        "--progress=plain",
+                        "--target",
+                        "base",
+                        "--build-arg",
+                        f"BUNDLE={props.bundle}",
+                        "--build-arg",
+                        f"OPTIMIZE={optimize}",
+                        "--build-arg",
+                        f"SOURCE_DATE_EPOCH={source_date_epoch()}",
+                        context,
+                    ],
+                    cwd=self.root_path,
+                    env={**environ, "DOCKER_BUILDKIT": "1"},
+                )  # nosec
+
+            with open(marker, "w") as f:
+                dump({"fingerprint": fingerprint.value}, f, indent=4)
+
+    def get_fingerprint(self, method: DockerBuilderMethod) -> str:
+        with open(self.dependencies_json, "r") as f:
+            dependencies = load(f)
+
+        fingerprint = Fingerprint(self.root_path)
+        fingerprint.add_text("method", method.value)
+        fingerprint.add_text("shared_layers", str(self.shared_layers))
+        fingerprint.add_path(self.dependencies_json)
+        fingerprint.add_path(self.source_path)
+        fingerprint.add_path(self.shared_manifest)
+        fingerprint.add_path(self.__get_dockerfile(method))
+        fingerprint.add_path(self.wheelhouse_dockerfile)
+
+        for module in sorted(set(dependencies.get("shared_modules", []))):
+            fingerprint.add_path(path.join(self.shared_path, module))
+
+        return fingerprint.value
+
+    def get_dependencies_key(
+        self,
+        method: DockerBuilderMethod,
+        dependencies: Tuple[List[str], List[str], List[str]],
+        excludes: Optional[List[str]] = None,
+    ) -> str:
+        requirements, extra_jars, shared_modules = dependencies
+
+        fingerprint = Fingerprint(self.root_path)
+        fingerprint.add_text("method", method.value)
+        fingerprint.add_text("requirements", "\n".join(requirements))
+        fingerprint.add_text("extra_jars", "\n".join(extra_jars))
+        fingerprint.add_text("shared_modules", "\n".join(shared_modules))
+        fingerprint.add_text("excludes", "\n".join(sorted(excludes or [])))
+        fingerprint.add_path(self.__get_dockerfile(method))
+        fingerprint.add_path(self.wheelhouse_dockerfile)
+
+        for module in shared_modules:
+            fingerprint.add_path(path.join(self.root_path, module))
+
+        return fingerprint.value
+
+    @staticmethod
+    def __get_lock(key: str) -> Lock:
+        with _BUILD_LOCKS_GUARD:
+            return _BUILD_LOCKS.setdefault(key, Lock())
+
+    def __read_build_manifest(self) -> Dict[str, Any]:
+        build_manifest = path.join(self.assets_path, "build.json")
+        if not path.isfile(build_manifest):
+            return {}
+
+        with open(build_manifest, "r") as f:
+            return load(f)
+
+    def __is_cached(
+        self,
+        method: DockerBuilderMethod,
+        assets: DockerAssetsPaths,
+        fingerprint: str,
+    ) -> bool:
+        if self.__read_build_manifest().get("fingerprint") != fingerprint:
+            return False
+
+        if (
+            method == DockerBuilderMethod.LAMBDA
+            and self.options.import_time
+            and not path.isfile(path.join(self.assets_path, "importtime.json"))
+        ):
+            return False
+
+        for artifact in self.__get_shared_artifacts().values():
+            if not path.isfile(artifact):
+                return False
+
+        return self.__is_built(method, assets)
+
+    def __get_shared_artifacts(self) -> Dict[str, str]:
+        shared = self.__read_build_manifest().get("shared", {})
+        return {
+            module: path.join(self.root_path, artifact)
+            for module, artifact in shared.items()
+        }
+
+    def __build_dependency_set(
+        self,
+        method: DockerBuilderMethod,
+        dependencies_key: str,
+        dependencies: Tuple[List[str], List[str], List[str]],
+        excludes: List[str],
+        record: ModuleTelemetry,
+    ) -> DockerAssetsPaths:
+        # modules resolving to the same dependency set share one build
+        with self.__get_lock(dependencies_key):
+            assets_paths = self.__get_assets_paths(dependencies_key)
+
+            if not self.__is_built(method, assets_paths):
+                record.dependencies_hit = False
+                self.__write_dependencies(assets_paths, dependencies)
+
+                with record.phase("install"):
+                    self.__build_bundle(method, assets_paths, dependencies[2])
+
+                with record.phase("prune"):
+                    self.__prune(
+                        method, assets_paths, dependencies[0], excludes
+                    )
+
+                if method == DockerBuilderMethod.GLUE:
+                    with record.phase("zip"):
+                        zip_folder(
+                            assets_paths.bundle, assets_paths.dependencies_zip
+                        )
+
+                    with record.phase("jars"):
+                        self.__resolve_jars(assets_paths, dependencies[1])
+
+            return self.__get_assets_paths(dependencies_key)
+
+    def __profile_imports(
+        self, assets: DockerAssetsPaths, shared_artifacts: Dict[str, str]
+    ) -> None:
+        bundles = [assets.bundle] + [
+            path.join(self.root_path, path.dirname(artifact), "bundle")
+            for artifact in shared_artifacts.values()
+        ]
+        command: List[str]
+        env = dict(environ)
+
+        if DockerBuilderMethod.LAMBDA in self.options.native:
+            command = [executable, "-X", "importtime", "-c", "import index"]
+            env["PYTHONPATH"] = pathsep.join([self.source_path] + bundles)
+        else:
+            command = [
+                "docker",
+                "run",
+                "--rm",
+                "-v",
+                f"{self.source_path}:/var/task:ro",
+            ]
+            for i, bundle in enumerate(bundles):
+                command.extend(["-v", f"{bundle}:/opt/deps/{i}:ro"])
+            command.extend(
+                [
+                    "-e",
+                    "PYTHONPATH="
+                    + ":".join(f"/opt/deps/{i}" for i in range(len(bundles))),
+                    "--entrypoint",
+                    "python",
+                    LAMBDA_RUNTIME_IMAGE,
+                    "-X",
+                    "importtime",
+                    "-c",
+                    "import index",
+                ]
+            )
+
+        result = run(
+            command,
+            cwd=self.source_path,
+            env=env,
+            capture_output=True,
+            text=True,
+        )  # nosec
+
+        if result.returncode != 0:
+            raise Exception(
+                f'Could not import "index" of "{self.module_path}": {result.stderr.strip().splitlines()[-1:]}'
+            )
+
+        report = importtime_report(parse_importtime(result.stderr), "index")
+        with open(path.join(self.assets_path, "importtime.json"), "w") as f:
+            dump(report, f, indent=4)
+
+        with open(self.dependencies_json, "r") as f:
+            budget_ms = load(f).get("import_time_budget_ms")
+
+        if budget_ms is not None and report["total_us"] > budget_ms * 1000:
+            raise Exception(
+                f'Importing "index" of "{self.module_path}" takes {report["total_us"] / 1000:.0f} ms, over the {budget_ms} ms budget.'
+            )
+
+    def __get_prune_config(self) -> Dict[str, Any]:
+        with open(self.dependencies_json, "r") as f:
+            return load(f).get("prune", {})
+
+    @staticmethod
+    def __prune(
+        method: DockerBuilderMethod,
+        assets: DockerAssetsPaths,
+        requirements: List[str],
+        excludes: List[str],
+    ) -> None:
+        requested = [
+            split(r"[<>=~!\[; ]", requirement)[0].lower()
+            for requirement in requirements
+        ]
+
+        packages: List[str] = []
+        if method == DockerBuilderMethod.LAMBDA:
+            packages = [
+                p for p in LAMBDA_RUNTIME_PACKAGES if p not in requested
+            ]
+
+        pruner = Pruner(excludes=DEFAULT_EXCLUDES + excludes, packages=packages)
+        before, after = pruner.prune(assets.bundle)
+
+        with open(assets.size, "w") as f:
+            dump({"before": before, "after": after}, f, indent=4)
+
+    @staticmethod
+    def __read_size(assets: DockerAssetsPaths) -> Dict[str, int]:
+        if not path.isfile(assets.size):
+            return {"before": 0, "after": 0}
+
+        with open(assets.size, "r") as f:
+            return load(f)
+
+    def __check_budget(self, size: int, budget_mb: Optional[int]) -> None:
+        if budget_mb is not None and size > budget_mb * MEGABYTE:
+            raise Exception(
+                f'Dependencies of "{self.module_path}" are {size / MEGABYTE:.1f} MB, over the {budget_mb} MB budget.'
+            )
+
+    def __build_shared_module(
+        self, method: DockerBuilderMethod, module: str, record: ModuleTelemetry
+    ) -> Tuple[str, Dict[str, int]]:
+        with open(self.shared_manifest, "r") as f:
+            manifest = load(f)
+
+        packages = manifest[path.basename(module)]["packages"]
+        excludes = manifest[path.basename(module)].get("exclude", [])
+        requirements = merge_requirements(packages, self.shared_manifest)
+        dependencies: Tuple[List[str], List[str], List[str]] = (
+            self.__lock_requirements(requirements),
+            [],
+            [module],
+        )
+        dependencies_key = self.get_dependencies_key(
+            method, dependencies, excludes
+        )
+        assets_paths = self.__build_dependency_set(
+            method, dependencies_key, dependencies, excludes, record
+        )
+
+        # layers are found side by side on the python path, shared is left
+        # a namespace package so the modules of every layer resolve
+        if method == DockerBuilderMethod.LAMBDA:
+            shared_init = path.join(
+                assets_paths.bundle, "shared", "__init__.py"
+            )
+            with self.__get_lock(dependencies_key):
+                if path.isfile(shared_init):
+                    remove(shared_init)
+
+        return assets_paths.bundle, self.__read_size(assets_paths)
+
+    def __package_shared_modules(
+        self, method: DockerBuilderMethod, bundles: Dict[str, str]
+    ) -> Dict[str, str]:
+        if method == DockerBuilderMethod.LAMBDA:
+            artifacts: Dict[str, str] = {}
+            for module, bundle in bundles.items():
+                layer_zip = path.join(path.dirname(bundle), "layer.zip")
+                with self.__get_lock(layer_zip):
+                    self.__zip_if_changed([bundle], layer_zip, prefix="python")
+                artifacts[module] = layer_zip
+
+            return artifacts
+
+        # zipimport only finds the shared package in the first zip holding
+        # it, so every shared module of a job is packaged in one zip
+        if not bundles:
+            return {}
+
+        folders = [bundles[module] for module in sorted(bundles)]
+        shared_key = Fingerprint(self.root_path).add_text(
+            "bundles",
+            "\n".join(path.relpath(f, self.root_path) for f in folders),
+        )
+        shared_zip = path.join(
+            self.cache_path, "shared", f"{shared_key.value}.zip"
+        )
+
+        # jobs with the same shared modules share their zip
+        with self.__get_lock(shared_zip):
+            makedirs(path.dirname(shared_zip), exist_ok=True)
+            self.__zip_if_changed(folders, shared_zip)
+
+        return {module: shared_zip for module in bundles}
+
+    def __zip_if_changed(
+        self, folders: List[str], zip_path: str, prefix: str = ""
+    ) -> None:
+        fingerprint = Fingerprint(self.root_path)
+        fingerprint.add_text("prefix", prefix)
+        for folder in folders:
+            fingerprint.add_path(folder)
+
+        zip_manifest = f"{path.splitext(zip_path)[0]}.json"
+        if path.isfile(zip_path) and path.isfile(zip_manifest):
+            with open(zip_manifest, "r") as f:
+                if load(f).get("fingerprint") == fingerprint.value:
+                    return
+
+        zip_folders(folders, zip_path, prefix=prefix)
+        with open(zip_manifest, "w") as f:
+            dump({"fingerprint": fingerprint.value}, f, indent=4)
+
+    @staticmethod
+    def __is_built(
+        method: DockerBuilderMethod, assets: DockerAssetsPaths
+    ) -> bool:
+        artifacts = [assets.requirements, assets.shared_modules, assets.size]
+        if method == DockerBuilderMethod.GLUE:
+            artifacts.append(assets.resolved_jars)
+            artifacts.append(assets.dependencies_zip)
+            artifacts.extend(assets.extra_jars_built)
+        elif not path.isdir(assets.bundle):
+            return False
+
+        return all(path.isfile(artifact) for artifact in artifacts)
 
     def __get_dockerfile(self, method: DockerBuilderMethod) -> str:
         dockerfiles = {
@@ -186,39 +837,52 @@ class DockerBuilder:
 
         return path.join(self.root_path, "docker", dockerfile)
 
-    def __get_assets_paths(self) -> DockerAssetsPaths:
-        requirements = path.join(self.assets_path, "requirements.txt")
-        extra_jars = path.join(self.assets_path, "extra_jars.txt")
-        shared_modules = path.join(self.assets_path, "shared_modules.txt")
-        dependencies_zip = path.join(self.assets_path, "requirements.zip")
+    def __get_assets_paths(
+        self, dependencies_key: Optional[str] = None
+    ) -> DockerAssetsPaths:
+        if dependencies_key is None:
+            dependencies_key = self.__read_build_manifest().get("dependencies")
 
-        if path.isfile(extra_jars):
-            with open(extra_jars, "r") as f:
-                jars_built = f.read().splitlines()
-
-            jars_built = [path.basename(jar) for jar in jars_built]
-            jars_built = [
-                path.join(self.assets_path, "jars", jar) for jar in jars_built
-            ]
+        if dependencies_key:
+            assets_folder = path.join(
+                self.cache_path, "dependencies", dependencies_key
+            )
         else:
-            jars_built = []
+            assets_folder = self.assets_path
+
+        requirements = path.join(assets_folder, "requirements.txt")
+        extra_jars = path.join(assets_folder, "extra_jars.txt")
+        shared_modules = path.join(assets_folder, "shared_modules.txt")
+        dependencies_zip = path.join(assets_folder, "requirements.zip")
+        bundle = path.join(assets_folder, "bundle")
+        size = path.join(assets_folder, "size.json")
+        build_manifest = path.join(self.assets_path, "build.json")
+        resolved_jars = path.join(assets_folder, "extra_jars_built.txt")
+
+        jars_built: List[str] = []
+        if path.isfile(resolved_jars):
+            with open(resolved_jars, "r") as f:
+                jars_built = [jar for jar in f.read().splitlines() if jar]
 
         return DockerAssetsPaths(
-            assets_folder=self.assets_path,
+            assets_folder=assets_folder,
             requirements=requirements,
             extra_jars=extra_jars,
             shared_modules=shared_modules,
             script=self.index_py,
             dependencies_zip=dependencies_zip,
+            bundle=bundle,
+            size=size,
+            build_manifest=build_manifest,
+            resolved_jars=resolved_jars,
             extra_jars_built=jars_built,
         )
 
-    def __parse_dependencies(self, assets: DockerAssetsPaths) -> None:
-        if not path.isdir(self.assets_path):
-            makedirs(self.assets_path)
-
+    def __parse_dependencies(
+        self, include_shared: bool = True
+    ) -> Tuple[List[str], List[str], List[str]]:
         requirements = []
-        extra_jars = []
+        extra_jars: List[JarReference] = []
         shared_modules = []
 
         with open(self.dependencies_json, "r") as f:
@@ -228,7 +892,9 @@ class DockerBuilder:
             manifest = load(f)
 
         requirements.extend(dependencies["packages"])
-        extra_jars.extend(dependencies["extra_jars"])
+        extra_jars.extend(
+            [JarReference.from_pydict(j) for j in dependencies["extra_jars"]]
+        )
 
         for module in dependencies["shared_modules"]:
             if module not in manifest:
@@ -243,13 +909,28 @@ class DockerBuilder:
                     f'Module "{module}" does not exist in shared folder.'
                 )
 
-            requirements.extend(manifest[module]["packages"])
-            extra_jars.extend(manifest[module]["extra_jars"])
-            shared_modules.append(module)
+            extra_jars.extend(
+                [
+                    JarReference.from_pydict(j)
+                    for j in manifest[module]["extra_jars"]
+                ]
+            )
+
+            if include_shared:
+                requirements.extend(manifest[module]["packages"])
+                shared_modules.append(module)
+
+        jar_urls: Dict[str, JarReference] = {}
+        for jar in extra_jars:
+            known = jar_urls.setdefault(jar.url, jar)
+            if known.sha256 and jar.sha256 and known.sha256 != jar.sha256:
+                raise Exception(
+                    f'Jar "{jar.url}" has two different checksums in {self.dependencies_json}.'
+                )
+            known.sha256 = known.sha256 or jar.sha256
 
-        requirements = list(set(requirements))
-        extra_jars = list(set(extra_jars))
-        shared_modules = list(set(shared_modules))
+        jars = sorted(str(jar) for jar in jar_urls.values())
+        shared_modules = sorted(set(shared_modules))
 
         relative_shared_path = path.relpath(self.shared_path, self.root_path)
         shared_modules = [
@@ -257,18 +938,30 @@ class DockerBuilder:
             for module in shared_modules
         ]
 
-        passed_requirements = []
-        separators = ["==", ">=", "<=", ">", "<", "~="]
-        separator_default = "=="
-        for requirement in requirements:
-            for s in separators:
-                requirement = requirement.replace(s, separator_default)
-            requirement_name = requirement.split(separator_default)[0]
-            if requirement_name in passed_requirements:
-                raise Exception(
-                    f'Package "{requirement_name}" has two different versions in {self.dependencies_json}.'
-                )
-            passed_requirements.append(requirement_name)
+        requirements = merge_requirements(requirements, self.dependencies_json)
+
+        return self.__lock_requirements(requirements), jars, shared_modules
+
+    def __lock_requirements(self, requirements: List[str]) -> List[str]:
+        if not self.options.lock:
+            return requirements
+
+        # unresolvable locks fall back to pip resolving inside the build
+        resolver = LockResolver(
+            cache_path=path.join(self.cache_path, "locks"),
+            wheelhouse=self.wheelhouse_path,
+            offline=self.options.offline,
+        )
+        return resolver.resolve(requirements) or requirements
+
+    @staticmethod
+    def __write_dependencies(
+        assets: DockerAssetsPaths,
+        dependencies: Tuple[List[str], List[str], List[str]],
+    ) -> None:
+        requirements, extra_jars, shared_modules = dependencies
+
+        makedirs(assets.assets_folder, exist_ok=True)
 
         with open(assets.requirements, "w") as f:
             f.write("\n".join(requirements) + "\n")
@@ -279,11 +972,99 @@ class DockerBuilder:
         with open(assets.shared_modules, "w") as f:
             f.write("\n".join(shared_modules) + "\n")
 
-    def __dockerbuild_glue(self, assets: DockerAssetsPaths) -> None:
-        dockerfile = self.__get_dockerfile(DockerBuilderMethod.GLUE)
-        image_name = str(uuid4()).replace("-", "")[0:10]
+    def __get_native_builder(self) -> NativeBuilder:
+        return NativeBuilder(
+            root_path=self.root_path,
+            wheelhouse=self.wheelhouse_path,
+            offline=self.options.offline,
+        )
+
+    def __build_bundle(
+        self,
+        method: DockerBuilderMethod,
+        assets: DockerAssetsPaths,
+        shared_modules: List[str],
+    ) -> None:
+        if method in self.options.native:
+            native_builder = self.__get_native_builder()
+            if native_builder.bundle(
+                assets.requirements, shared_modules, assets.bundle
+            ):
+                return
+
+        self.__fill_wheelhouse(assets)
+        self.__dockerbuild_bundle(method, assets)
+
+    def __fill_wheelhouse(self, assets: DockerAssetsPaths) -> None:
+        makedirs(self.wheelhouse_path, exist_ok=True)
+
+        # offline builds install only what is already in the wheelhouse
+        if not self.options.offline:
+            wheels_folder = path.join(assets.assets_folder, "wheels")
+            relative_assets = assets.relative_to(self.root_path)
+            relative_assets.to_unix()
+            relative_wheelhouse = path.relpath(
+                self.wheelhouse_path, self.root_path
+            ).replace("\\", "/")
+
+            check_call(
+                [
+                    "docker",
+                    "build",
+                    "-f",
+                    self.wheelhouse_dockerfile,
+                    "--progress=plain",
+                    "--build-arg",
+                    f"REQUIREMENTS={relative_assets.requirements}",
+                    "--build-arg",
+                    f"WHEELHOUSE={relative_wheelhouse}",
+                    "--build-arg",
+                    f"PIP_NO_DEPS={int(is_locked(assets.requirements))}",
+                    "--output",
+                    wheels_folder,
+                    ".",
+                ],
+                cwd=self.root_path,
+            )  # nosec
+
+            # parallel builds export into their own folder and publish
+            # each wheel to the shared wheelhouse with an atomic rename
+            for wheel in sorted(listdir(wheels_folder)):
+                target = path.join(self.wheelhouse_path, wheel)
+                if path.isfile(target):
+                    continue
+
+                temp_target = f"{target}.{path.basename(assets.assets_folder)}"
+                copyfile(path.join(wheels_folder, wheel), temp_target)
+                replace(temp_target, target)
+
+    def __resolve_jars(
+        self, assets: DockerAssetsPaths, extra_jars: List[str]
+    ) -> None:
+        store = JarStore(
+            store_path=self.options.jar_store, offline=self.options.offline
+        )
+        jars_built = [
+            store.get(JarReference.from_pydict(jar)) for jar in extra_jars
+        ]
+
+        with open(assets.resolved_jars, "w") as f:
+            f.write("\n".join(jars_built) + "\n")
+
+    def __dockerbuild_bundle(
+        self, method: DockerBuilderMethod, assets: DockerAssetsPaths
+    ) -> None:
+        dockerfile = self.__get_dockerfile(method)
+        image_name = f"datalake-{method.value}-{path.basename(assets.assets_folder)[0:12]}"
         relative_assets = assets.relative_to(self.root_path)
         relative_assets.to_unix()
+        relative_wheelhouse = path.relpath(
+            self.wheelhouse_path, self.root_path
+        ).replace("\\", "/")
+        temp_bundle = f"{assets.bundle}.tmp"
+
+        if path.isdir(temp_bundle):
+            rmtree(temp_bundle)
 
         check_call(
             [
@@ -294,15 +1075,25 @@ class DockerBuilder:
                 "-f",
                 dockerfile,
                 "--progress=plain",
+                "--target",
+                "bundle",
                 "--build-arg",
                 f"REQUIREMENTS={relative_assets.requirements}",
                 "--build-arg",
-                f"EXTRA_JARS={relative_assets.extra_jars}",
-                "--build-arg",
                 f"SHARED_MODULES={relative_assets.shared_modules}",
+                "--build-arg",
+                f"WHEELHOUSE={relative_wheelhouse}",
+                "--build-arg",
+                f"SOURCE_DATE_EPOCH={source_date_epoch()}",
+                "--build-arg",
+                f"PIP_NO_DEPS={int(is_locked(assets.requirements))}",
                 "--output",
-                assets.assets_folder,
+                temp_bundle,
                 ".",
             ],
             cwd=self.root_path,
         )  # nosec
+
+        if path.isdir(assets.bundle):
+            rmtree(assets.bundle)
+        replace(temp_bundle, assets.bundle)
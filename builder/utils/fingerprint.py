@@ -0,0 +1,67 @@
+from hashlib import sha256
+from os import (
+    path,
+    walk,
+)
+from typing import List
+
+IGNORED_FOLDERS = ["__pycache__", ".pytest_cache", ".mypy_cache"]
+IGNORED_EXTENSIONS = [".pyc", ".pyo"]
+
+
+class Fingerprint:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._digest = sha256()
+
+    def __update(self, label: str, content: bytes) -> None:
+        self._digest.update(label.encode())
+        self._digest.update(b"\0")
+        self._digest.update(content)
+        self._digest.update(b"\0")
+
+    def __relative(self, file_path: str) -> str:
+        return path.relpath(file_path, self.root).replace("\\", "/")
+
+    @staticmethod
+    def __list_files(folder: str) -> List[str]:
+        files: List[str] = []
+        for current, folders, filenames in walk(folder):
+            folders[:] = sorted(f for f in folders if f not in IGNORED_FOLDERS)
+            for filename in sorted(filenames):
+                if path.splitext(filename)[1] in IGNORED_EXTENSIONS:
+                    continue
+                files.append(path.join(current, filename))
+
+        return files
+
+    def add_text(self, label: str, text: str) -> "Fingerprint":
+        self.__update(f"text:{label}", text.encode())
+        return self
+
+    def add_file(self, file_path: str) -> "Fingerprint":
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        self.__update(f"file:{self.__relative(file_path)}", content)
+        return self
+
+    def add_folder(self, folder: str) -> "Fingerprint":
+        for file_path in self.__list_files(folder):
+            self.add_file(file_path)
+
+        return self
+
+    def add_path(self, file_path: str) -> "Fingerprint":
+        if path.isdir(file_path):
+            return self.add_folder(file_path)
+
+        if path.isfile(file_path):
+            return self.add_file(file_path)
+
+        self.__update(f"missing:{self.__relative(file_path)}", b"")
+        return self
+
+    @property
+    def value(self) -> str:
+        return self._digest.hexdigest()
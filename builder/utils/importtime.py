@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+
+@dataclass
+class ImportTimeEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportTimeEntry]:
+    entries: List[ImportTimeEntry] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        columns = line[len("import time:") :].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            continue
+
+        entries.append(
+            ImportTimeEntry(
+                module=columns[2].strip(),
+                self_us=int(columns[0]),
+                cumulative_us=int(columns[1]),
+            )
+        )
+
+    return entries
+
+
+def importtime_report(
+    entries: List[ImportTimeEntry], module: str, top: int = 20
+) -> Dict[str, Any]:
+    total_us = max(
+        [entry.cumulative_us for entry in entries if entry.module == module]
+        or [0]
+    )
+    costly = sorted(entries, key=lambda entry: entry.self_us, reverse=True)
+
+    return {
+        "module": module,
+        "total_us": total_us,
+        "top": [vars(entry) for entry in costly[0:top]],
+    }
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from hashlib import sha256
+from json import (
+    dump,
+    load,
+)
+from os import (
+    makedirs,
+    path,
+    remove,
+    replace,
+)
+from shutil import copyfileobj
+from tempfile import mkstemp
+from threading import Lock
+from time import sleep
+from typing import (
+    Dict,
+    Optional,
+    Union,
+)
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+_STORE_LOCKS: Dict[str, Lock] = {}
+_STORE_LOCKS_GUARD = Lock()
+
+
+@dataclass
+class JarReference:
+    url: str
+    sha256: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if urlparse(self.url).scheme not in ["http", "https"]:
+            raise ValueError(f'Invalid jar url "{self.url}".')
+
+        if self.sha256:
+            self.sha256 = self.sha256.lower()
+
+    @staticmethod
+    def from_pydict(pydict: Union[str, Dict[str, str]]) -> "JarReference":
+        if isinstance(pydict, dict):
+            return JarReference(url=pydict["url"], sha256=pydict.get("sha256"))
+
+        url, _, fragment = pydict.partition("#")
+        checksum = None
+        if fragment.startswith("sha256="):
+            checksum = fragment[len("sha256=") :]
+
+        return JarReference(url=url, sha256=checksum)
+
+    @property
+    def filename(self) -> str:
+        return path.basename(urlparse(self.url).path)
+
+    def __str__(self) -> str:
+        if self.sha256:
+            return f"{self.url}#sha256={self.sha256}"
+
+        return self.url
+
+
+@dataclass
+class JarStore:
+    store_path: str
+    offline: bool = False
+    retries: int = 3
+    timeout: int = 60
+
+    def __post_init__(self) -> None:
+        self.index_path = path.join(self.store_path, "index.json")
+
+    @staticmethod
+    def __get_lock(key: str) -> Lock:
+        with _STORE_LOCKS_GUARD:
+            return _STORE_LOCKS.setdefault(key, Lock())
+
+    @staticmethod
+    def __checksum(file_path: str) -> str:
+        digest = sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def __read_index(self) -> Dict[str, str]:
+        if not path.isfile(self.index_path):
+            return {}
+
+        with open(self.index_path, "r") as f:
+            return load(f)
+
+    def __write_index(self, url: str, checksum: str) -> None:
+        with self.__get_lock(self.index_path):
+            index = self.__read_index()
+            index[url] = checksum
+
+            makedirs(self.store_path, exist_ok=True)
+            handle, temp_index = mkstemp(dir=self.store_path)
+            with open(handle, "w") as f:
+                dump(index, f, indent=4, sort_keys=True)
+            replace(temp_index, self.index_path)
+
+    def __jar_path(self, jar: JarReference, checksum: str) -> str:
+        return path.join(self.store_path, checksum, jar.filename)
+
+    def __download(self, jar: JarReference) -> str:
+        makedirs(self.store_path, exist_ok=True)
+
+        for attempt in range(1, self.retries + 1):
+            handle, temp_jar = mkstemp(dir=self.store_path, suffix=".part")
+            try:
+                with open(handle, "wb") as f:
+                    response = urlopen(jar.url, timeout=self.timeout)  # nosec
+                    with response:
+                        copyfileobj(response, f)
+                return temp_jar
+            except OSError:
+                remove(temp_jar)
+                if attempt == self.retries:
+                    raise
+                sleep(2**attempt)
+
+        raise ValueError(f'Could not download jar "{jar.url}".')
+
+    def get(self, jar: JarReference) -> str:
+        with self.__get_lock(jar.url):
+            checksum = jar.sha256 or self.__read_index().get(jar.url)
+
+            if checksum:
+                jar_path = self.__jar_path(jar, checksum)
+                if (
+                    path.isfile(jar_path)
+                    and self.__checksum(jar_path) == checksum
+                ):
+                    return jar_path
+
+            if self.offline:
+                raise FileNotFoundError(
+                    f'Jar "{jar.url}" is not in the jar store and cannot be downloaded offline.'
+                )
+
+            temp_jar = self.__download(jar)
+            downloaded_checksum = self.__checksum(temp_jar)
+
+            if jar.sha256 and downloaded_checksum != jar.sha256:
+                remove(temp_jar)
+                raise ValueError(
+                    f'Checksum mismatch for jar "{jar.url}": expected {jar.sha256}, got {downloaded_checksum}.'
+                )
+
+            jar_path = self.__jar_path(jar, downloaded_checksum)
+            makedirs(path.dirname(jar_path), exist_ok=True)
+            replace(temp_jar, jar_path)
+            self.__write_index(jar.url, downloaded_checksum)
+
+            return jar_path
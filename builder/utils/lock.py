@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from json import load
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from re import match
+from subprocess import (  # nosec
+    CalledProcessError,
+    check_call,
+)
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from builder.utils.fingerprint import Fingerprint
+
+
+def parse_requirement(requirement: str) -> Tuple[str, Set[str], List[str]]:
+    parsed = match(
+        r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*)$",
+        requirement,
+    )
+    if not parsed:
+        raise ValueError(f'Invalid requirement "{requirement}".')
+
+    name = parsed.group(1).lower().replace("_", "-").replace(".", "-")
+    extras = {
+        extra.strip()
+        for extra in (parsed.group(2) or "[]")[1:-1].split(",")
+        if extra.strip()
+    }
+    specifiers = [
+        specifier.replace(" ", "")
+        for specifier in parsed.group(3).split(",")
+        if specifier.strip()
+    ]
+
+    return name, extras, specifiers
+
+
+def merge_requirements(requirements: List[str], source: str) -> List[str]:
+    merged: Dict[str, Tuple[Set[str], Set[str]]] = {}
+    for requirement in requirements:
+        name, extras, specifiers = parse_requirement(requirement)
+        known_extras, known_specifiers = merged.setdefault(name, (set(), set()))
+        known_extras.update(extras)
+        known_specifiers.update(specifiers)
+
+    # the intersection of specifiers is left to the resolver, only
+    # different exact pins are known to be unsatisfiable up front
+    result = []
+    for name, (merged_extras, merged_specifiers) in sorted(merged.items()):
+        pins = {s for s in merged_specifiers if s.startswith("==")}
+        if len(pins) > 1:
+            raise Exception(
+                f'Package "{name}" has two different versions in {source}.'
+            )
+
+        extras_text = ""
+        if merged_extras:
+            extras_text = f"[{','.join(sorted(merged_extras))}]"
+        result.append(
+            f"{name}{extras_text}{','.join(sorted(merged_specifiers))}"
+        )
+
+    return result
+
+
+@dataclass
+class LockResolver:
+    cache_path: str
+    wheelhouse: str
+    offline: bool = False
+    platform: str = "manylinux2014_x86_64"
+    python_version: str = "3.9"
+
+    def __get_lock_path(self, requirements: List[str]) -> str:
+        fingerprint = Fingerprint(self.cache_path)
+        fingerprint.add_text("platform", self.platform)
+        fingerprint.add_text("python_version", self.python_version)
+        fingerprint.add_text("requirements", "\n".join(requirements))
+
+        return path.join(self.cache_path, f"{fingerprint.value}.txt")
+
+    def __resolve(self, requirements: List[str], tmp: str) -> Optional[str]:
+        requirements_path = path.join(tmp, "requirements.txt")
+        report_path = path.join(tmp, "report.json")
+        with open(requirements_path, "w") as f:
+            f.write("\n".join(requirements) + "\n")
+
+        command = [
+            executable,
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--quiet",
+            "--report",
+            report_path,
+            "-r",
+            requirements_path,
+            "--target",
+            path.join(tmp, "target"),
+            "--platform",
+            self.platform,
+            "--python-version",
+            self.python_version,
+            "--implementation",
+            "cp",
+            "--only-binary=:all:",
+            "--find-links",
+            self.wheelhouse,
+            "--disable-pip-version-check",
+        ]
+
+        if self.offline:
+            command.append("--no-index")
+
+        try:
+            check_call(command)  # nosec
+        except CalledProcessError:
+            return None
+
+        with open(report_path, "r") as f:
+            report = load(f)
+
+        lines = []
+        for item in report["install"]:
+            archive_info = item["download_info"].get("archive_info", {})
+            checksum = archive_info.get("hashes", {}).get("sha256")
+            if not checksum and archive_info.get("hash", "").startswith(
+                "sha256="
+            ):
+                checksum = archive_info["hash"][len("sha256=") :]
+
+            # packages without a known archive hash cannot be locked
+            if not checksum:
+                return None
+
+            name = parse_requirement(item["metadata"]["name"])[0]
+            version = item["metadata"]["version"]
+            lines.append(f"{name}=={version} --hash=sha256:{checksum}")
+
+        return "\n".join(sorted(lines)) + "\n"
+
+    def resolve(self, requirements: List[str]) -> Optional[List[str]]:
+        if not requirements:
+            return []
+
+        lock_path = self.__get_lock_path(requirements)
+        if not path.isfile(lock_path):
+            makedirs(self.cache_path, exist_ok=True)
+            with TemporaryDirectory(dir=self.cache_path) as tmp:
+                lock = self.__resolve(requirements, tmp)
+                if lock is None:
+                    return None
+
+                temp_lock = path.join(tmp, "lock.txt")
+                with open(temp_lock, "w") as f:
+                    f.write(lock)
+                replace(temp_lock, lock_path)
+
+        with open(lock_path, "r") as f:
+            return [line for line in f.read().splitlines() if line]
+
+
+def is_locked(requirements_path: str) -> bool:
+    with open(requirements_path, "r") as f:
+        return "--hash=" in f.read()
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from shutil import (
+    copyfile,
+    copytree,
+    rmtree,
+)
+from subprocess import (  # nosec
+    CalledProcessError,
+    check_call,
+)
+from sys import executable
+from tempfile import mkdtemp
+from typing import List
+
+from builder.utils.lock import is_locked
+
+
+@dataclass
+class NativeBuilder:
+    root_path: str
+    wheelhouse: str
+    offline: bool = False
+    platform: str = "manylinux2014_x86_64"
+    python_version: str = "3.9"
+
+    def __install(self, requirements: str, target: str) -> bool:
+        command = [
+            executable,
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            requirements,
+            "--target",
+            target,
+            "--platform",
+            self.platform,
+            "--python-version",
+            self.python_version,
+            "--implementation",
+            "cp",
+            "--only-binary=:all:",
+            "--find-links",
+            self.wheelhouse,
+            "--no-compile",
+            "--disable-pip-version-check",
+        ]
+
+        if self.offline:
+            command.append("--no-index")
+
+        # locked requirements are already resolved and hash checked
+        if is_locked(requirements):
+            command.extend(["--no-deps", "--require-hashes"])
+
+        # sdists that need compiling are left to the docker build
+        try:
+            check_call(command)  # nosec
+        except CalledProcessError:
+            return False
+
+        return True
+
+    def __copy_shared_modules(
+        self, shared_modules: List[str], target: str
+    ) -> None:
+        if not shared_modules:
+            return
+
+        shared_target = path.join(target, "shared")
+        makedirs(shared_target, exist_ok=True)
+
+        shared_init = path.join(self.root_path, "shared", "__init__.py")
+        if path.isfile(shared_init):
+            copyfile(shared_init, path.join(shared_target, "__init__.py"))
+
+        for module in shared_modules:
+            copytree(
+                path.join(self.root_path, module),
+                path.join(shared_target, path.basename(module)),
+                dirs_exist_ok=True,
+            )
+
+    def bundle(
+        self, requirements: str, shared_modules: List[str], target: str
+    ) -> bool:
+        makedirs(path.dirname(target), exist_ok=True)
+        temp_target = mkdtemp(dir=path.dirname(target))
+
+        try:
+            if not self.__install(requirements, temp_target):
+                return False
+
+            self.__copy_shared_modules(shared_modules, temp_target)
+
+            if path.isdir(target):
+                rmtree(target)
+            replace(temp_target, target)
+        finally:
+            if path.isdir(temp_target):
+                rmtree(temp_target)
+
+        return True
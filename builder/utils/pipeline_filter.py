@@ -0,0 +1,52 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from fnmatch import fnmatchcase
+from typing import List
+
+from builder.model.config.pipeline import PipelineConfig
+
+
+@dataclass
+class PipelineFilter:
+    selectors: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        for selector in self.selectors:
+            kind, _, value = selector.partition(":")
+            if not selector or (
+                value and kind not in ["name", "domain", "tag"]
+            ):
+                raise ValueError(
+                    f'Invalid pipeline selector "{selector}", expected "<name>", "domain:<domain>" or "tag:<key>=<value>".'
+                )
+
+    @staticmethod
+    def from_string(value: str) -> "PipelineFilter":
+        return PipelineFilter(
+            selectors=[s.strip() for s in value.split(",") if s.strip()]
+        )
+
+    def __matches(self, selector: str, config: PipelineConfig) -> bool:
+        kind, _, value = selector.partition(":")
+        if not value:
+            kind, value = "name", selector
+
+        if kind == "name":
+            return fnmatchcase(config.name.name, value)
+
+        if kind == "domain":
+            return fnmatchcase(config.domain, value)
+
+        tag_key, _, tag_value = value.partition("=")
+        return any(
+            key == tag_key and fnmatchcase(str(item), tag_value or "*")
+            for key, item in config.tags.items
+        )
+
+    def matches(self, config: PipelineConfig) -> bool:
+        if not self.selectors:
+            return True
+
+        return any(self.__matches(s, config) for s in self.selectors)
@@ -0,0 +1,243 @@
+import tracemalloc
+from contextlib import contextmanager
+from cProfile import Profile
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import wraps
+from json import dump
+from os import (
+    environ,
+    makedirs,
+    path,
+    replace,
+)
+from threading import (
+    Lock,
+    local,
+)
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from builder.utils.table import format_table
+
+PROFILE_MODES = ["time", "cprofile", "tracemalloc"]
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+@dataclass
+class ProfileEntry:
+    kind: str
+    group: str
+    calls: int = 0
+    seconds: float = 0.0
+    self_seconds: float = 0.0
+    allocated: int = 0
+    self_allocated: int = 0
+
+
+@dataclass
+class _Frame:
+    start: float
+    memory: int
+    children_seconds: float = 0.0
+    children_allocated: int = 0
+
+
+@dataclass
+class SynthProfiler:
+    modes: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        for mode in self.modes:
+            if mode not in PROFILE_MODES:
+                raise ValueError(
+                    f'Invalid profile mode "{mode}", expected one of {", ".join(PROFILE_MODES)}.'
+                )
+
+        self._entries: Dict[Tuple[str, str], ProfileEntry] = {}
+        self._lock = Lock()
+        self._local = local()
+        self._profile: Optional[Profile] = None
+
+    @staticmethod
+    def from_environ() -> "SynthProfiler":
+        value = environ.get("BUILDER_PROFILE", "").lower()
+        if value in ["", "0", "false", "no"]:
+            return SynthProfiler()
+
+        if value in ["1", "true", "yes"]:
+            return SynthProfiler(modes=["time"])
+
+        modes = [mode.strip() for mode in value.split(",") if mode.strip()]
+        return SynthProfiler(modes=sorted(set(["time"] + modes)))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.modes)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._profile = None
+
+    def __frames(self) -> List[_Frame]:
+        if not hasattr(self._local, "frames"):
+            self._local.frames = []
+
+        return self._local.frames
+
+    @staticmethod
+    def __memory() -> int:
+        if not tracemalloc.is_tracing():
+            return 0
+
+        return tracemalloc.get_traced_memory()[0]
+
+    def __start_capture(self) -> None:
+        if "tracemalloc" in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        if "cprofile" in self.modes:
+            with self._lock:
+                if self._profile is None:
+                    self._profile = Profile()
+            self._profile.enable()
+
+    def __stop_capture(self) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+
+    @contextmanager
+    def profile(self, kind: str, group: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        frames = self.__frames()
+
+        # capture only spans the outermost call, nested calls add to it
+        if not frames:
+            self.__start_capture()
+
+        frame = _Frame(start=perf_counter(), memory=self.__memory())
+        frames.append(frame)
+        try:
+            yield
+        finally:
+            frames.pop()
+            seconds = perf_counter() - frame.start
+            allocated = self.__memory() - frame.memory
+
+            if frames:
+                frames[-1].children_seconds += seconds
+                frames[-1].children_allocated += allocated
+            else:
+                self.__stop_capture()
+
+            with self._lock:
+                entry = self._entries.setdefault(
+                    (kind, group), ProfileEntry(kind=kind, group=group)
+                )
+                entry.calls += 1
+                entry.seconds += seconds
+                entry.self_seconds += seconds - frame.children_seconds
+                entry.allocated += allocated
+                entry.self_allocated += allocated - frame.children_allocated
+
+    def wrap(self, function: Function, group: Callable[..., str]) -> Function:
+        @wraps(function)
+        def profiled(instance: Any, *args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return function(instance, *args, **kwargs)
+
+            kind = f"{type(instance).__name__}.{function.__name__}"
+            with self.profile(kind, group(instance, *args, **kwargs)):
+                return function(instance, *args, **kwargs)
+
+        return cast(Function, profiled)
+
+    @property
+    def entries(self) -> List[ProfileEntry]:
+        with self._lock:
+            return sorted(
+                self._entries.values(),
+                key=lambda entry: entry.self_seconds,
+                reverse=True,
+            )
+
+    def __breakdown(self, key: str) -> List[Dict[str, Any]]:
+        totals: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries:
+            name = getattr(entry, key)
+            total = totals.setdefault(
+                name,
+                {
+                    key: name,
+                    "calls": 0,
+                    "self_seconds": 0.0,
+                    "self_allocated": 0,
+                },
+            )
+            total["calls"] += entry.calls
+            total["self_seconds"] += entry.self_seconds
+            total["self_allocated"] += entry.self_allocated
+
+        return sorted(
+            totals.values(), key=lambda t: t["self_seconds"], reverse=True
+        )
+
+    def to_pydict(self) -> Dict[str, Any]:
+        return {
+            "modes": self.modes,
+            "kinds": self.__breakdown("kind"),
+            "groups": self.__breakdown("group"),
+            "entries": [vars(entry) for entry in self.entries],
+        }
+
+    def write(self, report_path: str) -> None:
+        makedirs(path.dirname(report_path), exist_ok=True)
+        temp_report = f"{report_path}.tmp"
+        with open(temp_report, "w") as f:
+            dump(self.to_pydict(), f, indent=4)
+        replace(temp_report, report_path)
+
+        if self._profile is not None:
+            self._profile.dump_stats(f"{path.splitext(report_path)[0]}.prof")
+
+    def summary(self, top: int = 20) -> str:
+        if not self.entries:
+            return "Nothing was profiled."
+
+        lines: List[str] = []
+        for key in ["kind", "group"]:
+            rows = [
+                [
+                    total[key],
+                    str(total["calls"]),
+                    f"{total['self_seconds']:.3f}s",
+                    f"{total['self_allocated'] / 1024:.0f}KB",
+                ]
+                for total in self.__breakdown(key)[0:top]
+            ]
+            lines.extend(
+                format_table([key, "calls", "self time", "self alloc"], rows)
+            )
+            lines.append("")
+
+        return "\n".join(lines).rstrip()
+
+
+SYNTH_PROFILER = SynthProfiler.from_environ()
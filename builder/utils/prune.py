@@ -0,0 +1,123 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from os import (
+    listdir,
+    path,
+    remove,
+    walk,
+)
+from pathlib import PurePosixPath
+from shutil import (
+    rmtree,
+    which,
+)
+from subprocess import (  # nosec
+    CalledProcessError,
+    check_call,
+)
+from typing import (
+    List,
+    Tuple,
+)
+
+LAMBDA_UNZIPPED_LIMIT = 250 * 1024 * 1024
+
+DEFAULT_EXCLUDES = [
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    "tests",
+    "*.h",
+    "*.hpp",
+    "*.pxd",
+    "*.pyx",
+    "*.c",
+    "*.cpp",
+    "*.dist-info/RECORD",
+    "*.dist-info/INSTALLER",
+    "*.dist-info/REQUESTED",
+    "*.dist-info/direct_url.json",
+]
+
+# provided by the lambda python runtime
+LAMBDA_RUNTIME_PACKAGES = [
+    "boto3",
+    "botocore",
+    "s3transfer",
+]
+
+
+def folder_size(folder: str) -> int:
+    size = 0
+    for current, _, filenames in walk(folder):
+        for filename in filenames:
+            file_path = path.join(current, filename)
+            if not path.islink(file_path):
+                size += path.getsize(file_path)
+
+    return size
+
+
+@dataclass
+class Pruner:
+    excludes: List[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDES))
+    packages: List[str] = field(default_factory=list)
+    strip: bool = True
+
+    def __is_excluded(self, relative_path: str) -> bool:
+        relative = PurePosixPath(relative_path)
+        return any(relative.match(pattern) for pattern in self.excludes)
+
+    def __is_package(self, name: str) -> bool:
+        for package in self.packages:
+            normalized = package.replace("-", "_")
+            if name == normalized:
+                return True
+
+            if name.startswith(f"{normalized}-") and name.endswith(
+                (".dist-info", ".egg-info")
+            ):
+                return True
+
+        return False
+
+    def __strip(self, file_path: str) -> None:
+        strip = which("strip")
+        if not strip:
+            return
+
+        # foreign binaries (e.g. linux wheels on macos) are left untouched
+        try:
+            check_call([strip, "--strip-debug", file_path])  # nosec
+        except CalledProcessError:
+            pass
+
+    def prune(self, folder: str) -> Tuple[int, int]:
+        before = folder_size(folder)
+
+        for name in listdir(folder):
+            if self.__is_package(name):
+                target = path.join(folder, name)
+                if path.isdir(target):
+                    rmtree(target)
+                else:
+                    remove(target)
+
+        for current, folders, filenames in walk(folder):
+            for name in sorted(folders):
+                relative = path.relpath(path.join(current, name), folder)
+                if self.__is_excluded(relative.replace("\\", "/")):
+                    rmtree(path.join(current, name))
+                    folders.remove(name)
+
+            for name in filenames:
+                file_path = path.join(current, name)
+                relative = path.relpath(file_path, folder)
+                if self.__is_excluded(relative.replace("\\", "/")):
+                    remove(file_path)
+                elif self.strip and (name.endswith(".so") or ".so." in name):
+                    self.__strip(file_path)
+
+        return before, folder_size(folder)
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+SHARDING_MODES = ["none", "domain", "budget"]
+
+# CloudFormation allows 500 resources per stack, the default budget keeps
+# room for the resources the synthesizer and custom resources add
+DEFAULT_MAX_RESOURCES = 400
+
+
+@dataclass
+class StackSharding:
+    mode: str = "none"
+    max_resources: int = DEFAULT_MAX_RESOURCES
+
+    def __post_init__(self) -> None:
+        if self.mode not in SHARDING_MODES:
+            raise ValueError(
+                f'Invalid stack sharding "{self.mode}", expected one of {", ".join(SHARDING_MODES)}.'
+            )
+
+        if self.max_resources <= 0:
+            raise ValueError(
+                f"Invalid stack resource budget {self.max_resources}, expected a positive number."
+            )
+
+    @staticmethod
+    def from_string(value: str) -> "StackSharding":
+        mode, _, budget = value.strip().lower().partition(":")
+        if budget and mode != "budget":
+            raise ValueError(
+                f'Invalid stack sharding "{value}", only "budget" accepts a resource count.'
+            )
+
+        if budget and not budget.isdigit():
+            raise ValueError(
+                f'Invalid stack resource budget "{budget}", expected a number.'
+            )
+
+        return StackSharding(
+            mode=mode or "none",
+            max_resources=int(budget) if budget else DEFAULT_MAX_RESOURCES,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "none"
+
+    def shards(
+        self, domains: List[str], count: Callable[[str], int]
+    ) -> List[Tuple[str, List[str]]]:
+        if self.mode == "none":
+            return [("", domains)]
+
+        if self.mode == "domain":
+            return [(domain, [domain]) for domain in domains]
+
+        # domains are packed in their declared order, so appending a domain
+        # never moves the buckets of the others to another stack
+        shards: List[Tuple[str, List[str]]] = []
+        resources = 0
+        for domain in domains:
+            domain_resources = count(domain)
+            if not shards or resources + domain_resources > self.max_resources:
+                shards.append((str(len(shards) + 1), []))
+                resources = 0
+
+            shards[-1][1].append(domain)
+            resources += domain_resources
+
+        return shards
@@ -0,0 +1,307 @@
+from dataclasses import dataclass
+from glob import glob
+from json import (
+    dump,
+    dumps,
+    load,
+)
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from shutil import (
+    copyfile,
+    copytree,
+    rmtree,
+)
+from tempfile import mkdtemp
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from aws_cdk import (
+    CfnResource,
+    FileAssetPackaging,
+    Stack,
+    Token,
+)
+from aws_cdk import cloudformation_include as cfn_inc
+
+from builder.utils.fingerprint import Fingerprint
+
+FINGERPRINT_METADATA = "DatalakeFingerprint"
+BUILDER_PATH = path.dirname(path.dirname(path.abspath(__file__)))
+
+# sections the stack synthesizer adds again to every template
+SYNTHESIZER_ELEMENTS = {
+    "Parameters": ["BootstrapVersion"],
+    "Rules": ["CheckBootstrapVersion"],
+    "Resources": ["CDKMetadata"],
+    "Conditions": ["CDKMetadataAvailable"],
+}
+
+PACKAGING = {
+    "zip": FileAssetPackaging.ZIP_DIRECTORY,
+    "file": FileAssetPackaging.FILE,
+}
+
+
+@dataclass
+class SynthCache:
+    root_path: str
+    cache_path: str
+    outdir: str
+
+    def fingerprint(
+        self, pipeline_path: str, parameters: Dict[str, Any]
+    ) -> str:
+        shared_path = path.join(self.root_path, "shared")
+        shared_modules = set()
+        for requirements_json in sorted(
+            glob(
+                path.join(pipeline_path, "**", "requirements.json"),
+                recursive=True,
+            )
+        ):
+            with open(requirements_json, "r") as f:
+                shared_modules.update(load(f).get("shared_modules", []))
+
+        fingerprint = Fingerprint(self.root_path)
+        fingerprint.add_text("parameters", dumps(parameters, sort_keys=True))
+        fingerprint.add_path(pipeline_path)
+        fingerprint.add_path(path.join(shared_path, "manifest.json"))
+        fingerprint.add_path(path.join(shared_path, "__init__.py"))
+        for module in sorted(shared_modules):
+            fingerprint.add_path(path.join(shared_path, module))
+        fingerprint.add_path(path.join(self.root_path, "docker"))
+
+        # builder tests and fixtures do not change the synthesized templates
+        for source in sorted(
+            glob(path.join(BUILDER_PATH, "**", "*.py"), recursive=True)
+        ):
+            if "tests" not in path.relpath(source, BUILDER_PATH).split(
+                path.sep
+            ):
+                fingerprint.add_file(source)
+
+        return fingerprint.value
+
+    @staticmethod
+    def __read_json(file_path: str) -> Dict[str, Any]:
+        with open(file_path, "r") as f:
+            return load(f)
+
+    @staticmethod
+    def __write_json(file_path: str, content: Dict[str, Any]) -> None:
+        with open(file_path, "w") as f:
+            dump(content, f, indent=1)
+
+    @staticmethod
+    def __find_imports(content: Any) -> List[str]:
+        if isinstance(content, dict):
+            if list(content.keys()) == ["Fn::ImportValue"] and isinstance(
+                content["Fn::ImportValue"], str
+            ):
+                return [content["Fn::ImportValue"]]
+            content = list(content.values())
+
+        if isinstance(content, list):
+            return [
+                i for item in content for i in SynthCache.__find_imports(item)
+            ]
+
+        return []
+
+    def __get_exports(self) -> Dict[str, Dict[str, Any]]:
+        exports: Dict[str, Dict[str, Any]] = {}
+        for template_path in glob(path.join(self.outdir, "*.template.json")):
+            stack_name = path.basename(template_path)[: -len(".template.json")]
+            template = self.__read_json(template_path)
+            for output in template.get("Outputs", {}).values():
+                if "Export" in output:
+                    exports[output["Export"]["Name"]] = {
+                        "stack": stack_name,
+                        "value": output["Value"],
+                    }
+
+        return exports
+
+    def __snapshot(self, stack_name: str, fingerprint: str) -> Optional[str]:
+        template_path = path.join(self.outdir, f"{stack_name}.template.json")
+        assets_path = path.join(self.outdir, f"{stack_name}.assets.json")
+        if not path.isfile(template_path) or not path.isfile(assets_path):
+            return None
+
+        template = self.__read_json(template_path)
+        if (
+            template.get("Metadata", {}).get(FINGERPRINT_METADATA)
+            != fingerprint
+        ):
+            return None
+
+        exports = self.__get_exports()
+        imports = {}
+        for name in self.__find_imports(template):
+            if name not in exports:
+                return None
+            imports[name] = exports[name]
+
+        for section, elements in SYNTHESIZER_ELEMENTS.items():
+            for element in elements:
+                template.get(section, {}).pop(element, None)
+            if section in template and not template[section]:
+                template.pop(section)
+
+        makedirs(self.cache_path, exist_ok=True)
+        temp_snapshot = mkdtemp(dir=self.cache_path)
+        try:
+            assets = self.__read_json(assets_path)
+            assets.pop("version", None)
+            for kind, key in [("files", "path"), ("dockerImages", "directory")]:
+                for source_hash, asset in list(assets.get(kind, {}).items()):
+                    source = asset["source"]
+                    # the template itself is added again by the synthesizer
+                    if source.get(key) == path.basename(template_path):
+                        assets[kind].pop(source_hash)
+                        continue
+
+                    asset_path = path.join(self.outdir, source[key])
+                    target = path.join(temp_snapshot, "assets", source_hash)
+                    if path.isdir(asset_path):
+                        copytree(asset_path, target)
+                    elif path.isfile(asset_path):
+                        makedirs(path.dirname(target), exist_ok=True)
+                        copyfile(asset_path, target)
+                    else:
+                        return None
+                    source[key] = path.join("assets", source_hash)
+
+            self.__write_json(
+                path.join(temp_snapshot, "template.json"), template
+            )
+            self.__write_json(path.join(temp_snapshot, "assets.json"), assets)
+            self.__write_json(path.join(temp_snapshot, "imports.json"), imports)
+            self.__write_json(
+                path.join(temp_snapshot, "snapshot.json"),
+                {"fingerprint": fingerprint},
+            )
+
+            snapshot = path.join(self.cache_path, stack_name)
+            if path.isdir(snapshot):
+                rmtree(snapshot)
+            replace(temp_snapshot, snapshot)
+        finally:
+            if path.isdir(temp_snapshot):
+                rmtree(temp_snapshot)
+
+        return snapshot
+
+    def get(self, stack_name: str, fingerprint: str) -> Optional[str]:
+        snapshot = path.join(self.cache_path, stack_name)
+        snapshot_json = path.join(snapshot, "snapshot.json")
+
+        if path.isfile(snapshot_json):
+            if (
+                self.__read_json(snapshot_json).get("fingerprint")
+                == fingerprint
+            ):
+                return snapshot
+
+        return self.__snapshot(stack_name, fingerprint)
+
+    @staticmethod
+    def __get_export(producer: Stack, value: Dict[str, Any]) -> Optional[str]:
+        if "Ref" in value:
+            logical_id, attribute = value["Ref"], None
+        elif "Fn::GetAtt" in value:
+            logical_id, attribute = value["Fn::GetAtt"]
+        else:
+            return None
+
+        for construct in producer.node.find_all():
+            if not isinstance(construct, CfnResource):
+                continue
+
+            if producer.resolve(construct.logical_id) != logical_id:
+                continue
+
+            if attribute:
+                return Token.as_string(construct.get_att(attribute))
+            return construct.ref
+
+        return None
+
+    def get_function_export(
+        self, snapshot: str, function_name: str
+    ) -> Optional[str]:
+        template = self.__read_json(path.join(snapshot, "template.json"))
+        for logical_id, resource in template.get("Resources", {}).items():
+            if resource.get("Type") != "AWS::Lambda::Function":
+                continue
+
+            if resource.get("Properties", {}).get("FunctionName") != (
+                function_name
+            ):
+                continue
+
+            for output in template.get("Outputs", {}).values():
+                if output.get("Value") == {
+                    "Fn::GetAtt": [logical_id, "Arn"]
+                } and isinstance(output.get("Export", {}).get("Name"), str):
+                    return output["Export"]["Name"]
+
+        return None
+
+    def include(
+        self, stack: Stack, snapshot: str, producers: Dict[str, Stack]
+    ) -> bool:
+        imports = self.__read_json(path.join(snapshot, "imports.json"))
+
+        # every imported value must still be produced by the current app
+        exports: List[Tuple[Stack, str]] = []
+        for imported in imports.values():
+            producer = producers.get(imported["stack"])
+            if not producer:
+                return False
+
+            value = self.__get_export(producer, imported["value"])
+            if not value:
+                return False
+            exports.append((producer, value))
+
+        for producer, value in exports:
+            producer.export_value(value)
+            stack.add_dependency(producer)
+
+        cfn_inc.CfnInclude(
+            stack,
+            "Template",
+            template_file=path.join(snapshot, "template.json"),
+        )
+
+        assets = self.__read_json(path.join(snapshot, "assets.json"))
+        for source_hash, asset in assets.get("files", {}).items():
+            stack.synthesizer.add_file_asset(
+                source_hash=source_hash,
+                file_name=path.join(snapshot, asset["source"]["path"]),
+                packaging=PACKAGING[asset["source"].get("packaging", "file")],
+            )
+
+        for source_hash, asset in assets.get("dockerImages", {}).items():
+            source = asset["source"]
+            stack.synthesizer.add_docker_image_asset(
+                source_hash=source_hash,
+                directory_name=path.join(snapshot, source["directory"]),
+                docker_build_args=source.get("dockerBuildArgs"),
+                docker_build_target=source.get("dockerBuildTarget"),
+                docker_file=source.get("dockerFile"),
+                network_mode=source.get("networkMode"),
+                platform=source.get("platform"),
+            )
+
+        return True
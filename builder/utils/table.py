@@ -0,0 +1,10 @@
+from typing import List
+
+
+def format_table(header: List[str], rows: List[List[str]]) -> List[str]:
+    rows = [header] + rows
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return [
+        "  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip()
+        for row in rows
+    ]
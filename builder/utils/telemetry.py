@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from json import dump
+from os import (
+    makedirs,
+    path,
+    replace,
+)
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+)
+
+from builder.utils.table import format_table
+
+PHASES = [
+    "fingerprint",
+    "parse",
+    "install",
+    "prune",
+    "zip",
+    "jars",
+    "importtime",
+    "base",
+]
+
+
+@dataclass
+class ModuleTelemetry:
+    module: str
+    method: str
+    cache_hit: bool = False
+    dependencies_hit: bool = True
+    seconds: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    sizes: Dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (
+                self.phases.get(name, 0.0) + perf_counter() - start
+            )
+
+
+class BuildTelemetry:
+    def __init__(self) -> None:
+        self._modules: List[ModuleTelemetry] = []
+        self._lock = Lock()
+
+    def module(self, module: str, method: str) -> ModuleTelemetry:
+        record = ModuleTelemetry(module=module, method=method)
+        with self._lock:
+            self._modules.append(record)
+
+        return record
+
+    def reset(self) -> None:
+        with self._lock:
+            self._modules = []
+
+    @property
+    def modules(self) -> List[ModuleTelemetry]:
+        with self._lock:
+            return sorted(
+                self._modules, key=lambda record: record.seconds, reverse=True
+            )
+
+    def to_pydict(self) -> Dict[str, Any]:
+        modules = self.modules
+        return {
+            "modules": [vars(record) for record in modules],
+            "cache_hits": len([m for m in modules if m.cache_hit]),
+            "cache_misses": len([m for m in modules if not m.cache_hit]),
+            "seconds": sum(record.seconds for record in modules),
+        }
+
+    def write(self, report_path: str) -> None:
+        makedirs(path.dirname(report_path), exist_ok=True)
+        temp_report = f"{report_path}.tmp"
+        with open(temp_report, "w") as f:
+            dump(self.to_pydict(), f, indent=4)
+        replace(temp_report, report_path)
+
+    def summary(self, top: int = 20) -> str:
+        modules = self.modules
+        if not modules:
+            return "No modules were built."
+
+        header = ["module", "method", "cache", "total"] + PHASES + ["size"]
+        rows: List[List[str]] = []
+        for record in modules[0:top]:
+            rows.append(
+                [
+                    record.module,
+                    record.method,
+                    "hit" if record.cache_hit else "miss",
+                    f"{record.seconds:.2f}s",
+                ]
+                + [f"{record.phases.get(p, 0.0):.2f}s" for p in PHASES]
+                + [f"{record.sizes.get('after', 0) / 1024 / 1024:.1f}MB"]
+            )
+
+        lines = format_table(header, rows)
+
+        pydict = self.to_pydict()
+        lines.append(
+            f"{len(modules)} modules, {pydict['cache_hits']} cached, {pydict['seconds']:.2f}s total build time"
+        )
+
+        return "\n".join(lines)
+
+
+BUILD_TELEMETRY = BuildTelemetry()
@@ -0,0 +1,73 @@
+import unittest
+from os import (
+    makedirs,
+    path,
+    utime,
+)
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from builder.utils.archive import (
+    zip_folder,
+    zip_folders,
+)
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+        self.folder = path.join(self.root, "folder")
+
+        self.__write(path.join(self.folder, "b.py"), "b = 1\n")
+        self.__write(path.join(self.folder, "pkg", "a.py"), "a = 1\n")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    @staticmethod
+    def __write(file_path: str, content: str) -> None:
+        makedirs(path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+
+    def __read(self, zip_path: str) -> bytes:
+        with open(zip_path, "rb") as f:
+            return f.read()
+
+    def test_zip_is_reproducible(self) -> None:
+        first = path.join(self.root, "first.zip")
+        second = path.join(self.root, "second.zip")
+
+        zip_folder(self.folder, first)
+        utime(path.join(self.folder, "b.py"), (1700000000, 1700000000))
+        zip_folder(self.folder, second)
+
+        self.assertEqual(self.__read(first), self.__read(second))
+
+    def test_source_date_epoch(self) -> None:
+        zip_path = path.join(self.root, "out.zip")
+
+        with patch.dict("os.environ", {"SOURCE_DATE_EPOCH": "1700000000"}):
+            zip_folder(self.folder, zip_path)
+
+        with ZipFile(zip_path) as zip_file:
+            self.assertEqual(
+                zip_file.getinfo("b.py").date_time, (2023, 11, 14, 22, 13, 20)
+            )
+
+    def test_first_folder_takes_precedence(self) -> None:
+        other = path.join(self.root, "other")
+        self.__write(path.join(other, "b.py"), "b = 2\n")
+        self.__write(path.join(other, "c.py"), "c = 1\n")
+        zip_path = path.join(self.root, "out.zip")
+
+        zip_folders([self.folder, other], zip_path, prefix="python")
+
+        with ZipFile(zip_path) as zip_file:
+            self.assertEqual(
+                zip_file.namelist(),
+                ["python/b.py", "python/c.py", "python/pkg/a.py"],
+            )
+            self.assertEqual(zip_file.read("python/b.py"), b"b = 1\n")
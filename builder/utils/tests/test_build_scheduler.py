@@ -0,0 +1,66 @@
+import unittest
+from threading import Lock
+from time import sleep
+from typing import (
+    Any,
+    List,
+)
+
+from builder.utils.build_scheduler import BuildScheduler
+from builder.utils.dockerbuild import DockerBuilderMethod
+
+
+class FakeBuilder:
+    def __init__(self, assets_path: str, calls: List[str], lock: Lock) -> None:
+        self.assets_path = assets_path
+        self.calls = calls
+        self.lock = lock
+
+    def build(self, method: DockerBuilderMethod) -> Any:
+        sleep(0.01)
+        with self.lock:
+            self.calls.append(self.assets_path)
+
+        if self.assets_path == "broken":
+            raise RuntimeError("docker build failed")
+
+        return f"{self.assets_path}:{method.value}"
+
+
+class TestBuildScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls: List[str] = []
+        self.lock = Lock()
+
+    def __builder(self, assets_path: str) -> Any:
+        return FakeBuilder(assets_path, self.calls, self.lock)
+
+    def test_run_deduplicates_modules(self) -> None:
+        scheduler = BuildScheduler(max_workers=4)
+
+        key1 = scheduler.add(self.__builder("a"), DockerBuilderMethod.GLUE)
+        key2 = scheduler.add(self.__builder("a"), DockerBuilderMethod.GLUE)
+        key3 = scheduler.add(self.__builder("b"), DockerBuilderMethod.LAMBDA)
+        scheduler.run()
+
+        self.assertEqual(key1, key2)
+        self.assertEqual(sorted(self.calls), ["a", "b"])
+        self.assertEqual(scheduler.get(key1), "a:glue")
+        self.assertEqual(scheduler.get(key3), "b:lambda")
+
+    def test_run_raises_build_errors(self) -> None:
+        scheduler = BuildScheduler(max_workers=2)
+        scheduler.add(self.__builder("broken"), DockerBuilderMethod.GLUE)
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run()
+
+    def test_get_unknown_build(self) -> None:
+        scheduler = BuildScheduler(max_workers=1)
+
+        with self.assertRaises(KeyError):
+            scheduler.get(("a", DockerBuilderMethod.GLUE))
+
+    def test_invalid_workers(self) -> None:
+        with self.assertRaises(ValueError):
+            BuildScheduler(max_workers=0)
@@ -0,0 +1,81 @@
+import unittest
+from os import (
+    listdir,
+    path,
+)
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from builder.model.config.pipeline import PipelineConfig
+from builder.model.property.environment import Environment
+from builder.utils.config_loader import PipelineConfigLoader
+
+CONFIG = """
+name: {name}
+domain: example
+layers:
+  origin: raw
+  target: trusted
+triggers: []
+contract: {{}}
+steps: {{}}
+"""
+
+
+class TestPipelineConfigLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.cache_path = path.join(self.tmp.name, "cache")
+        self.config_paths = []
+        for name in ["first", "second"]:
+            config_path = path.join(self.tmp.name, f"{name}.yml")
+            with open(config_path, "w") as f:
+                f.write(CONFIG.format(name=name))
+            self.config_paths.append(config_path)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __loader(self) -> PipelineConfigLoader:
+        return PipelineConfigLoader(
+            env=Environment.TEST, cache_path=self.cache_path, max_workers=2
+        )
+
+    def test_load_keeps_order(self) -> None:
+        configs = self.__loader().load(self.config_paths)
+
+        self.assertEqual([c.name.name for c in configs], ["first", "second"])
+        self.assertEqual(len(listdir(self.cache_path)), 2)
+
+    def test_load_from_cache(self) -> None:
+        self.__loader().load(self.config_paths)
+
+        with patch(
+            "builder.utils.config_loader.PipelineConfig.from_pydict",
+            side_effect=PipelineConfig.from_pydict,
+        ) as from_pydict:
+            configs = self.__loader().load(self.config_paths)
+
+        self.assertEqual(from_pydict.call_count, 0)
+        self.assertEqual(configs[1].domain, "example")
+
+    def test_changed_config_is_parsed(self) -> None:
+        self.__loader().load(self.config_paths)
+
+        with open(self.config_paths[0], "w") as f:
+            f.write(CONFIG.format(name="renamed"))
+
+        configs = self.__loader().load(self.config_paths)
+
+        self.assertEqual(configs[0].name.name, "renamed")
+        self.assertEqual(len(listdir(self.cache_path)), 3)
+
+    def test_invalid_cache_is_ignored(self) -> None:
+        self.__loader().load(self.config_paths)
+        for cache_file in listdir(self.cache_path):
+            with open(path.join(self.cache_path, cache_file), "wb") as f:
+                f.write(b"")
+
+        configs = self.__loader().load(self.config_paths)
+
+        self.assertEqual(configs[0].name.name, "first")
@@ -0,0 +1,143 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+
+from aws_cdk import (
+    App,
+    Stack,
+)
+from aws_cdk import aws_sns as sns_
+
+from builder.utils.deploy_plan import (
+    StackGraph,
+    get_deploy_commands,
+    main,
+    read_digests,
+)
+
+
+class TestDeployPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __synth(self, name: str, topic_a: str = "a", shared: str = "s") -> str:
+        outdir = path.join(self.root, name)
+        app = App(outdir=outdir)
+
+        pipeline_a = Stack(app, "pipeline-a-stack")
+        sns_.Topic(pipeline_a, "topic", display_name=topic_a)
+        pipeline_b = Stack(app, "pipeline-b-stack")
+        sns_.Topic(pipeline_b, "topic", display_name="b")
+
+        storage = Stack(app, "storage-stack")
+        storage.add_dependency(pipeline_a)
+        storage.add_dependency(pipeline_b)
+
+        shared_stack = Stack(app, "shared-stack")
+        sns_.Topic(shared_stack, "topic", display_name=shared)
+        shared_stack.add_dependency(storage)
+
+        app.synth()
+        return outdir
+
+    def test_from_assembly(self) -> None:
+        graph = StackGraph.from_assembly(self.__synth("first"))
+
+        self.assertEqual(
+            graph.dependencies,
+            {
+                "pipeline-a-stack": [],
+                "pipeline-b-stack": [],
+                "storage-stack": ["pipeline-a-stack", "pipeline-b-stack"],
+                "shared-stack": ["storage-stack"],
+            },
+        )
+        self.assertEqual(
+            graph.digests,
+            StackGraph.from_assembly(self.__synth("second")).digests,
+        )
+
+    def test_plan_first_deploy(self) -> None:
+        plan = StackGraph.from_assembly(self.__synth("first")).plan({})
+
+        self.assertEqual(plan["unchanged"], [])
+        self.assertEqual(
+            plan["waves"],
+            [
+                ["pipeline-a-stack", "pipeline-b-stack"],
+                ["storage-stack"],
+                ["shared-stack"],
+            ],
+        )
+
+    def test_plan_changed(self) -> None:
+        previous = read_digests(self.__synth("first"))
+        graph = StackGraph.from_assembly(
+            self.__synth("second", topic_a="changed", shared="changed")
+        )
+        plan = graph.plan(previous)
+
+        self.assertEqual(plan["changed"], ["pipeline-a-stack", "shared-stack"])
+        self.assertEqual(plan["removed"], [])
+        # shared still goes after the pipeline it transitively depends on
+        self.assertEqual(
+            plan["waves"], [["pipeline-a-stack"], ["shared-stack"]]
+        )
+
+    def test_plan_removed(self) -> None:
+        graph = StackGraph.from_assembly(self.__synth("first"))
+        previous = {**graph.digests, "old-stack": "digest"}
+
+        plan = graph.plan(previous)
+
+        self.assertEqual(plan["removed"], ["old-stack"])
+        self.assertEqual(plan["waves"], [])
+
+    def test_waves_cycle(self) -> None:
+        graph = StackGraph(
+            dependencies={"a": ["b"], "b": ["a"]},
+            digests={"a": "1", "b": "2"},
+        )
+
+        with self.assertRaises(ValueError):
+            graph.waves(["a"])
+
+    def test_get_deploy_commands(self) -> None:
+        commands = get_deploy_commands(
+            "cdk.out", [["a", "b", "c"], ["d"]], concurrency=2
+        )
+
+        self.assertEqual(
+            commands,
+            [
+                "cdk deploy --app cdk.out --exclusively --require-approval never --concurrency 2 a b c",
+                "cdk deploy --app cdk.out --exclusively --require-approval never --concurrency 1 d",
+            ],
+        )
+
+    def test_main(self) -> None:
+        outdir = self.__synth("first")
+        state = path.join(self.root, "state", "deployed.json")
+        output = path.join(self.root, "plan.json")
+        args = ["--outdir", outdir, "--previous", state, "--output", output]
+
+        with redirect_stdout(StringIO()) as stdout:
+            main(args)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 3)
+
+        main(["--outdir", outdir, "--previous", state, "--save"])
+        with redirect_stdout(StringIO()) as stdout:
+            main(args)
+        self.assertEqual(
+            stdout.getvalue(), "No stack changed since the last deploy.\n"
+        )
+
+        with open(output, "r") as f:
+            self.assertEqual(load(f)["waves"], [])
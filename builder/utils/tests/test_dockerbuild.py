@@ -0,0 +1,671 @@
+import unittest
+from hashlib import sha256
+from json import (
+    dump,
+    load,
+)
+from os import (
+    makedirs,
+    path,
+    pathsep,
+)
+from shutil import (
+    copyfile,
+    copytree,
+)
+from subprocess import (
+    CalledProcessError,
+    CompletedProcess,
+    run,
+)
+from sys import executable
+from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from builder.utils.dockerbuild import (
+    DockerBuilder,
+    DockerBuilderMethod,
+    DockerBuilderOptions,
+    GlueDockerProperties,
+)
+from builder.utils.telemetry import BUILD_TELEMETRY
+
+
+class TestDockerBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+        self.module = path.join(self.root, "steps", "module")
+
+        makedirs(path.join(self.module, "src"))
+        makedirs(path.join(self.root, "docker"))
+        makedirs(path.join(self.root, "shared", "example"))
+
+        self.__write(path.join(self.module, "src", "index.py"), "x = 1\n")
+        self.__write(path.join(self.root, "docker", "Dockerfile.glue"), "")
+        self.__write(path.join(self.root, "docker", "Dockerfile.lambda"), "")
+        self.__write(
+            path.join(self.root, "shared", "example", "__init__.py"), ""
+        )
+        self.__write_json(
+            path.join(self.root, "shared", "manifest.json"),
+            {"example": {"packages": ["requests"], "extra_jars": []}},
+        )
+        self.__write_json(
+            path.join(self.module, "requirements.json"),
+            {
+                "packages": ["numpy"],
+                "extra_jars": [],
+                "shared_modules": ["example"],
+            },
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    @staticmethod
+    def __write(file_path: str, content: str) -> None:
+        with open(file_path, "w") as f:
+            f.write(content)
+
+    @staticmethod
+    def __write_json(file_path: str, content: dict) -> None:
+        with open(file_path, "w") as f:
+            dump(content, f)
+
+    def __fake_docker(self, command: List[str], **kwargs: Any) -> None:
+        # lambda base stages are only built into the docker cache
+        if self.__is_base_build(command):
+            return
+
+        dockerfile = command[command.index("-f") + 1]
+        output = command[command.index("--output") + 1]
+        makedirs(output, exist_ok=True)
+
+        if dockerfile.endswith("Dockerfile.wheelhouse"):
+            self.__write(path.join(output, "numpy-1.0-py3-none-any.whl"), "")
+        else:
+            self.__write(path.join(output, "numpy.py"), "x = 1\n")
+            makedirs(path.join(output, "numpy", "tests"))
+            self.__write(path.join(output, "numpy", "tests", "t.py"), "x" * 64)
+
+    @staticmethod
+    def __count_builds(docker: Any, dockerfile: str) -> int:
+        return len(
+            [
+                call
+                for call in docker.call_args_list
+                if call.args[0][call.args[0].index("-f") + 1].endswith(
+                    dockerfile
+                )
+            ]
+        )
+
+    def __copy_module(self, name: str) -> str:
+        module = path.join(self.root, "steps", name)
+        copytree(self.module, module)
+        return module
+
+    def test_glue_build_is_cached(self) -> None:
+        BUILD_TELEMETRY.reset()
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props = builder.build(DockerBuilderMethod.GLUE)
+            builder.build(DockerBuilderMethod.GLUE)
+
+        self.assertIsInstance(props, GlueDockerProperties)
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 1)
+
+        records = BUILD_TELEMETRY.modules
+        self.assertEqual(
+            sorted(record.cache_hit for record in records), [False, True]
+        )
+        self.assertTrue(all("fingerprint" in r.phases for r in records))
+
+    def test_glue_build_invalidated_by_shared_module(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            builder.build(DockerBuilderMethod.GLUE)
+            self.__write(
+                path.join(self.root, "shared", "example", "__init__.py"),
+                "y = 2\n",
+            )
+            builder.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 2)
+
+    def test_identical_dependencies_are_built_once(self) -> None:
+        other = self.__copy_module("other")
+        builder1 = DockerBuilder(root_path=self.root, module_path=self.module)
+        builder2 = DockerBuilder(root_path=self.root, module_path=other)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props1 = builder1.build(DockerBuilderMethod.GLUE)
+            props2 = builder2.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 1)
+        self.assertEqual(props1.dependencies_zip, props2.dependencies_zip)  # type: ignore
+        self.assertNotEqual(props1.script, props2.script)  # type: ignore
+
+    def test_different_dependencies_are_built_apart(self) -> None:
+        other = self.__copy_module("other")
+        self.__write_json(
+            path.join(other, "requirements.json"),
+            {"packages": ["pandas"], "extra_jars": [], "shared_modules": []},
+        )
+        builder1 = DockerBuilder(root_path=self.root, module_path=self.module)
+        builder2 = DockerBuilder(root_path=self.root, module_path=other)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props1 = builder1.build(DockerBuilderMethod.GLUE)
+            props2 = builder2.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 2)
+        self.assertNotEqual(props1.dependencies_zip, props2.dependencies_zip)  # type: ignore
+
+    def test_locked_dependencies(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(lock=True),
+        )
+        lock = ["numpy==1.0 --hash=sha256:abc"]
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker, patch(
+            "builder.utils.dockerbuild.LockResolver.resolve",
+            return_value=lock,
+        ):
+            builder.build(DockerBuilderMethod.GLUE)
+
+        command = docker.call_args_list[-1].args[0]
+        self.assertIn("PIP_NO_DEPS=1", command)
+
+        requirements = command[command.index("--build-arg") + 1]
+        with open(path.join(self.root, requirements.split("=", 1)[1])) as f:
+            self.assertEqual(f.read().splitlines(), lock)
+
+    def test_conflicting_pins(self) -> None:
+        self.__write_json(
+            path.join(self.module, "requirements.json"),
+            {
+                "packages": ["requests==1.0"],
+                "extra_jars": [],
+                "shared_modules": ["example"],
+            },
+        )
+        self.__write_json(
+            path.join(self.root, "shared", "manifest.json"),
+            {"example": {"packages": ["requests==2.0"], "extra_jars": []}},
+        )
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with self.assertRaises(Exception):
+            builder.build(DockerBuilderMethod.GLUE)
+
+    def test_lambda_properties_are_relative(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            props = builder.build(DockerBuilderMethod.LAMBDA)
+
+        self.assertEqual(props.source, "steps/module")  # type: ignore
+        self.assertTrue(props.bundle.startswith(".builder_cache/"))  # type: ignore
+        self.assertTrue(path.isdir(path.join(self.root, props.bundle)))  # type: ignore
+
+        excludes = props.get_excludes()  # type: ignore
+        self.assertEqual(excludes[0], "*")
+        self.assertIn("!docker/Dockerfile.lambda", excludes)
+        self.assertIn(f"!{props.bundle}", excludes)  # type: ignore
+        self.assertIn("steps/module/*", excludes)
+        self.assertEqual(excludes[-1], "!steps/module/src")
+
+    @staticmethod
+    def __is_base_build(command: List[str]) -> bool:
+        return "--target" in command and "base" in command
+
+    def test_lambda_base_is_shared(self) -> None:
+        other = self.__copy_module("other")
+        builders = [
+            DockerBuilder(
+                root_path=self.root, module_path=module, lambda_base=0
+            )
+            for module in [self.module, other]
+        ]
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props = [b.build(DockerBuilderMethod.LAMBDA) for b in builders]
+            builders[0].build(DockerBuilderMethod.LAMBDA)
+
+        bases = [
+            call.args[0]
+            for call in docker.call_args_list
+            if self.__is_base_build(call.args[0])
+        ]
+        self.assertEqual(len(bases), 1)
+        self.assertIn(f"BUNDLE={props[0].bundle}", bases[0])  # type: ignore
+        self.assertEqual(props[0].bundle, props[1].bundle)  # type: ignore
+
+    def test_lambda_base_is_skipped(self) -> None:
+        builders = [
+            DockerBuilder(root_path=self.root, module_path=self.module),
+            DockerBuilder(
+                root_path=self.root,
+                module_path=self.module,
+                options=DockerBuilderOptions(
+                    native=[DockerBuilderMethod.LAMBDA]
+                ),
+                lambda_base=0,
+            ),
+        ]
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker, patch(
+            "builder.utils.native_build.check_call",
+            side_effect=CalledProcessError(1, "pip"),
+        ):
+            for builder in builders:
+                builder.build(DockerBuilderMethod.LAMBDA)
+
+        self.assertFalse(
+            any(
+                self.__is_base_build(call.args[0])
+                for call in docker.call_args_list
+            )
+        )
+
+    def test_wheelhouse_is_filled(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            builder.build(DockerBuilderMethod.GLUE)
+
+        self.assertTrue(
+            path.isfile(
+                path.join(builder.wheelhouse_path, "numpy-1.0-py3-none-any.whl")
+            )
+        )
+
+    def test_offline_skips_wheelhouse_build(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(offline=True),
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            builder.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(
+            self.__count_builds(docker, "Dockerfile.wheelhouse"), 0
+        )
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 1)
+
+    def test_lambda_package_zip(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            props = builder.build(DockerBuilderMethod.LAMBDA)
+
+        package_zip = builder.get_lambda_package(props)  # type: ignore
+        with ZipFile(package_zip) as zip_file:
+            self.assertEqual(
+                sorted(zip_file.namelist()), ["index.py", "numpy.py"]
+            )
+
+        self.assertEqual(builder.get_lambda_package(props), package_zip)  # type: ignore
+
+    def test_glue_shared_modules_are_built_once(self) -> None:
+        other = self.__copy_module("other")
+        self.__write_json(
+            path.join(other, "requirements.json"),
+            {
+                "packages": ["pandas"],
+                "extra_jars": [],
+                "shared_modules": ["example"],
+            },
+        )
+        builder1 = DockerBuilder(
+            root_path=self.root, module_path=self.module, shared_layers=True
+        )
+        builder2 = DockerBuilder(
+            root_path=self.root, module_path=other, shared_layers=True
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props1 = builder1.build(DockerBuilderMethod.GLUE)
+            props2 = builder2.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.glue"), 3)
+        self.assertEqual(len(props1.shared_zips), 1)  # type: ignore
+        self.assertEqual(props1.shared_zips, props2.shared_zips)  # type: ignore
+        self.assertNotEqual(props1.dependencies_zip, props2.dependencies_zip)  # type: ignore
+
+    def test_lambda_shared_layers(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root, module_path=self.module, shared_layers=True
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            props = builder.build(DockerBuilderMethod.LAMBDA)
+
+        self.assertEqual(list(props.layers.keys()), ["example"])  # type: ignore
+        with ZipFile(props.layers["example"]) as zip_file:  # type: ignore
+            self.assertEqual(zip_file.namelist(), ["python/numpy.py"])
+
+    def __fake_docker_shared(self, command: List[str], **kwargs: Any) -> None:
+        self.__fake_docker(command, **kwargs)
+        modules = next(
+            (
+                arg.split("=", 1)[1]
+                for arg in command
+                if arg.startswith("SHARED_MODULES=")
+            ),
+            None,
+        )
+        if modules is None:
+            return
+
+        # copies shared modules like the bundle stage of the dockerfiles
+        output = command[command.index("--output") + 1]
+        with open(path.join(self.root, modules), "r") as f:
+            for module in filter(None, f.read().splitlines()):
+                copytree(
+                    path.join(self.root, module),
+                    path.join(output, "shared", path.basename(module)),
+                )
+                copyfile(
+                    path.join(self.root, "shared", "__init__.py"),
+                    path.join(output, "shared", "__init__.py"),
+                )
+
+    def __import_shared(self, python_path: List[str]) -> str:
+        return run(
+            [
+                executable,
+                "-c",
+                "import shared.example, shared.other; "
+                "print(shared.example.NAME, shared.other.NAME)",
+            ],
+            env={"PYTHONPATH": pathsep.join(python_path)},
+            cwd=self.module,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def test_shared_modules_are_importable(self) -> None:
+        makedirs(path.join(self.root, "shared", "other"))
+        self.__write(path.join(self.root, "shared", "__init__.py"), "")
+        for module in ["example", "other"]:
+            self.__write(
+                path.join(self.root, "shared", module, "__init__.py"),
+                f'NAME = "{module}"\n',
+            )
+        self.__write_json(
+            path.join(self.root, "shared", "manifest.json"),
+            {
+                "example": {"packages": ["requests"], "extra_jars": []},
+                "other": {"packages": ["pandas"], "extra_jars": []},
+            },
+        )
+        self.__write_json(
+            path.join(self.module, "requirements.json"),
+            {
+                "packages": ["numpy"],
+                "extra_jars": [],
+                "shared_modules": ["example", "other"],
+            },
+        )
+        builder = DockerBuilder(
+            root_path=self.root, module_path=self.module, shared_layers=True
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker_shared,
+        ):
+            glue = builder.build(DockerBuilderMethod.GLUE)
+            lambda_ = builder.build(DockerBuilderMethod.LAMBDA)
+
+        python_path = [glue.dependencies_zip] + glue.shared_zips  # type: ignore
+        self.assertEqual(self.__import_shared(python_path), "example other\n")
+
+        layers: List[str] = []
+        for module, layer in lambda_.layers.items():  # type: ignore
+            layers.append(path.join(self.root, "layers", module))
+            with ZipFile(layer) as zip_file:
+                zip_file.extractall(layers[-1])
+        python_path = [path.join(layer, "python") for layer in layers]
+        self.assertEqual(self.__import_shared(python_path), "example other\n")
+
+    def test_bundle_is_pruned(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            props = builder.build(DockerBuilderMethod.GLUE)
+
+        with ZipFile(props.dependencies_zip) as zip_file:  # type: ignore
+            self.assertEqual(zip_file.namelist(), ["numpy.py"])
+
+        with open(path.join(builder.assets_path, "build.json")) as f:
+            size = load(f)["size"]
+        self.assertEqual(size, {"before": 70, "after": 6})
+
+    def test_size_budget(self) -> None:
+        self.__write_json(
+            path.join(self.module, "requirements.json"),
+            {
+                "packages": ["numpy"],
+                "extra_jars": [],
+                "shared_modules": [],
+                "prune": {"size_budget_mb": 0},
+            },
+        )
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ):
+            with self.assertRaises(Exception):
+                builder.build(DockerBuilderMethod.GLUE)
+
+    def test_import_time_report(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(import_time=True),
+        )
+        importtime = CompletedProcess(
+            [], 0, "", "import time:      5000 |       9000 | index\n"
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ), patch(
+            "builder.utils.dockerbuild.run", return_value=importtime
+        ) as run:
+            builder.build(DockerBuilderMethod.LAMBDA)
+            builder.build(DockerBuilderMethod.LAMBDA)
+
+        self.assertEqual(run.call_count, 1)
+        with open(path.join(builder.assets_path, "importtime.json")) as f:
+            self.assertEqual(load(f)["total_us"], 9000)
+
+    def test_import_time_budget(self) -> None:
+        self.__write_json(
+            path.join(self.module, "requirements.json"),
+            {
+                "packages": ["numpy"],
+                "extra_jars": [],
+                "shared_modules": [],
+                "import_time_budget_ms": 5,
+            },
+        )
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(import_time=True),
+        )
+        importtime = CompletedProcess(
+            [], 0, "", "import time:      5000 |       9000 | index\n"
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ), patch("builder.utils.dockerbuild.run", return_value=importtime):
+            with self.assertRaises(Exception):
+                builder.build(DockerBuilderMethod.LAMBDA)
+
+    def test_fingerprint_ignores_bytecode(self) -> None:
+        builder = DockerBuilder(root_path=self.root, module_path=self.module)
+        before = builder.get_fingerprint(DockerBuilderMethod.GLUE)
+
+        makedirs(path.join(self.module, "src", "__pycache__"))
+        self.__write(
+            path.join(self.module, "src", "__pycache__", "index.pyc"), "pyc"
+        )
+
+        after = builder.get_fingerprint(DockerBuilderMethod.GLUE)
+        self.assertEqual(before, after)
+
+    @staticmethod
+    def __sha256(file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return sha256(f.read()).hexdigest()
+
+    def __build_outputs(self, root: str) -> Dict[str, Any]:
+        module = path.join(root, "steps", "module")
+        builder = DockerBuilder(
+            root_path=root, module_path=module, lambda_base=0
+        )
+
+        with patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            glue = builder.build(DockerBuilderMethod.GLUE)
+            lambda_ = builder.build(DockerBuilderMethod.LAMBDA)
+
+        return {
+            "base_args": [
+                command[i + 1]
+                for command in [call.args[0] for call in docker.call_args_list]
+                if self.__is_base_build(command)
+                for i, arg in enumerate(command)
+                if arg == "--build-arg"
+            ],
+            "bundle": lambda_.bundle,  # type: ignore
+            "excludes": lambda_.get_excludes(),  # type: ignore
+            "dependencies_zip": self.__sha256(
+                path.join(root, glue.dependencies_zip)  # type: ignore
+            ),
+            "lambda_package": self.__sha256(
+                builder.get_lambda_package(lambda_)  # type: ignore
+            ),
+        }
+
+    def test_builds_are_deterministic(self) -> None:
+        other = path.join(self.root, "other")
+        copytree(self.root, other, ignore=lambda _, names: ["other"])
+
+        first = self.__build_outputs(self.root)
+        second = self.__build_outputs(other)
+
+        self.assertIn(f"BUNDLE={first['bundle']}", first["base_args"])
+        self.assertEqual(first, second)
+
+    @staticmethod
+    def __fake_pip(command: List[str], **kwargs: Any) -> None:
+        target = command[command.index("--target") + 1]
+        with open(path.join(target, "numpy.py"), "w") as f:
+            f.write("")
+
+    def test_native_glue_build_skips_docker(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(native=[DockerBuilderMethod.GLUE]),
+        )
+
+        with patch(
+            "builder.utils.native_build.check_call",
+            side_effect=self.__fake_pip,
+        ), patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            props = builder.build(DockerBuilderMethod.GLUE)
+
+        self.assertEqual(docker.call_count, 0)
+        with ZipFile(path.join(self.root, props.dependencies_zip)) as zip_file:  # type: ignore
+            self.assertIn("numpy.py", zip_file.namelist())
+            self.assertIn("shared/example/__init__.py", zip_file.namelist())
+
+    def test_native_build_falls_back_to_docker(self) -> None:
+        builder = DockerBuilder(
+            root_path=self.root,
+            module_path=self.module,
+            options=DockerBuilderOptions(native=[DockerBuilderMethod.LAMBDA]),
+        )
+
+        with patch(
+            "builder.utils.native_build.check_call",
+            side_effect=CalledProcessError(1, "pip"),
+        ), patch(
+            "builder.utils.dockerbuild.check_call",
+            side_effect=self.__fake_docker,
+        ) as docker:
+            builder.build(DockerBuilderMethod.LAMBDA)
+
+        self.assertEqual(self.__count_builds(docker, "Dockerfile.lambda"), 1)
@@ -0,0 +1,32 @@
+import unittest
+
+from builder.utils.importtime import (
+    importtime_report,
+    parse_importtime,
+)
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |       4500 |   json
+import time:      1500 |       1500 |     json.decoder
+import time:       200 |       4820 | index
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    def test_parse_importtime(self) -> None:
+        entries = parse_importtime(OUTPUT)
+
+        self.assertEqual(len(entries), 4)
+        self.assertEqual(entries[1].module, "json")
+        self.assertEqual(entries[1].self_us, 3000)
+        self.assertEqual(entries[1].cumulative_us, 4500)
+
+    def test_importtime_report(self) -> None:
+        report = importtime_report(parse_importtime(OUTPUT), "index", top=2)
+
+        self.assertEqual(report["total_us"], 4820)
+        self.assertEqual(
+            [entry["module"] for entry in report["top"]],
+            ["json", "json.decoder"],
+        )
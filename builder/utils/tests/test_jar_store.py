@@ -0,0 +1,100 @@
+import unittest
+from hashlib import sha256
+from io import BytesIO
+from os import path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest.mock import patch
+
+from builder.utils.jar_store import (
+    JarReference,
+    JarStore,
+)
+
+
+class TestJarReference(unittest.TestCase):
+    def test_from_string(self) -> None:
+        jar = JarReference.from_pydict("https://example.com/lib/a.jar")
+
+        self.assertEqual(jar.url, "https://example.com/lib/a.jar")
+        self.assertIsNone(jar.sha256)
+        self.assertEqual(jar.filename, "a.jar")
+
+    def test_from_string_with_checksum(self) -> None:
+        jar = JarReference.from_pydict("https://example.com/a.jar#sha256=ABC")
+
+        self.assertEqual(jar.sha256, "abc")
+        self.assertEqual(str(jar), "https://example.com/a.jar#sha256=abc")
+
+    def test_from_dict(self) -> None:
+        jar = JarReference.from_pydict(
+            {"url": "https://example.com/a.jar", "sha256": "abc"}
+        )
+
+        self.assertEqual(str(jar), "https://example.com/a.jar#sha256=abc")
+
+    def test_invalid_scheme(self) -> None:
+        with self.assertRaises(ValueError):
+            JarReference.from_pydict("file:///tmp/a.jar")
+
+
+class TestJarStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.content = b"jar content"
+        self.checksum = sha256(self.content).hexdigest()
+        self.url = "https://example.com/lib/a.jar"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __fake_urlopen(self, *args: Any, **kwargs: Any) -> BytesIO:
+        return BytesIO(self.content)
+
+    def test_downloads_once(self) -> None:
+        store = JarStore(store_path=self.tmp.name)
+
+        with patch(
+            "builder.utils.jar_store.urlopen", side_effect=self.__fake_urlopen
+        ) as urlopen:
+            first = store.get(JarReference(self.url))
+            second = store.get(JarReference(self.url))
+
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first, path.join(self.tmp.name, self.checksum, "a.jar")
+        )
+
+    def test_checksum_mismatch(self) -> None:
+        store = JarStore(store_path=self.tmp.name)
+
+        with patch(
+            "builder.utils.jar_store.urlopen", side_effect=self.__fake_urlopen
+        ):
+            with self.assertRaises(ValueError):
+                store.get(JarReference(self.url, sha256="0" * 64))
+
+    def test_offline(self) -> None:
+        with patch(
+            "builder.utils.jar_store.urlopen", side_effect=self.__fake_urlopen
+        ):
+            JarStore(store_path=self.tmp.name).get(JarReference(self.url))
+
+        offline_store = JarStore(store_path=self.tmp.name, offline=True)
+        jar_path = offline_store.get(JarReference(self.url, self.checksum))
+        self.assertTrue(path.isfile(jar_path))
+
+        with self.assertRaises(FileNotFoundError):
+            offline_store.get(JarReference("https://example.com/b.jar"))
+
+    def test_retries_download(self) -> None:
+        store = JarStore(store_path=self.tmp.name, retries=2)
+        responses = [OSError("timeout"), BytesIO(self.content)]
+
+        with patch(
+            "builder.utils.jar_store.urlopen", side_effect=responses
+        ), patch("builder.utils.jar_store.sleep"):
+            jar_path = store.get(JarReference(self.url))
+
+        self.assertTrue(path.isfile(jar_path))
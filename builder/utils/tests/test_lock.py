@@ -0,0 +1,93 @@
+import unittest
+from json import dump
+from os import listdir
+from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from unittest.mock import patch
+
+from builder.utils.lock import (
+    LockResolver,
+    merge_requirements,
+    parse_requirement,
+)
+
+
+class TestMergeRequirements(unittest.TestCase):
+    def test_parse_requirement(self) -> None:
+        self.assertEqual(
+            parse_requirement("Pandas[AWS] >= 1.0, <2"),
+            ("pandas", {"AWS"}, [">=1.0", "<2"]),
+        )
+
+    def test_intersects_specifiers(self) -> None:
+        requirements = merge_requirements(
+            ["pandas>=1.0", "pandas<2", "boto3", "Pandas[aws]"], "test"
+        )
+
+        self.assertEqual(requirements, ["boto3", "pandas[aws]<2,>=1.0"])
+
+    def test_different_pins(self) -> None:
+        with self.assertRaises(Exception):
+            merge_requirements(["pandas==1.0", "pandas==2.0"], "test")
+
+
+class TestLockResolver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.report: Dict[str, Any] = {
+            "install": [
+                {
+                    "metadata": {"name": "Pandas", "version": "1.5.3"},
+                    "download_info": {
+                        "archive_info": {"hashes": {"sha256": "abc"}}
+                    },
+                },
+                {
+                    "metadata": {"name": "numpy", "version": "1.24.2"},
+                    "download_info": {"archive_info": {"hash": "sha256=def"}},
+                },
+            ]
+        }
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __fake_pip(self, command: List[str], **kwargs: Any) -> int:
+        with open(command[command.index("--report") + 1], "w") as f:
+            dump(self.report, f)
+
+        return 0
+
+    def test_resolve_is_cached(self) -> None:
+        resolver = LockResolver(cache_path=self.tmp.name, wheelhouse="wheels")
+
+        with patch(
+            "builder.utils.lock.check_call", side_effect=self.__fake_pip
+        ) as check_call:
+            first = resolver.resolve(["pandas>=1.0"])
+            second = resolver.resolve(["pandas>=1.0"])
+
+        self.assertEqual(check_call.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first,
+            [
+                "numpy==1.24.2 --hash=sha256:def",
+                "pandas==1.5.3 --hash=sha256:abc",
+            ],
+        )
+
+    def test_resolve_without_hash(self) -> None:
+        del self.report["install"][0]["download_info"]["archive_info"]
+        resolver = LockResolver(cache_path=self.tmp.name, wheelhouse="wheels")
+
+        with patch(
+            "builder.utils.lock.check_call", side_effect=self.__fake_pip
+        ):
+            self.assertIsNone(resolver.resolve(["pandas>=1.0"]))
+
+        self.assertEqual(listdir(self.tmp.name), [])
@@ -0,0 +1,56 @@
+import unittest
+
+from builder.model.config.pipeline import PipelineConfig
+from builder.model.property.environment import Environment
+from builder.utils.pipeline_filter import PipelineFilter
+
+
+class TestPipelineFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = PipelineConfig.from_pydict(
+            Environment.TEST,
+            {
+                "name": "pipeline_example",
+                "domain": "example",
+                "layers": {"origin": "raw", "target": "trusted"},
+                "triggers": [],
+                "contract": {},
+                "steps": {},
+                "tags": {"team": "data"},
+            },
+        )
+
+    def test_empty_filter(self) -> None:
+        self.assertTrue(PipelineFilter.from_string("").matches(self.config))
+
+    def test_name(self) -> None:
+        for value in ["pipeline_example", "name:pipeline_*", "other,pipe*"]:
+            self.assertTrue(
+                PipelineFilter.from_string(value).matches(self.config)
+            )
+
+        self.assertFalse(
+            PipelineFilter.from_string("other").matches(self.config)
+        )
+
+    def test_domain(self) -> None:
+        self.assertTrue(
+            PipelineFilter.from_string("domain:example").matches(self.config)
+        )
+        self.assertFalse(
+            PipelineFilter.from_string("domain:sales").matches(self.config)
+        )
+
+    def test_tag(self) -> None:
+        for value in ["tag:team=data", "tag:team", "tag:domain=example"]:
+            self.assertTrue(
+                PipelineFilter.from_string(value).matches(self.config)
+            )
+
+        self.assertFalse(
+            PipelineFilter.from_string("tag:team=web").matches(self.config)
+        )
+
+    def test_invalid_selector(self) -> None:
+        with self.assertRaises(ValueError):
+            PipelineFilter.from_string("owner:someone")
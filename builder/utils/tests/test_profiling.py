@@ -0,0 +1,81 @@
+import unittest
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from builder.model.resource.s3_bucket import S3BucketResource
+from builder.utils.profiling import SynthProfiler
+
+
+def build_resource(profiler: SynthProfiler) -> type:
+    class FakeResource:
+        def add_to_cdk(self, scope: str) -> None:
+            with profiler.profile("Nested.add_to_cdk", scope):
+                [0] * 1000
+
+    FakeResource.add_to_cdk = profiler.wrap(  # type: ignore
+        FakeResource.add_to_cdk, lambda resource, scope: scope
+    )
+    return FakeResource
+
+
+class TestSynthProfiler(unittest.TestCase):
+    def test_disabled(self) -> None:
+        profiler = SynthProfiler()
+        build_resource(profiler)().add_to_cdk("stack")
+
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(profiler.entries, [])
+        self.assertEqual(profiler.summary(), "Nothing was profiled.")
+
+    def test_breakdown(self) -> None:
+        profiler = SynthProfiler(modes=["time", "tracemalloc"])
+        resource = build_resource(profiler)()
+        resource.add_to_cdk("stack-a")
+        resource.add_to_cdk("stack-a")
+        resource.add_to_cdk("stack-b")
+
+        report = profiler.to_pydict()
+        kinds = {k["kind"]: k for k in report["kinds"]}
+        groups = {g["group"]: g for g in report["groups"]}
+
+        self.assertEqual(kinds["FakeResource.add_to_cdk"]["calls"], 3)
+        self.assertEqual(kinds["Nested.add_to_cdk"]["calls"], 3)
+        self.assertEqual(groups["stack-a"]["calls"], 4)
+        self.assertEqual(groups["stack-b"]["calls"], 2)
+
+        for entry in profiler.entries:
+            self.assertLessEqual(entry.self_seconds, entry.seconds)
+
+    def test_write(self) -> None:
+        profiler = SynthProfiler(modes=["time", "cprofile"])
+        build_resource(profiler)().add_to_cdk("stack")
+
+        with TemporaryDirectory() as tmp:
+            report_path = path.join(tmp, "synth_profile.json")
+            profiler.write(report_path)
+
+            with open(report_path, "r") as f:
+                self.assertEqual(len(load(f)["entries"]), 2)
+            self.assertTrue(path.isfile(path.join(tmp, "synth_profile.prof")))
+
+        self.assertIn("FakeResource.add_to_cdk", profiler.summary())
+
+    def test_from_environ(self) -> None:
+        with patch.dict("os.environ", {"BUILDER_PROFILE": "1"}):
+            self.assertEqual(SynthProfiler.from_environ().modes, ["time"])
+
+        with patch.dict("os.environ", {"BUILDER_PROFILE": "tracemalloc"}):
+            self.assertEqual(
+                SynthProfiler.from_environ().modes, ["time", "tracemalloc"]
+            )
+
+        with patch.dict("os.environ", {"BUILDER_PROFILE": "0"}):
+            self.assertFalse(SynthProfiler.from_environ().enabled)
+
+        with self.assertRaises(ValueError):
+            SynthProfiler(modes=["memray"])
+
+    def test_resources_are_wrapped(self) -> None:
+        self.assertTrue(hasattr(S3BucketResource.add_to_cdk, "__wrapped__"))
@@ -0,0 +1,61 @@
+import unittest
+from os import (
+    makedirs,
+    path,
+)
+from tempfile import TemporaryDirectory
+
+from builder.utils.prune import (
+    Pruner,
+    folder_size,
+)
+
+
+class TestPruner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+
+        self.__write("pandas/__init__.py", "x = 1\n")
+        self.__write("pandas/tests/test_frame.py", "x = 1\n")
+        self.__write("pandas/io/__pycache__/api.cpython-39.pyc", "pyc")
+        self.__write("pandas/_libs/src/parser.h", "header")
+        self.__write("pandas-2.0.0.dist-info/METADATA", "metadata")
+        self.__write("pandas-2.0.0.dist-info/RECORD", "record")
+        self.__write("boto3/__init__.py", "x = 1\n")
+        self.__write("boto3-1.26.0.dist-info/METADATA", "metadata")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __write(self, relative_path: str, content: str) -> None:
+        file_path = path.join(self.root, relative_path)
+        makedirs(path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+
+    def __exists(self, relative_path: str) -> bool:
+        return path.exists(path.join(self.root, relative_path))
+
+    def test_default_excludes(self) -> None:
+        before, after = Pruner(strip=False).prune(self.root)
+
+        self.assertTrue(self.__exists("pandas/__init__.py"))
+        self.assertTrue(self.__exists("pandas-2.0.0.dist-info/METADATA"))
+        self.assertFalse(self.__exists("pandas/tests"))
+        self.assertFalse(self.__exists("pandas/io/__pycache__"))
+        self.assertFalse(self.__exists("pandas/_libs/src/parser.h"))
+        self.assertFalse(self.__exists("pandas-2.0.0.dist-info/RECORD"))
+        self.assertTrue(self.__exists("boto3/__init__.py"))
+        self.assertGreater(before, after)
+        self.assertEqual(after, folder_size(self.root))
+
+    def test_package_excludes(self) -> None:
+        Pruner(excludes=["pandas/io"], packages=["boto3"], strip=False).prune(
+            self.root
+        )
+
+        self.assertFalse(self.__exists("pandas/io"))
+        self.assertFalse(self.__exists("boto3"))
+        self.assertFalse(self.__exists("boto3-1.26.0.dist-info"))
+        self.assertTrue(self.__exists("pandas/tests"))
@@ -0,0 +1,71 @@
+import unittest
+
+from builder.utils.stack_sharding import (
+    DEFAULT_MAX_RESOURCES,
+    StackSharding,
+)
+
+
+class TestStackSharding(unittest.TestCase):
+    def setUp(self) -> None:
+        self.domains = ["sales", "finance", "marketing", "hr"]
+        self.counts = {"sales": 4, "finance": 4, "marketing": 7, "hr": 2}
+
+    def test_from_string(self) -> None:
+        self.assertFalse(StackSharding.from_string("").enabled)
+        self.assertEqual(StackSharding.from_string("domain").mode, "domain")
+
+        sharding = StackSharding.from_string("budget")
+        self.assertEqual(sharding.max_resources, DEFAULT_MAX_RESOURCES)
+        self.assertEqual(
+            StackSharding.from_string("budget:250").max_resources, 250
+        )
+
+        for value in ["region", "domain:10", "budget:many", "budget:0"]:
+            with self.assertRaises(ValueError):
+                StackSharding.from_string(value)
+
+    def test_no_sharding(self) -> None:
+        shards = StackSharding().shards(self.domains, self.counts.get)  # type: ignore
+
+        self.assertEqual(shards, [("", self.domains)])
+
+    def test_domain(self) -> None:
+        shards = StackSharding(mode="domain").shards(
+            self.domains, self.counts.get  # type: ignore
+        )
+
+        self.assertEqual(
+            shards,
+            [
+                ("sales", ["sales"]),
+                ("finance", ["finance"]),
+                ("marketing", ["marketing"]),
+                ("hr", ["hr"]),
+            ],
+        )
+
+    def test_budget(self) -> None:
+        sharding = StackSharding(mode="budget", max_resources=8)
+        shards = sharding.shards(self.domains, self.counts.get)  # type: ignore
+
+        self.assertEqual(
+            shards,
+            [("1", ["sales", "finance"]), ("2", ["marketing"]), ("3", ["hr"])],
+        )
+
+        # appending a domain leaves the existing shards untouched
+        self.counts["legal"] = 1
+        self.assertEqual(
+            sharding.shards(self.domains + ["legal"], self.counts.get)[:2],  # type: ignore
+            shards[:2],
+        )
+
+    def test_budget_oversized_domain(self) -> None:
+        sharding = StackSharding(mode="budget", max_resources=5)
+        shards = sharding.shards(self.domains, self.counts.get)  # type: ignore
+
+        self.assertEqual(
+            [domains for _, domains in shards],
+            [["sales"], ["finance"], ["marketing"], ["hr"]],
+        )
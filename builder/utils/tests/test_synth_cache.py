@@ -0,0 +1,150 @@
+import unittest
+from json import load
+from os import (
+    makedirs,
+    path,
+)
+from tempfile import TemporaryDirectory
+from typing import Tuple
+from unittest.mock import patch
+
+from aws_cdk import (
+    App,
+    Stack,
+)
+from aws_cdk import aws_lambda as lambda_
+from aws_cdk import aws_sns as sns_
+
+from builder.utils.synth_cache import (
+    FINGERPRINT_METADATA,
+    SynthCache,
+)
+
+
+class TestSynthCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.root = self.tmp.name
+        self.pipeline = path.join(self.root, "pipelines", "example")
+        self.code = path.join(self.pipeline, "code", "src")
+        makedirs(self.code)
+        makedirs(path.join(self.root, "shared"))
+
+        with open(path.join(self.code, "index.py"), "w") as f:
+            f.write("x = 1\n")
+
+        self.cache = SynthCache(
+            root_path=self.root,
+            cache_path=path.join(self.root, ".builder_cache", "synth"),
+            outdir=path.join(self.root, "cdk.out"),
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def __app(self, outdir: str) -> Tuple[App, Stack, Stack]:
+        app = App(outdir=outdir)
+        shared = Stack(app, "shared-stack")
+        sns_.Topic(shared, "topic")
+        pipeline = Stack(app, "pipeline-stack")
+        return app, shared, pipeline
+
+    def __read(self, outdir: str, name: str) -> dict:
+        with open(path.join(outdir, name), "r") as f:
+            return load(f)
+
+    def test_fingerprint(self) -> None:
+        before = self.cache.fingerprint(self.pipeline, {"env": "dev"})
+
+        self.assertNotEqual(
+            before, self.cache.fingerprint(self.pipeline, {"env": "prd"})
+        )
+
+        with open(path.join(self.code, "index.py"), "w") as f:
+            f.write("x = 2\n")
+
+        self.assertNotEqual(
+            before, self.cache.fingerprint(self.pipeline, {"env": "dev"})
+        )
+
+    def test_fingerprint_ignores_builder_tests(self) -> None:
+        builder = path.join(self.root, "builder")
+        makedirs(path.join(builder, "tests"))
+        makedirs(path.join(builder, "__pycache__"))
+        sources = {
+            "module": path.join(builder, "module.py"),
+            "test": path.join(builder, "tests", "test_module.py"),
+            "bytecode": path.join(builder, "__pycache__", "module.pyc"),
+        }
+        for source in sources.values():
+            with open(source, "w") as f:
+                f.write("x = 1\n")
+
+        with patch("builder.utils.synth_cache.BUILDER_PATH", builder):
+            before = self.cache.fingerprint(self.pipeline, {})
+
+            for name in ["test", "bytecode"]:
+                with open(sources[name], "w") as f:
+                    f.write("x = 2\n")
+            self.assertEqual(before, self.cache.fingerprint(self.pipeline, {}))
+
+            with open(sources["module"], "w") as f:
+                f.write("x = 2\n")
+            self.assertNotEqual(
+                before, self.cache.fingerprint(self.pipeline, {})
+            )
+
+    def test_include_previous_synth(self) -> None:
+        fingerprint = self.cache.fingerprint(self.pipeline, {})
+
+        app, shared, pipeline = self.__app(self.cache.outdir)
+        pipeline.template_options.metadata = {FINGERPRINT_METADATA: fingerprint}
+        topic = shared.node.find_child("topic")
+        lambda_.Function(
+            pipeline,
+            "function",
+            code=lambda_.Code.from_asset(self.code),
+            handler="index.handler",
+            runtime=lambda_.Runtime.PYTHON_3_9,
+            environment={"TOPIC": topic.topic_arn},  # type: ignore
+        )
+        app.synth()
+
+        self.assertIsNone(self.cache.get("pipeline-stack", "other"))
+        snapshot = self.cache.get("pipeline-stack", fingerprint)
+        self.assertIsNotNone(snapshot)
+
+        outdir = path.join(self.root, "cdk.out.2")
+        app, shared, pipeline = self.__app(outdir)
+        self.assertTrue(
+            self.cache.include(
+                pipeline, snapshot, {"shared-stack": shared}  # type: ignore
+            )
+        )
+        app.synth()
+
+        for name in [
+            "pipeline-stack.template.json",
+            "shared-stack.template.json",
+        ]:
+            self.assertEqual(
+                self.__read(self.cache.outdir, name),
+                self.__read(outdir, name),
+            )
+
+        assets = self.__read(outdir, "pipeline-stack.assets.json")["files"]
+        self.assertEqual(len(assets), 2)
+
+    def test_include_missing_export(self) -> None:
+        fingerprint = self.cache.fingerprint(self.pipeline, {})
+
+        app, shared, pipeline = self.__app(self.cache.outdir)
+        pipeline.template_options.metadata = {FINGERPRINT_METADATA: fingerprint}
+        topic = shared.node.find_child("topic")
+        sns_.Topic(pipeline, "topic", display_name=topic.topic_name)  # type: ignore
+        app.synth()
+
+        snapshot = self.cache.get("pipeline-stack", fingerprint)
+
+        app, shared, pipeline = self.__app(path.join(self.root, "out"))
+        self.assertFalse(self.cache.include(pipeline, snapshot, {}))  # type: ignore
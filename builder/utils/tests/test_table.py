@@ -0,0 +1,10 @@
+import unittest
+
+from builder.utils.table import format_table
+
+
+class TestTable(unittest.TestCase):
+    def test_format_table(self) -> None:
+        lines = format_table(["name", "time"], [["a", "1.00s"], ["long", "2s"]])
+
+        self.assertEqual(lines, ["name  time", "a     1.00s", "long  2s"])
@@ -0,0 +1,55 @@
+import unittest
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+
+from builder.utils.telemetry import BuildTelemetry
+
+
+class TestBuildTelemetry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.telemetry = BuildTelemetry()
+
+        fast = self.telemetry.module("steps/fast", "lambda")
+        fast.cache_hit = True
+        fast.seconds = 0.1
+
+        slow = self.telemetry.module("steps/slow", "glue")
+        with slow.phase("install"):
+            pass
+        slow.seconds = 2.0
+        slow.sizes = {"before": 2048, "after": 1024}
+
+    def test_modules_sorted_by_time(self) -> None:
+        modules = self.telemetry.modules
+
+        self.assertEqual(
+            [m.module for m in modules], ["steps/slow", "steps/fast"]
+        )
+        self.assertIn("install", modules[0].phases)
+
+    def test_write(self) -> None:
+        with TemporaryDirectory() as tmp:
+            report_path = path.join(tmp, ".builder_cache", "build_report.json")
+            self.telemetry.write(report_path)
+
+            with open(report_path) as f:
+                report = load(f)
+
+        self.assertEqual(report["cache_hits"], 1)
+        self.assertEqual(report["cache_misses"], 1)
+        self.assertEqual(report["modules"][0]["sizes"]["after"], 1024)
+
+    def test_summary(self) -> None:
+        lines = self.telemetry.summary().splitlines()
+
+        self.assertTrue(lines[0].startswith("module"))
+        self.assertIn("fingerprint", lines[0].split())
+        self.assertTrue(lines[1].startswith("steps/slow"))
+        self.assertIn("2 modules, 1 cached", lines[-1])
+
+    def test_reset(self) -> None:
+        self.telemetry.reset()
+
+        self.assertEqual(self.telemetry.modules, [])
+        self.assertEqual(self.telemetry.summary(), "No modules were built.")
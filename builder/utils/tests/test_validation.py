@@ -0,0 +1,151 @@
+import unittest
+
+from builder.utils.validation import (
+    ListOf,
+    MapOf,
+    Schema,
+    Switch,
+    ValidationError,
+)
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = Schema(
+            {
+                "name": str,
+                "size?": (int, float),
+                "mode?": ["fast", "slow"],
+                "items?": ListOf(Schema({"key": str}, additional=False)),
+                "labels?": MapOf(str),
+            },
+            checks=[
+                lambda pydict: (
+                    ["size is required in slow mode"]
+                    if pydict.get("mode") == "slow" and not pydict.get("size")
+                    else []
+                )
+            ],
+        )
+
+    def test_valid(self) -> None:
+        self.schema.validate({"name": "a", "size": None, "extra": 1})
+        self.schema.validate(
+            {"name": "a", "size": 1.5, "items": [{"key": "b"}]}
+        )
+
+    def test_all_errors(self) -> None:
+        errors = self.schema.errors(
+            {
+                "size": "1",
+                "mode": "medium",
+                "items": [{"key": 1}, {"key": "b", "other": 2}],
+                "labels": {"team": 3},
+            }
+        )
+
+        self.assertEqual(
+            errors,
+            [
+                "Missing key: name",
+                "Invalid type for size: <class 'str'>, expected (<class 'int'>, <class 'float'>)",
+                "Invalid value for mode: 'medium', expected one of ['fast', 'slow']",
+                "Invalid type for items[0].key: <class 'int'>, expected <class 'str'>",
+                "Unknown key: items[1].other, expected one of ['key']",
+                "Invalid type for labels.team: <class 'int'>, expected <class 'str'>",
+            ],
+        )
+
+    def test_booleans_are_not_numbers(self) -> None:
+        schema = Schema(
+            {
+                "timeout?": int,
+                "size?": (int, float),
+                "optimize?": [0, 1, 2],
+                "enabled?": bool,
+                "flag?": [True, "auto"],
+            }
+        )
+
+        self.assertEqual(
+            schema.errors(
+                {"timeout": True, "size": False, "optimize": True, "flag": 1}
+            ),
+            [
+                "Invalid type for timeout: <class 'bool'>, expected <class 'int'>",
+                "Invalid type for size: <class 'bool'>, expected (<class 'int'>, <class 'float'>)",
+                "Invalid value for optimize: True, expected one of [0, 1, 2]",
+                "Invalid value for flag: 1, expected one of [True, 'auto']",
+            ],
+        )
+        self.assertEqual(
+            schema.errors(
+                {"timeout": 1, "optimize": 1, "enabled": True, "flag": True}
+            ),
+            [],
+        )
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValidationError) as context:
+            self.schema.validate({"name": "a", "mode": "slow"})
+
+        self.assertEqual(
+            context.exception.errors, ["size is required in slow mode"]
+        )
+        self.assertIsInstance(context.exception, TypeError)
+        self.assertIsInstance(context.exception, ValueError)
+
+    def test_switch(self) -> None:
+        schema = Schema(
+            {
+                "step": Switch(
+                    key="type",
+                    cases={
+                        "a": Schema({"type": ["a"], "value": int}),
+                        "b": Schema({"type": ["b"]}),
+                    },
+                )
+            }
+        )
+
+        self.assertEqual(schema.errors({"step": {"type": "b"}}), [])
+        self.assertEqual(
+            schema.errors({"step": {"type": "a"}}),
+            ["Missing key: step.value"],
+        )
+        self.assertEqual(
+            schema.errors({"step": {"type": "c"}}),
+            ["Invalid value for step.type: 'c', expected one of ['a', 'b']"],
+        )
+
+    def test_without_and_extend(self) -> None:
+        schema = self.schema.without("name").extend({"other": bool})
+
+        self.assertEqual(
+            schema.errors({"other": 1}),
+            ["Invalid type for other: <class 'int'>, expected <class 'bool'>"],
+        )
+
+    def test_json_schema(self) -> None:
+        json_schema = Schema(
+            {"name": str, "role": object, **self.schema.without("name").fields}
+        ).to_json_schema()
+
+        self.assertEqual(json_schema["required"], ["name"])
+        self.assertNotIn("role", json_schema["properties"])
+        self.assertEqual(
+            json_schema["properties"]["size"],
+            {"type": ["integer", "number", "null"]},
+        )
+        self.assertEqual(
+            json_schema["properties"]["mode"],
+            {"enum": ["fast", "slow", None]},
+        )
+        self.assertEqual(
+            json_schema["properties"]["items"]["items"]["additionalProperties"],
+            False,
+        )
+        self.assertEqual(
+            json_schema["properties"]["labels"]["additionalProperties"],
+            {"type": "string"},
+        )
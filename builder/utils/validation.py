@@ -1,14 +1,281 @@
-def type_validation(pydict_map: dict, pydict: dict) -> None:
-    for key, value in pydict_map.items():
-        if key.endswith("?"):
-            if key[:-1] in pydict:
-                if pydict[key[:-1]] is not None:
-                    if not isinstance(pydict[key[:-1]], value):
-                        raise TypeError(
-                            f"Invalid type for {key[:-1]}: {type(pydict[key[:-1]])}, expected {value}"
-                        )
-        else:
-            if not isinstance(pydict[key], value):
-                raise TypeError(
-                    f"Invalid type for {key}: {type(pydict[key])}, expected {value}"
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+Validator = Callable[[Any, str, List[str]], None]
+Check = Callable[[dict], List[str]]
+
+JSON_TYPES = {
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    dict: "object",
+    list: "array",
+}
+
+
+class ValidationError(TypeError, ValueError):
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+@dataclass
+class ListOf:
+    items: Any
+
+
+@dataclass
+class MapOf:
+    values: Any
+
+
+@dataclass
+class Switch:
+    key: str
+    cases: Dict[str, "Schema"]
+
+
+@dataclass
+class Schema:
+    fields: Dict[str, Any]
+    checks: List[Check] = field(default_factory=list)
+    additional: bool = True
+
+    def __post_init__(self) -> None:
+        # specs are compiled once, "key?" marks an optional key
+        self.__validators: List[Tuple[str, bool, Validator]] = [
+            (key.rstrip("?"), not key.endswith("?"), compile_spec(spec))
+            for key, spec in self.fields.items()
+        ]
+        self.__keys = {key for key, _, _ in self.__validators}
+
+    def without(self, *keys: str) -> "Schema":
+        return Schema(
+            fields={
+                k: v
+                for k, v in self.fields.items()
+                if k.rstrip("?") not in keys
+            },
+            checks=self.checks,
+            additional=self.additional,
+        )
+
+    def extend(self, fields: Dict[str, Any]) -> "Schema":
+        return Schema(
+            fields={**self.fields, **fields},
+            checks=self.checks,
+            additional=self.additional,
+        )
+
+    def collect(self, pydict: Any, prefix: str, errors: List[str]) -> None:
+        if not isinstance(pydict, dict):
+            errors.append(
+                f"Invalid type for {prefix or 'config'}: {type(pydict)}, expected {dict}"
+            )
+            return
+
+        start = len(errors)
+        for key, required, validator in self.__validators:
+            if key not in pydict:
+                if required:
+                    errors.append(f"Missing key: {prefix}{key}")
+                continue
+
+            if pydict[key] is None and not required:
+                continue
+
+            validator(pydict[key], f"{prefix}{key}", errors)
+
+        if not self.additional:
+            for key in pydict:
+                if key not in self.__keys:
+                    errors.append(
+                        f"Unknown key: {prefix}{key}, expected one of {sorted(self.__keys)}"
+                    )
+
+        # cross field checks only run on well formed values
+        if len(errors) == start:
+            for check in self.checks:
+                errors.extend(check(pydict))
+
+    def errors(self, pydict: Any) -> List[str]:
+        errors: List[str] = []
+        self.collect(pydict, "", errors)
+        return errors
+
+    def validate(self, pydict: Any) -> None:
+        errors = self.errors(pydict)
+        if errors:
+            raise ValidationError(errors)
+
+    def to_json_schema(self) -> Dict[str, Any]:
+        properties: Dict[str, Any] = {}
+        required: List[str] = []
+        for key, spec in self.fields.items():
+            json_schema = spec_to_json_schema(spec)
+            # types that only exist in python are set by the builder
+            if json_schema is None:
+                continue
+
+            if key.endswith("?"):
+                json_schema = nullable(json_schema)
+            else:
+                required.append(key)
+            properties[key.rstrip("?")] = json_schema
+
+        json_schema = {
+            "type": "object",
+            "properties": properties,
+            "additionalProperties": self.additional,
+        }
+        if required:
+            json_schema["required"] = required
+
+        return json_schema
+
+
+def compile_spec(spec: Any) -> Validator:
+    if isinstance(spec, Schema):
+
+        def validate_schema(value: Any, key: str, errors: List[str]) -> None:
+            spec.collect(value, f"{key}.", errors)
+
+        return validate_schema
+
+    if isinstance(spec, Switch):
+        cases = {
+            case: compile_spec(schema) for case, schema in spec.cases.items()
+        }
+
+        def validate_switch(value: Any, key: str, errors: List[str]) -> None:
+            if not isinstance(value, dict):
+                errors.append(
+                    f"Invalid type for {key}: {type(value)}, expected {dict}"
                 )
+            elif value.get(spec.key) not in cases:
+                errors.append(
+                    f"Invalid value for {key}.{spec.key}: {value.get(spec.key)!r}, expected one of {list(cases)}"
+                )
+            else:
+                cases[value[spec.key]](value, key, errors)
+
+        return validate_switch
+
+    if isinstance(spec, ListOf):
+        validate_item = compile_spec(spec.items)
+
+        def validate_list(value: Any, key: str, errors: List[str]) -> None:
+            if not isinstance(value, list):
+                errors.append(
+                    f"Invalid type for {key}: {type(value)}, expected {list}"
+                )
+                return
+
+            for i, item in enumerate(value):
+                validate_item(item, f"{key}[{i}]", errors)
+
+        return validate_list
+
+    if isinstance(spec, MapOf):
+        validate_value = compile_spec(spec.values)
+
+        def validate_map(value: Any, key: str, errors: List[str]) -> None:
+            if not isinstance(value, dict):
+                errors.append(
+                    f"Invalid type for {key}: {type(value)}, expected {dict}"
+                )
+                return
+
+            for item_key, item in value.items():
+                validate_value(item, f"{key}.{item_key}", errors)
+
+        return validate_map
+
+    if isinstance(spec, list):
+
+        def validate_enum(value: Any, key: str, errors: List[str]) -> None:
+            # True == 1, so booleans only match boolean values
+            if not any(
+                value == item
+                and isinstance(value, bool) == isinstance(item, bool)
+                for item in spec
+            ):
+                errors.append(
+                    f"Invalid value for {key}: {value!r}, expected one of {spec}"
+                )
+
+        return validate_enum
+
+    types = spec if isinstance(spec, tuple) else (spec,)
+    strict = bool not in types and any(t in [int, float] for t in types)
+
+    def validate_type(value: Any, key: str, errors: List[str]) -> None:
+        # bool is a subclass of int, but not a number in json schema
+        if not isinstance(value, spec) or (strict and isinstance(value, bool)):
+            errors.append(
+                f"Invalid type for {key}: {type(value)}, expected {spec}"
+            )
+
+    return validate_type
+
+
+def spec_to_json_schema(spec: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(spec, Schema):
+        return spec.to_json_schema()
+
+    if isinstance(spec, Switch):
+        return {
+            "type": "object",
+            "required": [spec.key],
+            "properties": {spec.key: {"enum": list(spec.cases)}},
+            "allOf": [
+                {
+                    "if": {"properties": {spec.key: {"const": case}}},
+                    "then": schema.to_json_schema(),
+                }
+                for case, schema in spec.cases.items()
+            ],
+        }
+
+    if isinstance(spec, ListOf):
+        return {"type": "array", "items": spec_to_json_schema(spec.items) or {}}
+
+    if isinstance(spec, MapOf):
+        return {
+            "type": "object",
+            "additionalProperties": spec_to_json_schema(spec.values) or {},
+        }
+
+    if isinstance(spec, list):
+        return {"enum": spec}
+
+    types = spec if isinstance(spec, tuple) else (spec,)
+    if not all(t in JSON_TYPES for t in types):
+        return None
+
+    json_types: List[str] = [JSON_TYPES[t] for t in types]
+    return {"type": json_types[0] if len(json_types) == 1 else json_types}
+
+
+def nullable(json_schema: Dict[str, Any]) -> Dict[str, Any]:
+    if "enum" in json_schema:
+        return {**json_schema, "enum": json_schema["enum"] + [None]}
+
+    json_type: Union[str, List[str], None] = json_schema.get("type")
+    if json_type is None:
+        return json_schema
+
+    json_types = [json_type] if isinstance(json_type, str) else json_type
+    return {**json_schema, "type": json_types + ["null"]}